@@ -8,6 +8,7 @@ This package provides modules for:
 
 Main modules:
 - exif_extractor: Extract date/time information from EXIF metadata
+- exif_cache: Persistent cache of extracted EXIF dates
 - file_organizer: Organize files into date-based directory structures
 - photos_sorter: Main application with CLI interface
 """
@@ -16,22 +17,40 @@ __version__ = "1.0.0"
 __author__ = "PhotosSorter Team"
 __description__ = "Organize photos by date based on EXIF metadata"
 
-try:
-    from .exif_extractor import ExifExtractor
-    from .file_organizer import FileOrganizer
-    from .photos_sorter import PhotosSorter
-    from .video_processor import VideoProcessor
-    from .mpg_thm_merger import MpgThmMerger
-except ImportError:
-    from exif_extractor import ExifExtractor
-    from file_organizer import FileOrganizer
-    from photos_sorter import PhotosSorter
-    from video_processor import VideoProcessor
-    from mpg_thm_merger import MpgThmMerger
+import importlib
+
+# Public names and the submodules that define them. Submodules are imported
+# on first attribute access so that e.g. sorting photos does not pay for
+# loading the video and ffmpeg helpers.
+_LAZY_IMPORTS = {
+    'ExifExtractor': '.exif_extractor',
+    'CachedExifExtractor': '.exif_cache',
+    'FileOrganizer': '.file_organizer',
+    'PhotosSorter': '.photos_sorter',
+    'VideoProcessor': '.video_processor',
+    'MpgThmMerger': '.mpg_thm_merger',
+}
+
+
+def __getattr__(name):
+    """Import public classes from their submodules on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     'ExifExtractor',
-    'FileOrganizer', 
+    'CachedExifExtractor',
+    'FileOrganizer',
     'PhotosSorter',
     'VideoProcessor',
     'MpgThmMerger'
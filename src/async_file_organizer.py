@@ -8,27 +8,84 @@ concurrent processing to maximize throughput while maintaining thread safety.
 """
 
 import asyncio
+import errno
 import logging
+import os
+import re
+import sys
 import aiofiles
 import aiofiles.os
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, AsyncGenerator, Any
+from typing import Callable, Dict, List, Optional, Tuple, AsyncGenerator, Any
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import lru_cache, partial
 import time
 
+# uvloop is an optional, faster event loop (not available on Windows)
 try:
-    from .exif_extractor import ExifExtractor
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    from .exif_extractor import ExifExtractor, _extract_dates_in_worker
+    from .exif_cache import CachedExifExtractor, resolve_cache_path
     from .utils.statistics import StatisticsCollector
-    from .utils.exceptions import PhotoSorterError, PhotoSorterFileNotFoundError
+    from .utils.exceptions import CacheError, PhotoSorterError, PhotoSorterFileNotFoundError
     from .utils.interfaces import LoggerMixin, ConfigurableMixin
+    from .utils.file_copy import copy_file_fast
+    from .utils.file_scanner import walk_files
 except ImportError:
-    from exif_extractor import ExifExtractor
+    from exif_extractor import ExifExtractor, _extract_dates_in_worker
+    from exif_cache import CachedExifExtractor, resolve_cache_path
     from utils.statistics import StatisticsCollector
-    from utils.exceptions import PhotoSorterError, PhotoSorterFileNotFoundError
+    from utils.exceptions import CacheError, PhotoSorterError, PhotoSorterFileNotFoundError
     from utils.interfaces import LoggerMixin, ConfigurableMixin
+    from utils.file_copy import copy_file_fast
+    from utils.file_scanner import walk_files
+
+# Directory names that look like output of a previous run:
+# 2024, 2024-01, 2024-01-15, 01 (month) and 01-15 (month-day)
+_ORGANIZED_DIR_RE = re.compile(r'^(?:\d{4}(?:-\d{2}(?:-\d{2})?)?|\d{2}(?:-\d{2})?)$')
+
+
+@lru_cache(maxsize=4096)
+def _is_organized_name(dir_name: str) -> bool:
+    """Return True if a directory name matches an organized date layout."""
+    return _ORGANIZED_DIR_RE.match(dir_name) is not None
+
+
+# Target directory builders for each supported date_format
+_DATE_DIR_FORMATTERS: Dict[str, Callable[[datetime, Path], Path]] = {
+    'YYYY/MM/DD': lambda d, base: base / f"{d.year:04d}" / f"{d.month:02d}" / f"{d.day:02d}",
+    'YYYY/MM': lambda d, base: base / f"{d.year:04d}" / f"{d.month:02d}",
+    'YYYY-MM-DD': lambda d, base: base / f"{d.year:04d}-{d.month:02d}-{d.day:02d}",
+    'YYYY-MM': lambda d, base: base / f"{d.year:04d}-{d.month:02d}",
+}
+
+# Errors worth retrying; anything else (missing source, permissions, ...) fails at once
+_TRANSIENT_ERRNOS = frozenset({errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.ENOSPC, errno.ETIMEDOUT})
+# Delay before each retry, in seconds; the last value repeats for further attempts
+_RETRY_BACKOFFS = (0.1, 0.2, 0.4)
+
+def _list_names(directory: Path) -> set:
+    """
+    List the entry names of a directory, treating a missing directory as empty.
+
+    Args:
+        directory (Path): Directory to list
+
+    Returns:
+        set: Names of the directory entries
+    """
+    try:
+        return set(os.listdir(directory))
+    except FileNotFoundError:
+        return set()
 
 
 @dataclass
@@ -83,13 +140,14 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         
         # Async components
         self._io_semaphore = asyncio.Semaphore(max_concurrent_io)
-        self._task_queue = asyncio.Queue()
-        self._result_queue = asyncio.Queue()
-        self._workers = []
+        self._worker_semaphore = asyncio.Semaphore(max_workers)
+        self._active_tasks = 0
+        self._pending_tasks: set = set()
         self._is_processing = False
         self._cancel_event = asyncio.Event()
+        self._created_dirs: Dict[Path, asyncio.Future] = {}
         
-        # Thread pool for CPU-bound operations
+        # Thread pool for blocking I/O
         self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         
         # Components
@@ -99,6 +157,7 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         # Performance tracking
         self._processed_files = 0
         self._total_bytes = 0
+        self._failed_results: List[ProcessingResult] = []
         self._start_time = None
         
         # Configuration shortcuts
@@ -106,6 +165,37 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         self.move_files = self.get_config_value('processing.move_files', False)
         self.batch_size = self.get_config_value('performance.batch_size', 100)
         self.retry_attempts = self.get_config_value('performance.retry_attempts', 3)
+        self.jobs = self.get_config_value('performance.jobs', None) or min(os.cpu_count() or 1, 8)
+        self.duplicate_handling = self.get_config_value('processing.duplicate_handling', 'rename')
+        self.no_date_folder = self.get_config_value('fallback.no_date_folder', 'Unknown_Date')
+        self.supported_extensions = frozenset(
+            ext.lower() for ext in self.get_config_value('supported_extensions', [])
+        )
+        
+        # Resolve the date layout once; unknown formats fall back to YYYY/MM/DD
+        self.date_format = self.get_config_value('date_format', 'YYYY/MM/DD')
+        self._date_formatter = _DATE_DIR_FORMATTERS.get(self.date_format, _DATE_DIR_FORMATTERS['YYYY/MM/DD'])
+        self._date_dir_cache: Dict[Tuple, Path] = {}
+        self._dir_names: Dict[Path, set] = {}
+        
+        # EXIF parsing is CPU-bound and holds the GIL, so it gets its own
+        # process pool; worker processes are only started on first use
+        self._exif_pool = (
+            concurrent.futures.ProcessPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        )
+        
+        # Persistent date cache so re-runs skip unchanged files
+        self.exif_cache: Optional[CachedExifExtractor] = None
+        if self.get_config_value('performance.exif_cache', True):
+            cache_file = resolve_cache_path(self.get_config_value('performance.exif_cache_file', 'exif_cache.db'))
+            try:
+                # Dry runs use existing entries but leave the cache untouched
+                self.exif_cache = CachedExifExtractor(
+                    cache_file, extractor=self.exif_extractor, stats_collector=self.stats_collector,
+                    read_only=self.dry_run
+                )
+            except CacheError as e:
+                self.logger.warning(f"EXIF cache disabled: {e}")
         
     async def organize_photos_async(self, source_dir: str, target_dir: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -120,7 +210,12 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         """
         self.logger.info(f"Starting async photo organization: {source_dir}")
         self._start_time = time.time()
+        self._created_dirs.clear()
+        self._failed_results.clear()
+        self._date_dir_cache.clear()
+        self._dir_names.clear()
         self.stats_collector.start_session()
+        tasks = None
         
         try:
             # Validate paths
@@ -137,40 +232,61 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
             
             self.logger.info(f"Found {total_files} files to process")
             
-            # Start processing workers
-            await self._start_workers()
+            self._is_processing = True
+            self._cancel_event.clear()
+            tasks = self._generate_tasks_async(file_paths, target_path)
             
-            # Generate processing tasks
-            task_generator = self._generate_tasks_async(file_paths, target_path)
+            if self.dry_run:
+                # Nothing is touched on disk, so skip the worker machinery entirely
+                async for task in tasks:
+                    self.logger.debug(f"[DRY RUN] {task.operation}: {task.source_path} -> {task.target_path}")
+                    self.stats_collector.increment('processed')
+                    self.stats_collector.increment('moved' if task.operation == 'move' else 'copied')
+                    self._processed_files += 1
+                return self._get_final_stats()
             
-            # Process files in batches
-            batch_count = 0
-            async for batch in self._batch_generator(task_generator, self.batch_size):
+            # Start each task as soon as it is generated; the worker semaphore
+            # bounds concurrency and max_pending bounds memory
+            pending = self._pending_tasks
+            max_pending = self.max_workers * 4
+            task_count = 0
+            async for task in tasks:
                 if self._cancel_event.is_set():
                     break
-                    
-                batch_count += 1
-                self.logger.debug(f"Processing batch {batch_count}")
                 
-                # Queue tasks for processing
-                for task in batch:
-                    await self._task_queue.put(task)
+                task_count += 1
+                running = asyncio.ensure_future(self._run_task_async(task, f"task-{task_count}"))
+                pending.add(running)
+                running.add_done_callback(pending.discard)
                 
-                # Wait for batch completion with timeout
-                await self._wait_for_batch_completion(len(batch))
+                if len(pending) >= max_pending:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
             
-            # Signal completion and wait for workers to finish
-            await self._stop_workers()
+            # Tasks cancelled by cancel_processing() simply end here
+            if pending:
+                await asyncio.wait(pending)
+            
+            if self._cancel_event.is_set():
+                self.logger.info("Processing cancelled")
             
             # Final statistics
             return self._get_final_stats()
             
         except Exception as e:
             self.logger.error(f"Error during async organization: {e}")
-            await self._cleanup()
             raise PhotoSorterError(f"Async organization failed: {e}")
         
         finally:
+            for running in self._pending_tasks:
+                running.cancel()
+            if self._pending_tasks:
+                await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+            # Closing the generator waits for its date prefetch, so nothing
+            # touches the pools or the cache once they are shut down
+            if tasks is not None:
+                await tasks.aclose()
+            await self._cleanup()
+            self._is_processing = False
             self.stats_collector.end_session()
     
     async def _validate_paths(self, source_dir: str, target_dir: Optional[str]) -> Tuple[Path, Path]:
@@ -186,17 +302,18 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         """
         source_path = Path(source_dir)
         
-        if not await aiofiles.os.path.exists(source_path):
+        # One-off checks; a direct stat is cheaper than an executor round trip
+        if not source_path.exists():
             raise PhotoSorterFileNotFoundError(f"Source directory does not exist: {source_path}")
         
-        if not await aiofiles.os.path.isdir(source_path):
+        if not source_path.is_dir():
             raise PhotoSorterError(f"Source path is not a directory: {source_path}")
         
         # Determine target path
         if target_dir:
             target_path = Path(target_dir)
             # Create target directory if it doesn't exist
-            await aiofiles.os.makedirs(target_path, exist_ok=True)
+            target_path.mkdir(parents=True, exist_ok=True)
         else:
             target_path = source_path
         
@@ -212,31 +329,38 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         Returns:
             List[Path]: List of discovered file paths
         """
-        supported_extensions = set(
-            ext.lower() for ext in self.get_config_value('supported_extensions', [])
+        # A directory walk is a sequence of blocking syscalls; run all of it in
+        # one executor call instead of awaiting a thread hop per entry
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(
+            self._thread_pool, self._walk_sync, directory, self.supported_extensions
         )
         
-        files = []
+        # Sort files for consistent processing order; comparing the path strings
+        # is much cheaper than Path's part-by-part comparison
+        files.sort(key=os.fspath)
+        return files
+    
+    def _walk_sync(self, directory: Path, extensions: frozenset) -> List[Path]:
+        """
+        Synchronously walk a directory tree collecting supported files.
         
-        async def scan_directory(dir_path: Path):
-            """Recursively scan directory for supported files."""
-            try:
-                async for entry in aiofiles.os.scandir(dir_path):
-                    if await aiofiles.os.path.isfile(entry.path):
-                        file_path = Path(entry.path)
-                        if file_path.suffix.lower() in supported_extensions:
-                            files.append(file_path)
-                    elif await aiofiles.os.path.isdir(entry.path):
-                        # Skip organized directories to avoid re-processing
-                        if not self._is_organized_directory(Path(entry.path)):
-                            await scan_directory(Path(entry.path))
-            except Exception as e:
-                self.logger.warning(f"Error scanning directory {dir_path}: {e}")
+        Args:
+            directory (Path): Directory to scan
+            extensions (frozenset): Lower-case file extensions to collect
+            
+        Returns:
+            List[Path]: List of discovered file paths
+        """
+        files = []
+        # A tuple lets str.endswith test all suffixes in one C-level call
+        suffixes = tuple(extensions)
         
-        await scan_directory(directory)
+        # Skip organized directories to avoid re-processing
+        for entry in walk_files(directory, skip_dir=lambda d: _is_organized_name(d.name)):
+            if entry.name.lower().endswith(suffixes):
+                files.append(Path(entry.path))
         
-        # Sort files for consistent processing order
-        files.sort()
         return files
     
     def _is_organized_directory(self, directory: Path) -> bool:
@@ -249,28 +373,17 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         Returns:
             bool: True if directory appears organized
         """
-        dir_name = directory.name
-        
-        # Check if directory name matches date formats
-        date_patterns = [
-            r'^\d{4}$',           # Year: 2024
-            r'^\d{4}-\d{2}$',     # Year-Month: 2024-01
-            r'^\d{4}-\d{2}-\d{2}$',  # Year-Month-Day: 2024-01-15
-            r'^\d{2}$',           # Month: 01
-            r'^\d{2}-\d{2}$',     # Month-Day: 01-15
-        ]
-        
-        import re
-        for pattern in date_patterns:
-            if re.match(pattern, dir_name):
-                return True
-        
-        return False
+        return _is_organized_name(directory.name)
     
     async def _generate_tasks_async(self, file_paths: List[Path], target_base: Path) -> AsyncGenerator[FileTask, None]:
         """
         Asynchronously generate processing tasks for files.
         
+        Dates are extracted for batch_size files per executor call so the
+        event loop is not woken once per file. The next batch is extracted
+        while tasks for the current one are handed out and processed, so EXIF
+        reads overlap with file copies.
+        
         Args:
             file_paths (List[Path]): List of file paths to process
             target_base (Path): Base target directory
@@ -278,62 +391,126 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         Yields:
             FileTask: File processing task
         """
-        for file_path in file_paths:
-            if self._cancel_event.is_set():
-                break
-            
-            try:
-                # Extract date asynchronously
-                creation_date = await self._extract_date_async(file_path)
-                
-                # Determine target path based on date
-                if creation_date:
-                    target_dir = self._get_target_directory_for_date(creation_date, target_base)
-                else:
-                    target_dir = target_base / self.get_config_value('fallback.no_date_folder', 'Unknown_Date')
-                
-                target_path = target_dir / file_path.name
-                
-                # Handle duplicates
-                target_path = await self._handle_duplicate_async(target_path)
+        operation = 'move' if self.move_files else 'copy'
+        next_dates = None
+        
+        try:
+            for start in range(0, len(file_paths), self.batch_size):
+                if self._cancel_event.is_set():
+                    break
                 
-                # Create task
-                operation = 'move' if self.move_files else 'copy'
-                task = FileTask(
-                    source_path=file_path,
-                    target_path=target_path,
-                    operation=operation,
-                    metadata={'creation_date': creation_date}
-                )
+                chunk = file_paths[start:start + self.batch_size]
+                if next_dates is None:
+                    next_dates = asyncio.ensure_future(self._extract_dates_async(chunk))
+                creation_dates = await next_dates
                 
-                yield task
+                # Start extracting the following batch before handing out this one
+                following = start + self.batch_size
+                next_dates = None
+                if following < len(file_paths):
+                    next_dates = asyncio.ensure_future(
+                        self._extract_dates_async(file_paths[following:following + self.batch_size])
+                    )
                 
-            except Exception as e:
-                self.logger.error(f"Error generating task for {file_path}: {e}")
-                self.stats_collector.increment('errors')
+                for file_path, creation_date in zip(chunk, creation_dates):
+                    if self._cancel_event.is_set():
+                        break
+                    
+                    try:
+                        # Determine target path based on date
+                        if creation_date:
+                            target_dir = self._get_target_directory_for_date(creation_date, target_base)
+                        else:
+                            target_dir = target_base / self.no_date_folder
+                        
+                        target_path = target_dir / file_path.name
+                        
+                        # Handle duplicates
+                        target_path = await self._handle_duplicate_async(target_path)
+                        
+                        yield FileTask(
+                            source_path=file_path,
+                            target_path=target_path,
+                            operation=operation,
+                            metadata={'creation_date': creation_date}
+                        )
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error generating task for {file_path}: {e}")
+                        self.stats_collector.increment('errors')
+        finally:
+            if next_dates is not None:
+                next_dates.cancel()
+                await asyncio.gather(next_dates, return_exceptions=True)
     
-    async def _extract_date_async(self, file_path: Path) -> Optional[datetime]:
+    async def _extract_dates_async(self, file_paths: List[Path]) -> List[Optional[datetime]]:
         """
-        Extract creation date from file asynchronously.
+        Extract creation dates for a batch of files.
+        
+        Dates of unchanged files are served from the persistent cache; only
+        the remaining files are parsed.
+        
+        Args:
+            file_paths (List[Path]): Files to extract dates from
+            
+        Returns:
+            List[Optional[datetime]]: Extracted dates in input order, None where unavailable
+        """
+        if self.exif_cache is None:
+            return await self._parse_dates_async(file_paths)
+        
+        loop = asyncio.get_running_loop()
+        paths = [str(file_path) for file_path in file_paths]
+        hits, misses = await loop.run_in_executor(self._thread_pool, self.exif_cache.lookup_dates, paths)
+        if not misses:
+            return [hits[index] for index in range(len(paths))]
+        
+        miss_dates = await self._parse_dates_async([file_paths[miss[0]] for miss in misses])
+        await loop.run_in_executor(self._thread_pool, self.exif_cache.store_dates, misses, miss_dates)
+        
+        for miss, date in zip(misses, miss_dates):
+            hits[miss[0]] = date
+        return [hits[index] for index in range(len(paths))]
+    
+    async def _parse_dates_async(self, file_paths: List[Path]) -> List[Optional[datetime]]:
+        """
+        Parse creation dates for a batch of files, bypassing the cache.
+        
+        With more than one job the batch is split across the EXIF process
+        pool; otherwise it runs in one thread pool call.
         
         Args:
-            file_path (Path): File to extract date from
+            file_paths (List[Path]): Files to extract dates from
             
         Returns:
-            Optional[datetime]: Extracted date or None
+            List[Optional[datetime]]: Extracted dates in input order, None where unavailable
         """
+        loop = asyncio.get_running_loop()
+        paths = [str(file_path) for file_path in file_paths]
+        
+        if self._exif_pool is not None and paths:
+            piece = -(-len(paths) // self.jobs)
+            try:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(self._exif_pool, _extract_dates_in_worker, paths[i:i + piece])
+                    for i in range(0, len(paths), piece)
+                ))
+                return [date for dates in results for date in dates]
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f"Parallel EXIF extraction failed, continuing with threads: {e}")
+                self._exif_pool.shutdown(wait=False)
+                self._exif_pool = None
+        
         # Run EXIF extraction in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
         try:
-            date = await loop.run_in_executor(
+            return await loop.run_in_executor(
                 self._thread_pool,
-                self.exif_extractor.extract_date_from_file,
-                str(file_path)
+                self.exif_extractor.extract_dates,
+                paths
             )
-            return date
         except Exception as e:
-            self.logger.debug(f"Error extracting date from {file_path}: {e}")
-            return None
+            self.logger.debug(f"Error extracting dates for batch of {len(file_paths)} files: {e}")
+            return [None] * len(file_paths)
     
     def _get_target_directory_for_date(self, date: datetime, base_dir: Path) -> Path:
         """
@@ -346,143 +523,95 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         Returns:
             Path: Target directory path
         """
-        date_format = self.get_config_value('date_format', 'YYYY/MM/DD')
-        
-        if date_format == 'YYYY/MM/DD':
-            return base_dir / f"{date.year:04d}" / f"{date.month:02d}" / f"{date.day:02d}"
-        elif date_format == 'YYYY/MM':
-            return base_dir / f"{date.year:04d}" / f"{date.month:02d}"
-        elif date_format == 'YYYY-MM-DD':
-            return base_dir / f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
-        elif date_format == 'YYYY-MM':
-            return base_dir / f"{date.year:04d}-{date.month:02d}"
-        else:
-            # Default fallback
-            return base_dir / f"{date.year:04d}" / f"{date.month:02d}" / f"{date.day:02d}"
+        # Photos from the same day share one Path object
+        key = (base_dir, date.year, date.month, date.day)
+        target_dir = self._date_dir_cache.get(key)
+        if target_dir is None:
+            target_dir = self._date_formatter(date, base_dir)
+            self._date_dir_cache[key] = target_dir
+        return target_dir
     
     async def _handle_duplicate_async(self, target_path: Path) -> Path:
         """
         Handle duplicate filenames asynchronously.
         
+        Each target directory is listed once per run; afterwards duplicates
+        are resolved against an in-memory name index to which every chosen
+        name is added, so files from the same run cannot claim the same target.
+        
         Args:
             target_path (Path): Original target path
             
         Returns:
             Path: Final target path (possibly renamed)
         """
-        if not await aiofiles.os.path.exists(target_path):
-            return target_path
+        parent = target_path.parent
+        names = self._dir_names.get(parent)
+        if names is None:
+            loop = asyncio.get_running_loop()
+            names = await loop.run_in_executor(self._thread_pool, _list_names, parent)
+            self._dir_names[parent] = names
         
-        duplicate_handling = self.get_config_value('processing.duplicate_handling', 'rename')
+        if target_path.name not in names:
+            names.add(target_path.name)
+            return target_path
         
-        if duplicate_handling == 'skip':
+        if self.duplicate_handling == 'skip':
             return target_path
-        elif duplicate_handling == 'overwrite':
+        elif self.duplicate_handling == 'overwrite':
             return target_path
-        elif duplicate_handling == 'rename':
-            # Find available filename
+        elif self.duplicate_handling == 'rename':
             base = target_path.stem
             suffix = target_path.suffix
-            parent = target_path.parent
-            counter = 1
             
-            while True:
+            for counter in range(1, 10000):
                 new_name = f"{base}_{counter:03d}{suffix}"
-                new_path = parent / new_name
-                if not await aiofiles.os.path.exists(new_path):
-                    return new_path
-                counter += 1
-                
-                # Prevent infinite loops
-                if counter > 9999:
-                    self.logger.warning(f"Too many duplicates for {target_path}")
-                    return target_path
+                if new_name not in names:
+                    names.add(new_name)
+                    return parent / new_name
+            
+            # Prevent infinite loops
+            self.logger.warning(f"Too many duplicates for {target_path}")
+            return target_path
         
         return target_path
     
-    async def _start_workers(self):
-        """Start async worker tasks."""
-        self._is_processing = True
-        self._cancel_event.clear()
-        
-        # Start worker tasks
-        for i in range(self.max_workers):
-            worker = asyncio.create_task(self._worker(f"worker-{i}"))
-            self._workers.append(worker)
-        
-        self.logger.debug(f"Started {len(self._workers)} worker tasks")
-    
-    async def _stop_workers(self):
-        """Stop async worker tasks."""
-        self._is_processing = False
-        
-        # Send stop signals
-        for _ in self._workers:
-            await self._task_queue.put(None)
-        
-        # Wait for workers to complete
-        await asyncio.gather(*self._workers, return_exceptions=True)
-        self._workers.clear()
-        
-        self.logger.debug("All workers stopped")
-    
-    async def _worker(self, worker_id: str):
+    async def _run_task_async(self, task: FileTask, worker_id: str) -> Optional[ProcessingResult]:
         """
-        Async worker for processing file tasks.
+        Process a task once a worker slot is available.
         
         Args:
-            worker_id (str): Unique worker identifier
+            task (FileTask): Task to process
+            worker_id (str): Processing worker ID
+            
+        Returns:
+            Optional[ProcessingResult]: Result of a failed task, None on success
         """
-        self.logger.debug(f"Worker {worker_id} started")
-        
-        while self._is_processing or not self._task_queue.empty():
+        async with self._worker_semaphore:
+            self._active_tasks += 1
             try:
-                # Get next task with timeout
-                task = await asyncio.wait_for(self._task_queue.get(), timeout=1.0)
-                
-                if task is None:  # Stop signal
-                    break
-                
-                # Process task
-                result = await self._process_task_async(task, worker_id)
-                await self._result_queue.put(result)
-                
-                # Mark task as done
-                self._task_queue.task_done()
-                
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                self.logger.error(f"Worker {worker_id} error: {e}")
-        
-        self.logger.debug(f"Worker {worker_id} stopped")
+                return await self._process_task_async(task, worker_id)
+            finally:
+                self._active_tasks -= 1
     
-    async def _process_task_async(self, task: FileTask, worker_id: str) -> ProcessingResult:
+    async def _process_task_async(self, task: FileTask, worker_id: str) -> Optional[ProcessingResult]:
         """
         Process a single file task asynchronously.
         
+        Successful tasks only update counters; a ProcessingResult is built and
+        kept only for failures.
+        
         Args:
             task (FileTask): Task to process
             worker_id (str): Processing worker ID
             
         Returns:
-            ProcessingResult: Result of processing
+            Optional[ProcessingResult]: Result of a failed task, None on success
         """
         start_time = time.time()
         
         try:
-            if self.dry_run:
-                # Simulate processing for dry run
-                await asyncio.sleep(0.001)
-                self.logger.debug(f"[DRY RUN] {task.operation}: {task.source_path} -> {task.target_path}")
-                success = True
-                error = None
-                bytes_processed = 0
-            else:
-                # Actual file processing
-                success, error, bytes_processed = await self._execute_file_operation(task)
-            
-            duration = time.time() - start_time
+            success, error, bytes_processed = await self._execute_file_operation(task)
             
             # Update statistics
             if success:
@@ -494,30 +623,21 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
                 
                 self._processed_files += 1
                 self._total_bytes += bytes_processed
-            else:
-                self.stats_collector.increment('errors')
-            
-            return ProcessingResult(
-                task=task,
-                success=success,
-                error=error,
-                duration=duration,
-                bytes_processed=bytes_processed
-            )
+                return None
             
         except Exception as e:
-            duration = time.time() - start_time
-            error_msg = f"Unexpected error: {e}"
-            self.logger.error(f"Task processing failed: {error_msg}")
-            self.stats_collector.increment('errors')
-            
-            return ProcessingResult(
-                task=task,
-                success=False,
-                error=error_msg,
-                duration=duration,
-                bytes_processed=0
-            )
+            error = f"Unexpected error: {e}"
+            self.logger.error(f"Task processing failed: {error}")
+        
+        self.stats_collector.increment('errors')
+        result = ProcessingResult(
+            task=task,
+            success=False,
+            error=error,
+            duration=time.time() - start_time
+        )
+        self._failed_results.append(result)
+        return result
     
     async def _execute_file_operation(self, task: FileTask) -> Tuple[bool, Optional[str], int]:
         """
@@ -533,20 +653,27 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
             try:
                 async with self._io_semaphore:  # Limit concurrent I/O
                     # Ensure target directory exists
-                    await aiofiles.os.makedirs(task.target_path.parent, exist_ok=True)
+                    await self._ensure_directory_async(task.target_path.parent)
                     
-                    # Get file size
-                    file_stat = await aiofiles.os.stat(task.source_path)
-                    file_size = file_stat.st_size
+                    # Get file size (a local stat takes microseconds, no executor needed)
+                    file_size = os.stat(task.source_path).st_size
                     
                     if task.operation == 'move':
-                        await self._move_file_async(task.source_path, task.target_path)
+                        await self._move_file_async(task.source_path, task.target_path, file_size)
                     elif task.operation == 'copy':
-                        await self._copy_file_async(task.source_path, task.target_path)
+                        await self._copy_file_async(task.source_path, task.target_path, file_size)
                     
                     return True, None, file_size
                     
-            except Exception as e:
+            except OSError as e:
+                # The directory may have been removed underneath us; recreate it on retry
+                self._created_dirs.pop(task.target_path.parent, None)
+                transient = e.errno in _TRANSIENT_ERRNOS or (
+                    e.errno == errno.ENOENT and task.source_path.exists()
+                )
+                if not transient:
+                    return False, str(e), 0
+                
                 error_msg = f"Attempt {attempt + 1}/{self.retry_attempts} failed: {e}"
                 self.logger.warning(error_msg)
                 
@@ -554,37 +681,60 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
                     return False, str(e), 0
                 
                 # Wait before retry with exponential backoff
-                await asyncio.sleep(0.1 * (2 ** attempt))
+                await asyncio.sleep(_RETRY_BACKOFFS[min(attempt, len(_RETRY_BACKOFFS) - 1)])
+            except Exception as e:
+                return False, str(e), 0
         
         return False, "Max retries exceeded", 0
     
-    async def _move_file_async(self, source: Path, target: Path):
+    async def _ensure_directory_async(self, directory: Path):
+        """
+        Create a directory (and parents) unless it was already created this run.
+        
+        Concurrent workers targeting the same directory share one makedirs call.
+        
+        Args:
+            directory (Path): Directory to create
+        """
+        creating = self._created_dirs.get(directory)
+        if creating is None:
+            creating = asyncio.ensure_future(aiofiles.os.makedirs(directory, exist_ok=True))
+            self._created_dirs[directory] = creating
+        await asyncio.shield(creating)
+    
+    async def _move_file_async(self, source: Path, target: Path, size: Optional[int] = None):
         """
         Move file asynchronously.
         
+        A rename is tried first. Across file systems that fails with EXDEV
+        every time, so the file is copied and the source removed right away
+        instead of going through the retry backoff.
+        
         Args:
             source (Path): Source file path
             target (Path): Target file path
+            size (Optional[int]): Source size if already known
         """
-        await aiofiles.os.rename(source, target)
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._thread_pool, os.replace, source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            await self._copy_file_async(source, target, size)
+            os.unlink(source)
     
-    async def _copy_file_async(self, source: Path, target: Path):
+    async def _copy_file_async(self, source: Path, target: Path, size: Optional[int] = None):
         """
-        Copy file asynchronously with streaming for large files.
+        Copy file asynchronously using kernel-side copies where available.
         
         Args:
             source (Path): Source file path
             target (Path): Target file path
+            size (Optional[int]): Source size if already known
         """
-        chunk_size = 64 * 1024  # 64KB chunks
-        
-        async with aiofiles.open(source, 'rb') as src:
-            async with aiofiles.open(target, 'wb') as dst:
-                while True:
-                    chunk = await src.read(chunk_size)
-                    if not chunk:
-                        break
-                    await dst.write(chunk)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._thread_pool, copy_file_fast, source, target, size)
         
         # Preserve file metadata
         await self._copy_metadata_async(source, target)
@@ -598,56 +748,11 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
             target (Path): Target file path
         """
         try:
-            source_stat = await aiofiles.os.stat(source)
-            await aiofiles.os.utime(target, (source_stat.st_atime, source_stat.st_mtime))
+            source_stat = os.stat(source)
+            os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
         except Exception as e:
             self.logger.debug(f"Could not copy metadata from {source} to {target}: {e}")
     
-    async def _batch_generator(self, async_generator, batch_size: int):
-        """
-        Generate batches from an async generator.
-        
-        Args:
-            async_generator: Async generator to batch
-            batch_size (int): Size of each batch
-            
-        Yields:
-            List: Batch of items
-        """
-        batch = []
-        async for item in async_generator:
-            batch.append(item)
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
-        
-        if batch:  # Yield remaining items
-            yield batch
-    
-    async def _wait_for_batch_completion(self, batch_size: int, timeout: float = 30.0):
-        """
-        Wait for a batch of tasks to complete.
-        
-        Args:
-            batch_size (int): Number of tasks in batch
-            timeout (float): Maximum time to wait
-        """
-        completed = 0
-        start_time = time.time()
-        
-        while completed < batch_size and (time.time() - start_time) < timeout:
-            try:
-                await asyncio.wait_for(self._result_queue.get(), timeout=1.0)
-                completed += 1
-                self._result_queue.task_done()
-            except asyncio.TimeoutError:
-                if self._cancel_event.is_set():
-                    break
-                continue
-        
-        if completed < batch_size:
-            self.logger.warning(f"Batch completion timeout: {completed}/{batch_size} tasks completed")
-    
     def _get_final_stats(self) -> Dict[str, Any]:
         """
         Get final processing statistics.
@@ -669,19 +774,46 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         
         return stats
     
+    def get_failed_results(self) -> List[ProcessingResult]:
+        """
+        Get results for the tasks that failed in the last run.
+        
+        Returns:
+            List[ProcessingResult]: Failed task results
+        """
+        return list(self._failed_results)
+    
     async def cancel_processing(self):
         """Cancel ongoing processing."""
         self.logger.info("Cancelling async processing...")
         self._cancel_event.set()
-        await self._cleanup()
+        
+        # Wake in-flight tasks immediately instead of letting them finish;
+        # organize_photos_async() releases the pools and cache once they end
+        for running in list(self._pending_tasks):
+            running.cancel()
     
     async def _cleanup(self):
         """Clean up resources."""
-        if self._workers:
-            await self._stop_workers()
-        
         if self._thread_pool:
-            self._thread_pool.shutdown(wait=False)
+            # Cancelled tasks may leave cache reads or writes running in this
+            # pool; let them finish before the cache is closed. Jobs that have
+            # not started yet are dropped where the executor supports it (3.9+)
+            shutdown_kwargs = {'wait': True}
+            if sys.version_info >= (3, 9):
+                shutdown_kwargs['cancel_futures'] = True
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(self._thread_pool.shutdown, **shutdown_kwargs)
+            )
+            self._thread_pool = None
+        
+        if self._exif_pool:
+            self._exif_pool.shutdown(wait=False)
+            self._exif_pool = None
+        
+        if self.exif_cache is not None:
+            self.exif_cache.close()
+            self.exif_cache = None
     
     async def get_processing_status(self) -> Dict[str, Any]:
         """
@@ -697,8 +829,7 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
             'files_processed': self._processed_files,
             'bytes_processed': self._total_bytes,
             'elapsed_time': elapsed_time,
-            'workers_active': len(self._workers),
-            'queue_size': self._task_queue.qsize(),
+            'workers_active': self._active_tasks,
             'files_per_second': self._processed_files / elapsed_time if elapsed_time > 0 else 0
         }
     
@@ -706,6 +837,9 @@ class AsyncFileOrganizer(ConfigurableMixin, LoggerMixin):
         """Cleanup when object is destroyed."""
         if hasattr(self, '_thread_pool') and self._thread_pool:
             self._thread_pool.shutdown(wait=False)
+        
+        if getattr(self, '_exif_pool', None):
+            self._exif_pool.shutdown(wait=False)
 
 
 async def main():
@@ -737,5 +871,23 @@ async def main():
         await organizer._cleanup()
 
 
+def run_async(coro):
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Any: The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    if hasattr(uvloop, 'run'):
+        return uvloop.run(coro)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+EXIF Cache Module
+
+This module provides a persistent SQLite cache for extracted EXIF dates so
+that repeated runs over the same library do not re-parse unchanged files.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .exif_extractor import ExifExtractor
+    from .utils.exceptions import CacheError
+except ImportError:
+    from exif_extractor import ExifExtractor
+    from utils.exceptions import CacheError
+
+# Directory under the user cache directory that holds relative cache paths
+CACHE_DIR_NAME = "photos_sorter"
+
+
+def resolve_cache_path(cache_file: Union[str, Path]) -> Path:
+    """
+    Resolve a configured cache file path.
+
+    Relative paths are placed in the user cache directory
+    ($XDG_CACHE_HOME/photos_sorter, by default ~/.cache/photos_sorter) rather
+    than next to the code, which may be an installed, read-only package.
+
+    Args:
+        cache_file (Union[str, Path]): Configured cache file path
+
+    Returns:
+        Path: Absolute path of the cache database
+    """
+    path = Path(cache_file).expanduser()
+    if path.is_absolute():
+        return path
+
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    base = Path(cache_home) if cache_home else Path.home() / '.cache'
+    return base / CACHE_DIR_NAME / path
+
+
+class CachedExifExtractor:
+    """
+    Wraps an ExifExtractor with an on-disk cache keyed by (path, mtime, size).
+
+    Entries are reused only while the file's modification time and size are
+    unchanged. Any other attribute access is delegated to the wrapped extractor.
+    """
+
+    def __init__(self, cache_path: Union[str, Path], extractor: Optional[ExifExtractor] = None,
+                 stats_collector=None, commit_interval: int = 100, read_only: bool = False):
+        """
+        Initialize the cached extractor.
+
+        Args:
+            cache_path (Union[str, Path]): Path to the SQLite cache database
+            extractor (Optional[ExifExtractor]): Extractor to wrap (default instance if None)
+            stats_collector: Statistics collector for cache hit/miss counters (optional)
+            commit_interval (int): Number of new entries written per transaction
+            read_only (bool): Only serve existing entries, never create or write the
+                database (used for dry runs)
+
+        Raises:
+            CacheError: If the cache database cannot be opened
+        """
+        self.logger = logging.getLogger(__name__)
+        self.extractor = extractor or ExifExtractor()
+        self.stats_collector = stats_collector
+        self.cache_path = Path(cache_path)
+        self.commit_interval = max(1, commit_interval)
+        self.read_only = read_only
+
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+
+        try:
+            if read_only and self.cache_path.exists():
+                self._connection = sqlite3.connect(
+                    f"{self.cache_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                )
+                return
+            if read_only:
+                # Nothing cached yet; an empty in-memory table keeps lookups uniform
+                self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self._connection = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS exif ("
+                "path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER, "
+                "size INTEGER, "
+                "date_taken TEXT, "
+                "payload BLOB)"
+            )
+            self._connection.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise CacheError(f"Could not open EXIF cache: {e}", file_path=str(self.cache_path))
+
+    def extract_date_from_file(self, file_path: str) -> Optional[datetime]:
+        """
+        Extract the creation date from an image file, using the cache when possible.
+
+        Args:
+            file_path (str): Path to the image file
+
+        Returns:
+            Optional[datetime]: The extracted date or None if not found
+        """
+        key = os.path.abspath(file_path)
+
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return self.extractor.extract_date_from_file(file_path)
+
+        hit, date = self._lookup(key, stat)
+        if hit:
+            return date
+
+        date = self.extractor.extract_date_from_file(file_path)
+        self._store(key, stat.st_mtime_ns, stat.st_size, date)
+        return date
+
+    def extract_dates(self, file_paths: List[str], max_workers: int = 1,
+                      chunksize: int = 64) -> List[Optional[datetime]]:
+        """
+        Extract dates for many files, sending only cache misses to the extractor.
+
+        Args:
+            file_paths (List[str]): Paths to the image files
+            max_workers (int): Number of worker processes for cache misses
+            chunksize (int): Paths sent to a worker per round trip
+
+        Returns:
+            List[Optional[datetime]]: Extracted dates in the order of file_paths
+        """
+        return list(self.iter_dates(file_paths, max_workers, chunksize))
+
+    def iter_dates(self, file_paths: List[str], max_workers: int = 1,
+                   chunksize: int = 64) -> Iterator[Optional[datetime]]:
+        """
+        Yield dates in order, serving hits from the cache and streaming misses.
+
+        Args:
+            file_paths (List[str]): Paths to the image files
+            max_workers (int): Number of worker processes for cache misses
+            chunksize (int): Paths sent to a worker per round trip
+
+        Yields:
+            Optional[datetime]: Extracted date for each path, in order
+        """
+        hits, misses = self.lookup_dates(file_paths)
+
+        miss_dates = self.extractor.iter_dates(
+            [file_path for _, file_path, _, _ in misses], max_workers, chunksize
+        )
+        pending = iter(misses)
+
+        for index in range(len(file_paths)):
+            if index in hits:
+                yield hits.pop(index)
+                continue
+
+            # Misses were collected in index order, so they line up one to one
+            miss = next(pending)
+            date = next(miss_dates)
+            self.store_dates([miss], [date])
+            yield date
+
+    def lookup_dates(self, file_paths: List[str]) -> Tuple[Dict[int, Optional[datetime]], List[tuple]]:
+        """
+        Serve as many files as possible from the cache.
+
+        Callers extract the misses themselves and hand the results back
+        through store_dates.
+
+        Args:
+            file_paths (List[str]): Paths to the image files
+
+        Returns:
+            Tuple[Dict[int, Optional[datetime]], List[tuple]]: Cached dates keyed by
+            index into file_paths, and the misses in index order as opaque
+            (index, file_path, key, stat) tuples
+        """
+        hits = {}
+        misses = []
+
+        for index, file_path in enumerate(file_paths):
+            key = os.path.abspath(file_path)
+            try:
+                stat = os.stat(key)
+            except OSError:
+                misses.append((index, file_path, key, None))
+                continue
+
+            hit, date = self._lookup(key, stat)
+            if hit:
+                hits[index] = date
+            else:
+                misses.append((index, file_path, key, stat))
+
+        return hits, misses
+
+    def store_dates(self, misses: List[tuple], dates: List[Optional[datetime]]):
+        """
+        Cache the dates extracted for misses returned by lookup_dates.
+
+        Args:
+            misses (List[tuple]): Misses as returned by lookup_dates
+            dates (List[Optional[datetime]]): Extracted dates, one per miss
+        """
+        for (_, _, key, stat), date in zip(misses, dates):
+            if stat is not None:
+                self._store(key, stat.st_mtime_ns, stat.st_size, date)
+
+    def _lookup(self, key: str, stat: os.stat_result) -> Tuple[bool, Optional[datetime]]:
+        """
+        Look up a cached date for a file whose mtime and size are unchanged.
+
+        Args:
+            key (str): Absolute file path
+            stat (os.stat_result): Current stat of the file
+
+        Returns:
+            Tuple[bool, Optional[datetime]]: (cache hit, cached date)
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT date_taken FROM exif WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (key, stat.st_mtime_ns, stat.st_size)
+            ).fetchone()
+
+        if row is None:
+            self._count('cache_misses')
+            return False, None
+
+        self._count('cache_hits')
+        return True, datetime.fromisoformat(row[0]) if row[0] else None
+
+    def _store(self, key: str, mtime_ns: int, size: int, date: Optional[datetime]):
+        """
+        Write an extraction result to the cache.
+
+        Args:
+            key (str): Absolute file path
+            mtime_ns (int): File modification time in nanoseconds
+            size (int): File size in bytes
+            date (Optional[datetime]): Extracted date
+        """
+        if self.read_only:
+            return
+
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO exif (path, mtime_ns, size, date_taken, payload) "
+                    "VALUES (?, ?, ?, ?, NULL)",
+                    (key, mtime_ns, size, date.isoformat() if date else None)
+                )
+                self._pending_writes += 1
+                if self._pending_writes >= self.commit_interval:
+                    self._connection.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not write EXIF cache entry for {key}: {e}")
+
+    def _count(self, counter: str):
+        """Increment a cache counter if a statistics collector is attached."""
+        if self.stats_collector is not None:
+            self.stats_collector.increment(counter)
+
+    def flush(self):
+        """Commit pending cache writes to disk."""
+        if self.read_only:
+            return
+
+        try:
+            with self._lock:
+                if self._pending_writes:
+                    self._connection.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not flush EXIF cache: {e}")
+
+    def clear_cache(self):
+        """Clear both the on-disk cache and the wrapped extractor's cache."""
+        if not self.read_only:
+            with self._lock:
+                self._connection.execute("DELETE FROM exif")
+                self._connection.commit()
+                self._pending_writes = 0
+        self.extractor.clear_cache()
+        self.logger.debug("Persistent EXIF cache cleared")
+
+    def close(self):
+        """Flush pending writes and close the cache database."""
+        self.flush()
+        with self._lock:
+            self._connection.close()
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped extractor."""
+        if name == 'extractor':
+            raise AttributeError(name)
+        return getattr(self.extractor, name)
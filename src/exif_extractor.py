@@ -6,42 +6,152 @@ This module provides functionality to extract date and time information
 from image files using EXIF metadata.
 """
 
+import heapq
+import io
+import itertools
 import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
-import importlib.util
 from functools import lru_cache
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
 from pathlib import Path
 
-# Check for optional dependencies
-PILLOW_AVAILABLE = importlib.util.find_spec("PIL") is not None
-EXIFREAD_AVAILABLE = importlib.util.find_spec("exifread") is not None
+if TYPE_CHECKING:
+    from PIL import Image
 
-# Conditional imports with proper typing
-if PILLOW_AVAILABLE:
+
+# Optional dependencies are imported on first use rather than at import time,
+# so that modules which never extract EXIF data do not pay for them
+@lru_cache(maxsize=None)
+def _pillow():
+    """
+    Import Pillow's Image module on first use.
+
+    Returns:
+        The PIL.Image module, or None if Pillow is not available
+    """
     try:
         from PIL import Image
-        from PIL.ExifTags import TAGS
     except ImportError:
-        Image = None
-        TAGS = None
-        PILLOW_AVAILABLE = False
-        logging.warning("Pillow import failed. Some image formats may not be supported.")
-else:
-    Image = None
-    TAGS = None
-    logging.warning("Pillow not available. Some image formats may not be supported.")
-
-if EXIFREAD_AVAILABLE:
+        logging.warning("Pillow not available. Some image formats may not be supported.")
+        return None
+    return Image
+
+
+@lru_cache(maxsize=None)
+def _exifread():
+    """
+    Import exifread on first use.
+
+    Returns:
+        The exifread module, or None if exifread is not available
+    """
     try:
         import exifread
     except ImportError:
-        exifread = None
-        EXIFREAD_AVAILABLE = False
-        logging.warning("exifread import failed. RAW format support may be limited.")
-else:
-    exifread = None
-    logging.warning("exifread not available. RAW format support may be limited.")
+        logging.warning("exifread not available. RAW format support may be limited.")
+        return None
+    return exifread
+
+
+@lru_cache(maxsize=None)
+def _ciso8601():
+    """
+    Import ciso8601, an optional C parser for the camera date format, on first use.
+
+    Returns:
+        The ciso8601 module, or None if it is not installed
+    """
+    try:
+        import ciso8601
+    except ImportError:
+        return None
+    return ciso8601
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the dependency availability flags lazily."""
+    if name == 'PILLOW_AVAILABLE':
+        return _pillow() is not None
+    if name == 'EXIFREAD_AVAILABLE':
+        return _exifread() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Number of leading bytes read when looking for the EXIF block of a JPEG.
+# Cameras write the APP1 segment right after SOI, so a date lookup never
+# needs to pull the compressed image data into memory.
+PARTIAL_READ_BYTES = 128 * 1024
+
+# Tag pointing from IFD0 to the EXIF sub-IFD (DateTimeOriginal lives there)
+EXIF_IFD_POINTER = 0x8769
+
+# Tag pointing from IFD0 to the GPS sub-IFD
+GPS_IFD_POINTER = 0x8825
+
+# IFD0 tags harvested by extract_all
+ORIENTATION_TAG = 0x0112
+MODEL_TAG = 0x0110
+
+JPEG_EXTENSIONS = frozenset({'.jpg', '.jpeg'})
+
+# Extensions treated as images by _is_image_file
+IMAGE_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif',
+    '.raw', '.cr2', '.nef', '.arw', '.dng',
+    '.bmp', '.gif', '.webp', '.heic', '.heif'
+})
+
+
+def _extension(file_path: Union[str, Path]) -> str:
+    """Return the lowercased extension of a path without building a Path object."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+# Date tag ids read directly from the TIFF structure by _fast_date_only
+DATETIME_TAG_IDS = {
+    'DateTime': 0x0132,
+    'DateTimeOriginal': 0x9003,
+    'DateTimeDigitized': 0x9004,
+}
+
+# TIFF field type for NUL-terminated ASCII strings
+TIFF_ASCII = 2
+
+# Layouts tried by _parse_exif_datetime when the fixed-width fast path
+# misses, keyed by string length so each input tries only matching layouts
+EXIF_DATETIME_FORMATS_BY_LENGTH = {
+    19: ('%Y:%m:%d %H:%M:%S',    # Most common: 2024:01:15 14:30:25
+         '%Y-%m-%d %H:%M:%S'),   # Alternative: 2024-01-15 14:30:25
+    16: ('%Y:%m:%d %H:%M',       # Without seconds: 2024:01:15 14:30
+         '%Y-%m-%d %H:%M'),      # Without seconds: 2024-01-15 14:30
+    10: ('%Y:%m:%d',             # Date only: 2024:01:15
+         '%Y-%m-%d'),            # Date only: 2024-01-15
+}
+
+# Strings of any other length (e.g. unpadded fields) try every layout
+EXIF_DATETIME_FORMATS = tuple(
+    fmt for formats in EXIF_DATETIME_FORMATS_BY_LENGTH.values() for fmt in formats
+)
+
+
+@dataclass
+class MediaMetadata:
+    """Metadata harvested from a single pass over an image file."""
+    file_path: str
+    date_taken: Optional[datetime] = None
+    orientation: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    gps: Optional[Dict[str, Any]] = None
+    camera_model: Optional[str] = None
 
 
 class ExifExtractor:
@@ -61,6 +171,11 @@ class ExifExtractor:
             'Date_Time_Original', # Alternative format
         ]
 
+        # Numeric ids of the preferred tags, for reading them straight from an Exif object
+        self.datetime_tag_ids = [
+            (tag, DATETIME_TAG_IDS[tag]) for tag in self.datetime_tags if tag in DATETIME_TAG_IDS
+        ]
+
     def extract_date_from_file(self, file_path: str) -> Optional[datetime]:
         """
         Extract the creation date from an image file.
@@ -71,128 +186,643 @@ class ExifExtractor:
         Returns:
             Optional[datetime]: The extracted date or None if not found
         """
-        file_path_obj = Path(file_path)
+        # Plain os calls on the string: this runs once per file, and a Path
+        # is only built on a cache miss
+        file_path = os.fspath(file_path)
         
-        if not file_path_obj.exists():
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             self.logger.error(f"File does not exist: {file_path}")
             return None
         
-        if not self._is_image_file(file_path_obj):
+        if not self._is_image_file(file_path):
             self.logger.debug(f"Skipping non-image file: {file_path}")
             return None
         
         # Use cached extraction based on file path, size, and modification time
-        return self._extract_date_cached(
-            str(file_path_obj),
-            file_path_obj.stat().st_size,
-            file_path_obj.stat().st_mtime
-        )
+        return _extract_date_cached(file_path, file_stat.st_size, file_stat.st_mtime_ns)
     
-    @lru_cache(maxsize=1000)
-    def _extract_date_cached(self, file_path: str, file_size: int, file_mtime: float) -> Optional[datetime]:
+    def extract_date_from_entry(self, entry: os.DirEntry) -> Optional[datetime]:
+        """
+        Extract the creation date of a file found with os.scandir.
+        
+        Prefer this over extract_date_from_file when iterating a directory
+        listing (e.g. utils.file_scanner.walk_files): the stat result is cached
+        on the entry (and comes with the listing itself on Windows), so a file
+        whose entry was already statted costs no further stat call here.
+        
+        Args:
+            entry (os.DirEntry): Directory entry of the image file
+            
+        Returns:
+            Optional[datetime]: The extracted date or None if not found
         """
-        Cached version of date extraction based on file path, size, and modification time.
+        if not self._is_image_file(entry.name):
+            self.logger.debug(f"Skipping non-image file: {entry.path}")
+            return None
+        
+        try:
+            file_stat = entry.stat()
+        except OSError:
+            self.logger.error(f"File does not exist: {entry.path}")
+            return None
+        
+        return _extract_date_cached(entry.path, file_stat.st_size, file_stat.st_mtime_ns)
+    
+    def extract_dates(self, file_paths: List[str], max_workers: int = 1,
+                      chunksize: int = 64) -> List[Optional[datetime]]:
+        """
+        Extract creation dates for many files, optionally in worker processes.
+
+        Args:
+            file_paths (List[str]): Paths to the image files
+            max_workers (int): Number of worker processes (1 = serial)
+            chunksize (int): Paths sent to a worker per round trip
+
+        Returns:
+            List[Optional[datetime]]: Extracted dates in the order of file_paths
+        """
+        return list(self.iter_dates(file_paths, max_workers, chunksize))
+
+    def extract_dates_batch(self, file_paths: Iterable[str],
+                            max_workers: Optional[int] = None) -> Dict[str, Optional[datetime]]:
+        """
+        Extract creation dates for many files concurrently in threads.
+
+        Suited to slow or network storage, where reading the headers dominates
+        and threads overlap the waits; the date cache is shared and thread-safe.
+        For CPU-bound parsing of local files prefer extract_dates with worker
+        processes.
+
+        Args:
+            file_paths (Iterable[str]): Paths to the image files
+            max_workers (Optional[int]): Number of threads (default: 4 per CPU, at most 32)
+
+        Returns:
+            Dict[str, Optional[datetime]]: Extracted date for each path
+        """
+        paths = list(file_paths)
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        if max_workers <= 1 or len(paths) <= 1:
+            return {path: self._extract_date_safe(path) for path in paths}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(self._extract_date_safe, paths)))
+
+    def iter_dates(self, file_paths: List[str], max_workers: int = 1,
+                   chunksize: int = 64) -> Iterator[Optional[datetime]]:
+        """
+        Yield creation dates in order as soon as each one is available.
+
+        Consumers can act on early results (e.g. move the file) while worker
+        processes are still parsing later ones. Batches no larger than one
+        chunk are processed in this process, since spawning workers would cost
+        more than it saves.
+
+        Args:
+            file_paths (List[str]): Paths to the image files
+            max_workers (int): Number of worker processes (1 = serial)
+            chunksize (int): Paths sent to a worker per round trip
+
+        Yields:
+            Optional[datetime]: Extracted date for each path, in order
+        """
+        done = 0
+
+        if max_workers > 1 and len(file_paths) > chunksize:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for date in executor.map(_extract_date_in_worker, file_paths, chunksize=chunksize):
+                        yield date
+                        done += 1
+                return
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f"Parallel EXIF extraction failed, continuing serially: {e}")
+
+        for file_path in file_paths[done:]:
+            yield self._extract_date_safe(file_path)
+
+    def _extract_date_safe(self, file_path: str) -> Optional[datetime]:
+        """
+        Extract a date, logging and swallowing unexpected errors.
+
+        Args:
+            file_path (str): Path to the image file
+
+        Returns:
+            Optional[datetime]: The extracted date or None
+        """
+        try:
+            return self.extract_date_from_file(file_path)
+        except Exception as e:
+            self.logger.error(f"Error extracting date from {file_path}: {e}")
+            return None
+
+    def extract_all(self, file_path: str) -> MediaMetadata:
+        """
+        Extract date, orientation, dimensions, GPS and camera model in one pass.
+
+        The image is opened exactly once. Files Pillow cannot open (e.g. RAW)
+        fall back to extract_date_from_file for the date only.
+
+        Args:
+            file_path (str): Path to the image file
+
+        Returns:
+            MediaMetadata: Harvested metadata (fields are None when unavailable)
+        """
+        file_path_obj = Path(file_path)
+        metadata = MediaMetadata(file_path=str(file_path_obj))
+
+        if not file_path_obj.exists() or not self._is_image_file(file_path_obj):
+            return metadata
+
+        Image = _pillow()
+        if Image is None:
+            metadata.date_taken = self.extract_date_from_file(file_path)
+            return metadata
+        from PIL.ExifTags import GPSTAGS
+
+        try:
+            with Image.open(file_path_obj) as img:
+                metadata.width, metadata.height = img.size
+                exif = img.getexif()
+                exif_ifd = exif.get_ifd(EXIF_IFD_POINTER)
+                gps_ifd = exif.get_ifd(GPS_IFD_POINTER)
+        except Exception as e:
+            self.logger.debug(f"Pillow failed to open {file_path}: {e}")
+            metadata.date_taken = self.extract_date_from_file(file_path)
+            return metadata
+
+        metadata.orientation = exif.get(ORIENTATION_TAG)
+        model = exif.get(MODEL_TAG)
+        metadata.camera_model = str(model).strip('\x00 ') if model else None
+        if gps_ifd:
+            metadata.gps = {GPSTAGS.get(tag, tag): value for tag, value in gps_ifd.items()}
+
+        for tag, tag_id in self.datetime_tag_ids:
+            value = exif.get(tag_id) or exif_ifd.get(tag_id)
+            if value:
+                parsed_date = self._parse_exif_datetime(str(value))
+                if parsed_date:
+                    metadata.date_taken = parsed_date
+                    break
+
+        if metadata.date_taken is None:
+            metadata.date_taken = self._get_file_modification_date(file_path_obj)
+
+        return metadata
+
+    def _extract_date_uncached(self, file_path: str, file_size: int, file_mtime_ns: int) -> Optional[datetime]:
+        """
+        Extract a date without consulting the shared cache.
         
         Args:
             file_path (str): Path to the image file
             file_size (int): File size in bytes
-            file_mtime (float): File modification time
+            file_mtime_ns (int): File modification time in nanoseconds
             
         Returns:
             Optional[datetime]: The extracted date or None if not found
         """
         file_path_obj = Path(file_path)
-        
+        is_jpeg = _extension(file_path) in JPEG_EXTENSIONS
+        has_pillow = _pillow() is not None
+        has_exifread = _exifread() is not None
+
+        # Read the metadata once and share it between the parsers below: the
+        # APP1 segment for JPEGs, the leading bytes of the file otherwise
+        data = None
+        try:
+            if is_jpeg:
+                data = self._read_jpeg_exif_segment(file_path_obj)
+            elif has_pillow or has_exifread:
+                with open(file_path_obj, 'rb') as f:
+                    data = f.read(PARTIAL_READ_BYTES)
+        except OSError as e:
+            self.logger.debug(f"Could not read metadata from {file_path}: {e}")
+
+        # JPEGs: read just the date tags straight from the APP1 segment
+        if is_jpeg and data is not None:
+            date = self._fast_date_only(file_path_obj, data)
+            if date:
+                return date
+
         # Try Pillow first (most reliable for common formats)
-        if PILLOW_AVAILABLE:
-            date = self._extract_with_pillow(file_path_obj)
+        if has_pillow and data is not None:
+            date = self._extract_with_pillow(file_path_obj, data)
             if date:
                 return date
         
         # Fallback to exifread for RAW and other formats
-        if EXIFREAD_AVAILABLE:
-            date = self._extract_with_exifread(file_path_obj)
+        if has_exifread:
+            date = self._extract_with_exifread(file_path_obj, None if is_jpeg else data)
             if date:
                 return date
         
         # Last resort: use file modification time
         return self._get_file_modification_date(file_path_obj)
 
-    def _extract_with_pillow(self, file_path: Path) -> Optional[datetime]:
+    def _fast_date_only(self, file_path: Path, segment: Optional[bytes] = None) -> Optional[datetime]:
+        """
+        Extract the date of a JPEG by walking its TIFF structure directly.
+
+        Only IFD0 and the EXIF sub-IFD are visited and only the date tags are
+        decoded, so no full EXIF library is involved. Any parse failure returns
+        None so that the caller falls back to Pillow.
+
+        Args:
+            file_path (Path): Path to the JPEG file
+            segment (Optional[bytes]): APP1 segment if already read
+
+        Returns:
+            Optional[datetime]: Extracted date or None
+        """
+        try:
+            if segment is None:
+                segment = self._read_jpeg_exif_segment(file_path)
+            if segment is None:
+                return None
+
+            tiff = segment[6:]
+            if tiff[:4] == b'II*\x00':
+                endian = '<'
+            elif tiff[:4] == b'MM\x00*':
+                endian = '>'
+            else:
+                return None
+
+            wanted = set(DATETIME_TAG_IDS.values())
+            values: Dict[int, str] = {}
+            ifd0_offset = struct.unpack_from(endian + 'I', tiff, 4)[0]
+            exif_offset = self._read_ifd_strings(tiff, ifd0_offset, endian, wanted, values)
+            if exif_offset:
+                self._read_ifd_strings(tiff, exif_offset, endian, wanted, values)
+        except (OSError, struct.error) as e:
+            self.logger.debug(f"Fast EXIF date parse failed for {file_path}: {e}")
+            return None
+
+        for tag in self.datetime_tags:
+            tag_id = DATETIME_TAG_IDS.get(tag)
+            if tag_id in values:
+                parsed_date = self._parse_exif_datetime(values[tag_id])
+                if parsed_date:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Found {tag} in {file_path}: {parsed_date}")
+                    return parsed_date
+
+        return None
+
+    def _read_ifd_strings(self, tiff: bytes, offset: int, endian: str,
+                          wanted: set, values: Dict[int, str]) -> Optional[int]:
+        """
+        Collect ASCII values of the wanted tags from a single IFD.
+
+        Args:
+            tiff (bytes): TIFF data starting at the byte-order mark
+            offset (int): Offset of the IFD within tiff
+            endian (str): struct byte-order prefix ('<' or '>')
+            wanted (set): Tag ids to collect
+            values (Dict[int, str]): Output mapping of tag id to string value
+
+        Returns:
+            Optional[int]: Offset of the EXIF sub-IFD if this IFD points to one
+        """
+        exif_offset = None
+        count = struct.unpack_from(endian + 'H', tiff, offset)[0]
+        entry = offset + 2
+
+        for _ in range(count):
+            tag, field_type, length, value = struct.unpack_from(endian + 'HHII', tiff, entry)
+            entry += 12
+
+            if tag == EXIF_IFD_POINTER:
+                exif_offset = value
+            elif tag in wanted and field_type == TIFF_ASCII and tag not in values:
+                # Strings longer than 4 bytes are stored at an offset
+                start = value if length > 4 else entry - 4
+                raw = tiff[start:start + length]
+                values[tag] = raw.split(b'\x00', 1)[0].decode('ascii', 'replace')
+
+        return exif_offset
+
+    def _extract_with_pillow(self, file_path: Path, data: Optional[bytes] = None) -> Optional[datetime]:
         """
         Extract EXIF date using Pillow library.
 
+        Only the date tags are looked up by id on Pillow's lazy Exif object;
+        the tag table is never converted to names, and of the sub-IFDs only
+        the EXIF one is decoded.
+
         Args:
             file_path (Path): Path to the image file
+            data (Optional[bytes]): Already read APP1 segment for JPEGs, or the
+                first PARTIAL_READ_BYTES of other files
 
         Returns:
             Optional[datetime]: Extracted date or None
         """
         try:
-            if not PILLOW_AVAILABLE or Image is None or TAGS is None:
+            exif = self._load_exif(file_path, data)
+            if not exif:
+                self.logger.debug(f"No EXIF data found in {file_path}")
                 return None
-            with Image.open(file_path) as img:
-                exif_data = getattr(img, '_getexif', lambda: None)()
-
-                if not exif_data:
-                    self.logger.debug(f"No EXIF data found in {file_path}")
-                    return None
-
-                # Convert EXIF data to readable format
-                exif_dict = {TAGS.get(tag, tag): value for tag, value in exif_data.items()}
-
-                # Try to find date/time in EXIF data
-                for tag in self.datetime_tags:
-                    if tag in exif_dict:
-                        date_str = str(exif_dict[tag])
-                        parsed_date = self._parse_exif_datetime(date_str)
-                        if parsed_date:
+
+            exif_ifd = exif.get_ifd(EXIF_IFD_POINTER)
+
+            # Try to find date/time in EXIF data
+            for tag, tag_id in self.datetime_tag_ids:
+                value = exif.get(tag_id) or exif_ifd.get(tag_id)
+                if value:
+                    parsed_date = self._parse_exif_datetime(str(value))
+                    if parsed_date:
+                        if self.logger.isEnabledFor(logging.DEBUG):
                             self.logger.debug(f"Found {tag} in {file_path}: {parsed_date}")
-                            return parsed_date
+                        return parsed_date
 
         except Exception as e:
             self.logger.debug(f"Pillow failed to read EXIF from {file_path}: {e}")
 
         return None
 
-    def _extract_with_exifread(self, file_path: Path) -> Optional[datetime]:
+    def _load_exif(self, file_path: Path, data: Optional[bytes] = None) -> Optional["Image.Exif"]:
+        """
+        Load the EXIF of an image with Pillow, reading as little as possible.
+
+        JPEGs are parsed from their APP1 segment alone; other formats from
+        their leading bytes, falling back to the whole file.
+
+        Args:
+            file_path (Path): Path to the image file
+            data (Optional[bytes]): Already read APP1 segment for JPEGs, or the
+                first PARTIAL_READ_BYTES of other files
+
+        Returns:
+            Optional[Image.Exif]: EXIF data (may be empty), or None if a JPEG has no APP1 segment
+        """
+        if _extension(file_path) in JPEG_EXTENSIONS:
+            segment = data if data is not None else self._read_jpeg_exif_segment(file_path)
+            if segment is None:
+                return None
+            exif = _pillow().Exif()
+            exif.load(segment)
+            return exif
+
+        return self._load_pillow_exif(file_path, data)
+
+    def _read_pillow_exif(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the IFD0 and EXIF sub-IFD tags of an image for get_exif_summary.
+
+        Loads the EXIF the same way date extraction does (_load_exif).
+        Cached through _read_pillow_exif_cached.
+
+        Args:
+            file_path (str): Path to the image file
+
+        Returns:
+            Optional[Dict[str, Any]]: EXIF tags keyed by tag name, or None
+        """
+        if _pillow() is None:
+            return None
+        from PIL.ExifTags import TAGS
+
+        exif = self._load_exif(Path(file_path))
+        if not exif:
+            return None
+
+        exif_data = dict(exif)
+        exif_data.update(exif.get_ifd(EXIF_IFD_POINTER))
+
+        # Convert EXIF data to readable format
+        return {TAGS.get(tag, tag): value for tag, value in exif_data.items()}
+
+    def _read_jpeg_exif_segment(self, file_path: Path) -> Optional[bytes]:
+        """
+        Read the raw EXIF (APP1) segment from a JPEG file.
+
+        Only the first PARTIAL_READ_BYTES of the file are memory-mapped and
+        scanned in place, so nothing but the segment itself is copied. The whole
+        file is mapped only if the segment does not fit into that window.
+
+        Args:
+            file_path (Path): Path to the JPEG file
+
+        Returns:
+            Optional[bytes]: APP1 payload starting with b'Exif\\0\\0', or None
+        """
+        with open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size == 0:
+                return None
+
+            try:
+                header = mmap.mmap(f.fileno(), min(file_size, PARTIAL_READ_BYTES), access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable (e.g. special file system): fall back to a plain read
+                return self._scan_exif_segment(f.read())[0]
+
+            try:
+                segment, complete = self._scan_exif_segment(header)
+            finally:
+                header.close()
+
+            if not complete and file_size > PARTIAL_READ_BYTES:
+                self.logger.debug(f"EXIF segment not within first {PARTIAL_READ_BYTES} bytes, reading full file: {file_path}")
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    segment, complete = self._scan_exif_segment(data)
+                finally:
+                    data.close()
+
+        return segment
+
+    def _scan_exif_segment(self, data: bytes) -> Tuple[Optional[bytes], bool]:
+        """
+        Walk JPEG markers in a buffer looking for the EXIF APP1 segment.
+
+        Args:
+            data (bytes): Leading bytes of a JPEG file (bytes or a memory map)
+
+        Returns:
+            Tuple[Optional[bytes], bool]: (segment payload or None, whether the scan
+            reached a conclusion; False means more data is needed)
+        """
+        if data[:2] != b'\xff\xd8':
+            return None, True
+
+        pos = 2
+        size = len(data)
+        while pos + 4 <= size:
+            if data[pos] != 0xFF:
+                return None, True
+
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                # Fill byte before the actual marker
+                pos += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                # Standalone markers carry no length field
+                pos += 2
+                continue
+            if marker in (0xDA, 0xD9):
+                # Start of scan / end of image: no metadata after this point
+                return None, True
+
+            length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+            end = pos + 2 + length
+
+            if marker == 0xE1 and data[pos + 4:pos + 10] == b'Exif\x00\x00':
+                if end > size:
+                    return None, False
+                return data[pos + 4:end], True
+
+            pos = end
+
+        return None, False
+
+    def _load_pillow_exif(self, file_path: Path, head: Optional[bytes]) -> "Image.Exif":
+        """
+        Load the EXIF of a non-JPEG image, from its leading bytes when possible.
+
+        Args:
+            file_path (Path): Path to the image file
+            head (Optional[bytes]): First PARTIAL_READ_BYTES of the file, if read
+
+        Returns:
+            Image.Exif: EXIF data of the image (may be empty)
+        """
+        Image = _pillow()
+        if head is not None:
+            try:
+                with Image.open(io.BytesIO(head)) as img:
+                    exif = img.getexif()
+                if exif or len(head) < PARTIAL_READ_BYTES:
+                    return exif
+            except Exception as e:
+                if len(head) < PARTIAL_READ_BYTES:
+                    raise
+                self.logger.debug(f"Pillow could not parse header of {file_path}: {e}")
+
+        # Metadata may lie beyond the header window: let Pillow read the file
+        with Image.open(file_path) as img:
+            return img.getexif()
+
+    def _extract_with_exifread(self, file_path: Path, head: Optional[bytes] = None) -> Optional[datetime]:
         """
         Extract EXIF date using exifread library (better for RAW files).
 
+        The first PARTIAL_READ_BYTES are read in one go and parsed from memory,
+        which replaces exifread's many small seeks and reads. Only if no date is
+        found there is the whole file parsed.
+
         Args:
             file_path (Path): Path to the image file
+            head (Optional[bytes]): First PARTIAL_READ_BYTES of the file if
+                already read by the caller
 
         Returns:
             Optional[datetime]: Extracted date or None
         """
         try:
-            if not EXIFREAD_AVAILABLE or exifread is None:
+            if _exifread() is None:
                 return None
-            with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
-
-                # Try to find date/time in EXIF tags
-                for tag_name in self.datetime_tags:
-                    # Check both with and without 'EXIF' prefix
-                    possible_keys = [
-                        f'EXIF {tag_name}',
-                        f'Image {tag_name}',
-                        tag_name
-                    ]
+            if head is None:
+                with open(file_path, 'rb') as f:
+                    head = f.read(PARTIAL_READ_BYTES)
 
-                    for key in possible_keys:
-                        if key in tags:
-                            date_str = str(tags[key])
-                            parsed_date = self._parse_exif_datetime(date_str)
-                            if parsed_date:
-                                self.logger.debug(f"Found {key} in {file_path}: {parsed_date}")
-                                return parsed_date
+            try:
+                date = self._read_exifread_date(io.BytesIO(head), file_path)
+            except Exception as e:
+                self.logger.debug(f"exifread could not parse header of {file_path}: {e}")
+                date = None
+
+            if date is None and len(head) == PARTIAL_READ_BYTES:
+                # Tags may point beyond the header window (common in RAW files)
+                with open(file_path, 'rb') as f:
+                    date = self._read_exifread_date(f, file_path)
+
+            return date
 
         except Exception as e:
             self.logger.debug(f"exifread failed to read EXIF from {file_path}: {e}")
 
         return None
 
+    def _read_exifread_date(self, f, file_path: Path) -> Optional[datetime]:
+        """
+        Find the preferred date with exifread, parsing past DateTimeOriginal only if needed.
+
+        Args:
+            f: Binary file object positioned at the start of the image
+            file_path (Path): Path of the file, for logging
+
+        Returns:
+            Optional[datetime]: Parsed date or None
+        """
+        tags = self._process_exifread(f)
+        date = self._find_exifread_date(tags, file_path)
+
+        # Parsing stopped at a DateTimeOriginal that holds no usable date, so
+        # later tags such as DateTimeDigitized were never read
+        if date is None and 'EXIF DateTimeOriginal' in tags:
+            f.seek(0)
+            date = self._find_exifread_date(self._process_exifread(f, stop_tag=None), file_path)
+
+        return date
+
+    def _process_exifread(self, f, stop_tag: Optional[str] = 'DateTimeOriginal') -> Dict[str, Any]:
+        """
+        Run exifread over a binary file object, stopping after the date tags.
+
+        Args:
+            f: Binary file object positioned at the start of the image
+            stop_tag (Optional[str]): Tag after which parsing stops, or None to read all tags
+
+        Returns:
+            Dict[str, Any]: exifread tags keyed by '<IFD> <tag name>'
+        """
+        if stop_tag is None:
+            return _exifread().process_file(f, details=False)
+
+        # DateTime sits in IFD0, before DateTimeOriginal in the EXIF
+        # sub-IFD, so stopping there skips maker notes and later IFDs
+        return _exifread().process_file(f, details=False, stop_tag=stop_tag)
+
+    def _find_exifread_date(self, tags: Dict[str, Any], file_path: Path) -> Optional[datetime]:
+        """
+        Pick the preferred date from exifread tags.
+
+        Args:
+            tags (Dict[str, Any]): Tags returned by exifread
+            file_path (Path): Path of the file, for logging
+
+        Returns:
+            Optional[datetime]: Parsed date or None
+        """
+        for tag_name in self.datetime_tags:
+            # Check both with and without 'EXIF' prefix
+            possible_keys = [
+                f'EXIF {tag_name}',
+                f'Image {tag_name}',
+                tag_name
+            ]
+
+            for key in possible_keys:
+                if key in tags:
+                    date_str = str(tags[key])
+                    parsed_date = self._parse_exif_datetime(date_str)
+                    if parsed_date:
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Found {key} in {file_path}: {parsed_date}")
+                        return parsed_date
+
+        return None
+
     def _parse_exif_datetime(self, date_str: str) -> Optional[datetime]:
         """
         Parse EXIF datetime string to datetime object.
@@ -203,22 +833,30 @@ class ExifExtractor:
         Returns:
             Optional[datetime]: Parsed datetime or None
         """
-        if not date_str or date_str.strip() == "":
+        value = date_str.strip() if date_str else ""
+        if not value:
             return None
 
-        # Common EXIF datetime formats
-        formats = [
-            '%Y:%m:%d %H:%M:%S',     # Most common: 2024:01:15 14:30:25
-            '%Y-%m-%d %H:%M:%S',     # Alternative: 2024-01-15 14:30:25
-            '%Y:%m:%d',              # Date only: 2024:01:15
-            '%Y-%m-%d',              # Date only: 2024-01-15
-            '%Y:%m:%d %H:%M',        # Without seconds: 2024:01:15 14:30
-            '%Y-%m-%d %H:%M',        # Without seconds: 2024-01-15 14:30
-        ]
+        # Fast path for the fixed-width 'YYYY:MM:DD HH:MM:SS' form written by
+        # virtually every camera; slicing ints is several times faster than strptime
+        if (len(value) == 19 and value[4] in ':-' and value[7] == value[4]
+                and value[10] == ' ' and value[13] == ':' and value[16] == ':'):
+            try:
+                ciso8601 = _ciso8601()
+                if ciso8601 is not None:
+                    return ciso8601.parse_datetime_as_naive(
+                        f"{value[0:4]}-{value[5:7]}-{value[8:10]}{value[10:]}"
+                    )
+                return datetime(
+                    int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), int(value[17:19])
+                )
+            except ValueError:
+                pass
 
-        for fmt in formats:
+        for fmt in EXIF_DATETIME_FORMATS_BY_LENGTH.get(len(value), EXIF_DATETIME_FORMATS):
             try:
-                return datetime.strptime(date_str.strip(), fmt)
+                return datetime.strptime(value, fmt)
             except ValueError:
                 continue
 
@@ -242,23 +880,17 @@ class ExifExtractor:
             self.logger.error(f"Could not get modification date for {file_path}: {e}")
             return None
 
-    def _is_image_file(self, file_path: Path) -> bool:
+    def _is_image_file(self, file_path: Union[str, Path]) -> bool:
         """
         Check if file is an image based on extension.
 
         Args:
-            file_path (Path): Path to check
+            file_path (Union[str, Path]): Path to check
 
         Returns:
             bool: True if file appears to be an image
         """
-        image_extensions = {
-            '.jpg', '.jpeg', '.png', '.tiff', '.tif',
-            '.raw', '.cr2', '.nef', '.arw', '.dng',
-            '.bmp', '.gif', '.webp', '.heic', '.heif'
-        }
-
-        return file_path.suffix.lower() in image_extensions
+        return _extension(file_path) in IMAGE_EXTENSIONS
 
     def get_exif_summary(self, file_path: str) -> Dict[str, Any]:
         """
@@ -271,53 +903,239 @@ class ExifExtractor:
             Dict[str, Any]: Summary of EXIF data
         """
         file_path_obj = Path(file_path)
+        try:
+            file_stat = file_path_obj.stat()
+        except OSError:
+            file_stat = None
+
         summary = {
             'file_path': str(file_path_obj),
-            'file_exists': file_path_obj.exists(),
+            'file_exists': file_stat is not None,
             'is_image': self._is_image_file(file_path_obj),
             'file_size': None,
             'modification_date': None,
             'exif_date': None,
             'exif_available': False,
             'datetime_tags_found': [],
-            'cache_info': self._extract_date_cached.cache_info()._asdict()
+            'cache_info': self.cache_info()._asdict()
         }
         
-        if not file_path_obj.exists():
+        if file_stat is None:
             return summary
         
         # File info
-        try:
-            summary['file_size'] = file_path_obj.stat().st_size
-            summary['modification_date'] = self._get_file_modification_date(file_path_obj)
-        except Exception as e:
-            self.logger.error(f"Error getting file info: {e}")
+        summary['file_size'] = file_stat.st_size
+        summary['modification_date'] = datetime.fromtimestamp(file_stat.st_mtime)
         
-        # EXIF info
-        summary['exif_date'] = self.extract_date_from_file(str(file_path))
-        
-        # Check which EXIF tags are available
-        if PILLOW_AVAILABLE and Image is not None and TAGS is not None:
+        # EXIF info: one parse yields both the available tags and the date
+        if _pillow() is not None:
             try:
-                with Image.open(file_path_obj) as img:
-                    exif_data = getattr(img, '_getexif', lambda: None)()
-                    if exif_data:
-                        summary['exif_available'] = True
-                        exif_dict = {TAGS.get(tag, tag): value for tag, value in exif_data.items()}
-                        summary['datetime_tags_found'] = [
-                            tag for tag in self.datetime_tags if tag in exif_dict
-                        ]
+                exif_dict = _read_pillow_exif_cached(
+                    str(file_path_obj), file_stat.st_size, file_stat.st_mtime_ns
+                )
+                if exif_dict:
+                    summary['exif_available'] = True
+                    summary['datetime_tags_found'] = [
+                        tag for tag in self.datetime_tags if tag in exif_dict
+                    ]
+                    for tag in summary['datetime_tags_found']:
+                        summary['exif_date'] = self._parse_exif_datetime(str(exif_dict[tag]))
+                        if summary['exif_date']:
+                            break
             except Exception:
                 pass
+
+        # Formats Pillow cannot read go through the regular extraction chain
+        if summary['exif_date'] is None:
+            summary['exif_date'] = self.extract_date_from_file(str(file_path))
         
         return summary
     
+    def cache_info(self):
+        """
+        Get statistics of the date cache shared by all extractors.
+
+        Returns:
+            CacheInfo: Hits, misses, maxsize and current size
+        """
+        return _extract_date_cached.cache_info()
+
     def clear_cache(self):
-        """Clear the EXIF extraction cache."""
-        self._extract_date_cached.cache_clear()
+        """Clear the EXIF extraction caches (they are shared by all extractors)."""
+        _extract_date_cached.cache_clear()
+        _read_pillow_exif_cached.cache_clear()
         self.logger.debug("EXIF extraction cache cleared")
 
 
+# Extractor reused by module-level helpers: the shared date cache and all
+# tasks that run in the same worker process
+_shared_extractor: Optional[ExifExtractor] = None
+
+
+def _get_shared_extractor() -> ExifExtractor:
+    """Return the module-wide extractor, creating it on first use."""
+    global _shared_extractor
+    if _shared_extractor is None:
+        _shared_extractor = ExifExtractor()
+    return _shared_extractor
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _CostAwareCache:
+    """
+    Memoizing wrapper that evicts cheap entries before expensive ones.
+
+    Implements the GreedyDual policy: every entry is scored with the current
+    inflation value plus the time its computation took, the lowest score is
+    evicted and becomes the new inflation value. A large RAW file whose EXIF
+    took long to parse therefore outlives many small JPEGs, while entries
+    that are never used again still age out. The call interface mirrors
+    functools.lru_cache (cache_info, cache_clear).
+    """
+
+    def __init__(self, func, maxsize: int):
+        """
+        Initialize the cache.
+
+        Args:
+            func: Function to memoize; its positional arguments form the key
+            maxsize (int): Maximum number of cached results
+        """
+        self.__wrapped__ = func
+        self.__doc__ = func.__doc__
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.cache_clear()
+
+    def __call__(self, *key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._hits += 1
+                entry[2] = self._inflation + entry[1]
+                self._push(entry[2], key)
+                return entry[0]
+            self._misses += 1
+
+        # Computed outside the lock, like lru_cache, so slow parses run in parallel
+        start = time.perf_counter_ns()
+        value = self.__wrapped__(*key)
+        cost = time.perf_counter_ns() - start
+
+        with self._lock:
+            if key not in self._entries:
+                while len(self._entries) >= self.maxsize:
+                    self._evict()
+                priority = self._inflation + cost
+                self._entries[key] = [value, cost, priority]
+                self._push(priority, key)
+        return value
+
+    def _push(self, priority: int, key) -> None:
+        """Record a priority, dropping superseded heap items when too many pile up."""
+        heapq.heappush(self._heap, (priority, next(self._counter), key))
+        if len(self._heap) > 2 * self.maxsize + 64:
+            self._heap = [(entry[2], next(self._counter), k) for k, entry in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _evict(self) -> None:
+        """Remove the entry with the lowest priority."""
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == priority:
+                del self._entries[key]
+                self._inflation = priority
+                return
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics in the form of functools.lru_cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics."""
+        with self._lock:
+            self._entries: Dict[Any, list] = {}
+            self._heap: List[Tuple[int, int, Any]] = []
+            self._counter = itertools.count()
+            self._inflation = 0
+            self._hits = 0
+            self._misses = 0
+
+
+def _cost_aware_cache(maxsize: int):
+    """Decorate a function with a _CostAwareCache of the given size."""
+    return lambda func: _CostAwareCache(func, maxsize)
+
+
+@_cost_aware_cache(maxsize=16384)
+def _extract_date_cached(file_path: str, file_size: int, file_mtime_ns: int) -> Optional[datetime]:
+    """
+    Extract a date, cached by file path, size, and modification time.
+
+    The cache lives at module level so every ExifExtractor shares it and no
+    instance is kept alive by it. The integer st_mtime_ns is used because a
+    float mtime can differ in its last bits between stat calls.
+
+    Args:
+        file_path (str): Path to the image file
+        file_size (int): File size in bytes
+        file_mtime_ns (int): File modification time in nanoseconds
+
+    Returns:
+        Optional[datetime]: The extracted date or None if not found
+    """
+    return _get_shared_extractor()._extract_date_uncached(file_path, file_size, file_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _read_pillow_exif_cached(file_path: str, file_size: int, file_mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """
+    Read EXIF tags with Pillow, cached by file path, size, and modification time.
+
+    Kept at module level for the same reasons as _extract_date_cached.
+    Callers must not modify the result.
+
+    Args:
+        file_path (str): Path to the image file
+        file_size (int): File size in bytes
+        file_mtime_ns (int): File modification time in nanoseconds
+
+    Returns:
+        Optional[Dict[str, Any]]: EXIF tags keyed by tag name, or None
+    """
+    return _get_shared_extractor()._read_pillow_exif(file_path)
+
+
+def _extract_date_in_worker(file_path: str) -> Optional[datetime]:
+    """
+    Extract a date inside a worker process of ExifExtractor.extract_dates.
+
+    Args:
+        file_path (str): Path to the image file
+
+    Returns:
+        Optional[datetime]: The extracted date or None
+    """
+    return _get_shared_extractor()._extract_date_safe(file_path)
+
+
+def _extract_dates_in_worker(file_paths: List[str]) -> List[Optional[datetime]]:
+    """
+    Extract dates for a batch of paths inside a worker process.
+
+    Args:
+        file_paths (List[str]): Paths to the image files
+
+    Returns:
+        List[Optional[datetime]]: The extracted dates, in input order
+    """
+    return [_extract_date_in_worker(file_path) for file_path in file_paths]
+
+
 def main():
     """Test function for the EXIF extractor."""
     import sys
@@ -6,24 +6,55 @@ This module handles the organization of photos into directory structures
 based on date information extracted from EXIF metadata.
 """
 
+import asyncio
+import concurrent.futures
+import errno
 import logging
+import os
+import re
 import shutil
-from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
     from .exif_extractor import ExifExtractor
     from .mpg_thm_merger import MpgThmMerger
+    from .utils.file_copy import copy_file_fast
+    from .utils.file_scanner import walk_files
     from .utils.statistics import StatisticsCollector
     from .video_processor import VideoProcessor
 except ImportError:
     from exif_extractor import ExifExtractor
     from mpg_thm_merger import MpgThmMerger
+    from utils.file_copy import copy_file_fast
+    from utils.file_scanner import walk_files
     from utils.statistics import StatisticsCollector
     from video_processor import VideoProcessor
 
+# Directory names that look like output of a previous run:
+# 2024, 2024-01, 2024-01-15 and 01 (month)
+_ORGANIZED_DIR_RE = re.compile(r'^(?:\d{4}(?:-\d{2}(?:-\d{2})?)?|\d{2})$')
+
+# Numeric suffix added to renamed duplicates, e.g. IMG_0001_002
+_DUPLICATE_SUFFIX_RE = re.compile(r'_(\d{3})$')
+
+# On Windows a directory listing carries each file's stat data, so
+# DirEntry.stat() needs no system call there; elsewhere it is a full stat
+_LISTING_HAS_STAT = os.name == 'nt'
+
+# Target directory builders for each supported date_format
+_DATE_DIR_FORMATTERS: Dict[str, Callable[[Path, int, int, int], Path]] = {
+    'YYYY/MM/DD': lambda base, y, m, d: base / f"{y:04d}" / f"{m:02d}" / f"{d:02d}",
+    'YYYY/MM': lambda base, y, m, d: base / f"{y:04d}" / f"{m:02d}",
+    'YYYY-MM-DD': lambda base, y, m, d: base / f"{y:04d}-{m:02d}-{d:02d}",
+    'YYYY-MM': lambda base, y, m, d: base / f"{y:04d}-{m:02d}",
+}
+
+# Batched file operations kept in flight at once; they are I/O-bound, so
+# overlapping their system calls pays off even on a single core
+BATCH_IO_WORKERS = 8
+
 
 class FileOrganizer:
     """
@@ -51,43 +82,186 @@ class FileOrganizer:
 
         # Batch processing configuration
         self.batch_size = self.config.get('performance', {}).get('batch_size', 100)
-        self._pending_operations = []
 
-    def _add_to_batch(self, operation_type: str, source: Path, target: Path):
+        # Queued operations as parallel lists (type, source, target, whether the
+        # target is a placeholder) rather than one dict per operation
+        self._pending_types: List[str] = []
+        self._pending_sources: List[Path] = []
+        self._pending_targets: List[Path] = []
+        self._pending_placeholders: List[bool] = []
+
+        # Worker processes for EXIF extraction (partly I/O bound, so capped at 8)
+        self.jobs = self.config.get('performance', {}).get('jobs') or min(os.cpu_count() or 1, 8)
+
+        # Directories already created during this run, so each is only mkdir'd once
+        self._created_dirs = set()
+
+        # Date directory paths already formatted during this run
+        self._date_dir_cache: Dict[Tuple, Path] = {}
+
+        # Names known to exist in directories that had duplicates this run
+        self._dir_names: Dict[Path, set] = {}
+
+        # Modification times taken from the directory listing, where it has them
+        self._listing_mtimes: Dict[Path, float] = {}
+
+        # Whether source and target share a file system (None = unknown)
+        self._same_fs: Optional[bool] = None
+
+        self._load_settings()
+
+    def _load_settings(self):
+        """
+        Resolve the per-file configuration values into attributes.
+
+        Called on construction and again at the start of every run, so that
+        changes made to the config dictionary in between are picked up while
+        the per-file code paths avoid nested config lookups.
+        """
+        processing = self.config.get('processing', {})
+        safety = self.config.get('safety', {})
+        fallback = self.config.get('fallback', {})
+        performance = self.config.get('performance', {})
+
+        self.move_files = processing.get('move_files', False)
+        self.create_backup = processing.get('create_backup', False)
+        self.duplicate_handling = processing.get('duplicate_handling', 'rename')
+        self.skip_organized = processing.get('skip_organized', True)
+        self.dry_run = safety.get('dry_run', False)
+        self.no_date_folder = fallback.get('no_date_folder', 'Unknown_Date')
+        self.use_file_date = fallback.get('use_file_date', True)
+        self.date_format = self.config.get('date_format', 'YYYY/MM')
+        # Unknown formats fall back to YYYY/MM
+        self._date_formatter = _DATE_DIR_FORMATTERS.get(self.date_format, _DATE_DIR_FORMATTERS['YYYY/MM'])
+        self.async_io = performance.get('async_io', False)
+        self.worker_threads = performance.get('worker_threads', 4)
+
+    def _ensure_directory(self, directory: Path):
+        """
+        Create a directory (and parents) unless it was already created this run.
+
+        Args:
+            directory (Path): Directory to create
+        """
+        if directory in self._created_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # The parents exist now as well, so later calls for them are no-ops
+        for created in (directory, *directory.parents):
+            if created in self._created_dirs:
+                break
+            self._created_dirs.add(created)
+
+    def _move_file(self, source: Path, target: Path):
+        """
+        Move a file, renaming in place when source and target share a file system.
+
+        A rename is atomic and copies no data. Only when the target lies on
+        another device does this fall back to shutil.move (copy + delete).
+        When source and target trees are known to be on different devices
+        the rename is not attempted at all.
+
+        Args:
+            source (Path): File to move
+            target (Path): Destination file path
+        """
+        if self._same_fs is False:
+            shutil.move(source, target)
+            return
+
+        try:
+            # Also covers mount points nested inside an otherwise shared tree
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source, target)
+
+    def _add_to_batch(self, operation_type: str, source: Path, target: Path, placeholder: bool = False):
         """Add operation to batch queue."""
-        self._pending_operations.append({
-            'type': operation_type,
-            'source': source,
-            'target': target
-        })
+        self._pending_types.append(operation_type)
+        self._pending_sources.append(source)
+        self._pending_targets.append(target)
+        self._pending_placeholders.append(placeholder)
 
-        if len(self._pending_operations) >= self.batch_size:
+        if len(self._pending_types) >= self.batch_size:
             self._flush_batch()
 
+    def _execute_operation(self, operation_type: str, source: Path, target: Path):
+        """
+        Move or copy a single file whose target has already been claimed.
+
+        Copies go through copy_file_fast, which keeps the data inside the
+        kernel (copy_file_range/sendfile) where available.
+
+        Args:
+            operation_type (str): 'unlink' when the target is already a hard link
+                to the source, otherwise 'move' or 'copy'
+            source (Path): File to move or copy
+            target (Path): Destination file path
+        """
+        if operation_type == 'unlink':
+            os.unlink(source)
+        elif operation_type == 'move':
+            self._move_file(source, target)
+        else:
+            copy_file_fast(source, target)
+            shutil.copystat(source, target)
+
     def _flush_batch(self):
         """Execute all pending operations in batch."""
-        if not self._pending_operations:
+        if not self._pending_types:
             return
 
-        move_files = self.config.get('processing', {}).get('move_files', False)
+        operations = self._pending_types
+        sources = self._pending_sources
+        targets = self._pending_targets
+        placeholders = self._pending_placeholders
 
-        for operation in self._pending_operations:
+        # Create each distinct target directory once before executing the batch,
+        # shallowest first so that a parent is known to exist before its children
+        target_dirs = {target.parent for target in targets}
+        for target_dir in sorted(target_dirs, key=lambda path: len(path.parts)):
             try:
-                operation['target'].parent.mkdir(parents=True, exist_ok=True)
-
-                if move_files:
-                    shutil.move(str(operation['source']), str(operation['target']))
-                    self.stats_collector.increment('moved')
+                self._ensure_directory(target_dir)
+            except OSError as e:
+                self.logger.error(f"Could not create directory {target_dir}: {e}")
+
+        workers = min(BATCH_IO_WORKERS, len(sources))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._execute_operation, operations[i], sources[i], targets[i])
+                for i in range(len(sources))
+            ]
+
+            # Results are collected here, so statistics are only updated from this
+            # thread; successes are counted up and recorded with one call per kind
+            copied = 0
+            moved = 0
+            for i, future in enumerate(futures):
+                error = future.exception()
+                if error is None:
+                    if operations[i] == 'copy':
+                        copied += 1
+                    else:
+                        moved += 1
                 else:
-                    shutil.copy2(str(operation['source']), str(operation['target']))
-                    self.stats_collector.increment('copied')
+                    if placeholders[i]:
+                        targets[i].unlink(missing_ok=True)
+                    self.logger.error(f"Batch operation failed for {sources[i]}: {error}")
+                    self.stats_collector.increment('errors')
 
-            except Exception as e:
-                self.logger.error(f"Batch operation failed for {operation['source']}: {e}")
-                self.stats_collector.increment('errors')
+        if moved:
+            self.stats_collector.increment('moved', moved)
+        if copied:
+            self.stats_collector.increment('copied', copied)
 
-        self.logger.debug(f"Executed batch of {len(self._pending_operations)} operations")
-        self._pending_operations = []
+        self.logger.debug(f"Executed batch of {len(sources)} operations")
+        self._pending_types = []
+        self._pending_sources = []
+        self._pending_targets = []
+        self._pending_placeholders = []
 
     def organize_photos(self, source_dir: str, target_dir: Optional[str] = None) -> Dict:
         """
@@ -100,6 +274,11 @@ class FileOrganizer:
         Returns:
             Dict: Statistics about the organization process
         """
+        self._load_settings()
+        self._created_dirs.clear()
+        self._date_dir_cache.clear()
+        self._dir_names.clear()
+        self._listing_mtimes.clear()
         source_path, target_path = self._validate_and_prepare_paths(source_dir, target_dir)
 
         self.stats_collector.start_session()
@@ -132,10 +311,16 @@ class FileOrganizer:
 
         if target_dir:
             target_path = Path(target_dir)
-            target_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(target_path)
         else:
             target_path = source_path
 
+        # Decide once whether moves can be renames instead of copies
+        try:
+            self._same_fs = os.stat(source_path).st_dev == os.stat(target_path).st_dev
+        except OSError:
+            self._same_fs = None
+
         return source_path, target_path
 
     def _discover_media_files(self, source_path: Path) -> Tuple[List[Path], List[Tuple[Path, List[Path], str]]]:
@@ -148,8 +333,9 @@ class FileOrganizer:
         Returns:
             Tuple containing image files and video groups
         """
-        image_files = self._find_image_files(source_path)
-        video_groups = self._find_video_groups(source_path)
+        # Images, videos and thumbnails are all collected in one walk
+        image_files, video_entries = self._walk_media(source_path, collect_videos=self.video_processor.enabled)
+        video_groups = self._find_video_groups(source_path, video_entries)
 
         total_files = len(image_files) + len(video_groups)
         self.logger.info(f"Found {len(image_files)} image files and {len(video_groups)} video groups to process")
@@ -184,16 +370,72 @@ class FileOrganizer:
 
     def _process_image_files(self, image_files: List[Path], target_path: Path):
         """
-        Process image files by grouping them by date.
+        Process image files, queueing each one as soon as its date is known.
+
+        Dates are streamed from the extractor, so files are moved or copied
+        while worker processes are still parsing the remaining ones. Each
+        target name is claimed immediately; the moves and copies themselves
+        run batch_size at a time on a small thread pool.
+
+        Args:
+            image_files (List[Path]): List of image files to process
+            target_path (Path): Target directory for organized files
+        """
+        if self.async_io:
+            asyncio.run(self._process_image_files_async(image_files, target_path))
+            return
+
+        for file_path, date_info in self._iter_file_dates(image_files):
+            try:
+                target_dir = self._get_target_directory_for_date(date_info, target_path)
+                self._move_or_copy_file(file_path, target_dir, batch=True)
+            except Exception as e:
+                self.logger.error(f"Error moving/copying {file_path}: {e}")
+                self.stats_collector.increment('errors')
+
+        self._flush_batch()
+
+    async def _process_image_files_async(self, image_files: List[Path], target_path: Path):
+        """
+        Process image files with their moves and copies overlapping.
+
+        Each blocking move or copy runs on a thread pool, with at most
+        worker_threads of them in flight; target directories are still
+        created from the event loop thread as dates arrive.
 
         Args:
             image_files (List[Path]): List of image files to process
             target_path (Path): Target directory for organized files
         """
-        date_groups = self._group_files_by_date(image_files)
+        loop = asyncio.get_running_loop()
+        io_slots = asyncio.Semaphore(self.worker_threads)
+        pending = set()
 
-        for date_info, files in date_groups.items():
-            self._process_date_group(files, date_info, target_path)
+        async def move_one(file_path: Path, target_dir: Path):
+            try:
+                await loop.run_in_executor(executor, self._move_or_copy_file, file_path, target_dir)
+            except Exception as e:
+                self.logger.error(f"Error moving/copying {file_path}: {e}")
+                self.stats_collector.increment('errors')
+            finally:
+                io_slots.release()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.worker_threads) as executor:
+            for file_path, date_info in self._iter_file_dates(image_files):
+                try:
+                    target_dir = self._get_target_directory_for_date(date_info, target_path)
+                except Exception as e:
+                    self.logger.error(f"Error moving/copying {file_path}: {e}")
+                    self.stats_collector.increment('errors')
+                    continue
+
+                await io_slots.acquire()
+                task = asyncio.create_task(move_one(file_path, target_dir))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
 
     def _process_video_groups(self, video_groups: List[Tuple[Path, List[Path], str]], target_path: Path):
         """
@@ -228,12 +470,12 @@ class FileOrganizer:
         """
         if date_info != ('no_date',):
             year, month, day = date_info
-            return self._create_date_directory(target_path, year, month, day)
+            target_date_dir = self._create_date_directory(target_path, year, month, day)
         else:
-            no_date_folder = self.config.get('fallback', {}).get('no_date_folder', 'Unknown_Date')
-            target_date_dir = target_path / no_date_folder
-            target_date_dir.mkdir(parents=True, exist_ok=True)
-            return target_date_dir
+            target_date_dir = target_path / self.no_date_folder
+
+        self._ensure_directory(target_date_dir)
+        return target_date_dir
 
     def _finalize_processing(self) -> Dict:
         """
@@ -243,6 +485,8 @@ class FileOrganizer:
             Dict: Processing statistics
         """
         self._flush_batch()
+        if hasattr(self.exif_extractor, 'flush'):
+            self.exif_extractor.flush()
         self.stats_collector.end_session()
         self.stats = self.stats_collector.get_dict()  # Update for backward compatibility
 
@@ -259,6 +503,20 @@ class FileOrganizer:
         Returns:
             List[Path]: List of image file paths
         """
+        return self._walk_media(directory, collect_videos=False)[0]
+
+    def _walk_media(self, directory: Path, collect_videos: bool) -> Tuple[List[Path], List[os.DirEntry]]:
+        """
+        Find image files, and optionally video and thumbnail entries, in one walk.
+
+        Args:
+            directory (Path): Directory to search
+            collect_videos (bool): Whether to also collect video and thumbnail entries
+
+        Returns:
+            Tuple[List[Path], List[os.DirEntry]]: Sorted image file paths and the
+            video/thumbnail entries for VideoProcessor.pair_video_entries
+        """
         supported_extensions = [
             ext.lower() for ext in self.config.get('supported_extensions', [])
         ]
@@ -269,26 +527,39 @@ class FileOrganizer:
             ext.lower() for ext in self.config.get('video', {}).get('thumbnail_extensions', ['.thm'])
         )
 
-        image_extensions = set(supported_extensions) - video_extensions - thumbnail_extensions
+        # A tuple lets str.endswith test all suffixes in one C-level call
+        image_suffixes = tuple(set(supported_extensions) - video_extensions - thumbnail_extensions)
+
+        # Files sitting directly in an already organized directory are skipped
+        # if configured; subdirectories below it (e.g. 2019/Birthday) are still walked
+        skip_organized = self.skip_organized
+
+        video_suffixes = ()
+        if collect_videos:
+            video_suffixes = tuple(
+                self.video_processor.video_extensions | self.video_processor.thumbnail_extensions
+            )
 
+        # Single scandir walk; extensions are matched case-insensitively and a
+        # file may be both an image and a thumbnail, as configured
         image_files = []
-        found_files = set()  # Track unique files to avoid duplicates
-
-        # Use pathlib.rglob for better performance with case-insensitive search
-        for ext in image_extensions:
-            # Search for both lowercase and uppercase versions
-            patterns = [f"**/*{ext}", f"**/*{ext.upper()}"]
-            for pattern in patterns:
-                for file_path in directory.rglob(pattern):
-                    if file_path.is_file() and file_path not in found_files:
-                        found_files.add(file_path)
-                        # Skip already organized directories if configured
-                        if self.config.get('processing', {}).get('skip_organized', True):
-                            if self._is_organized_directory(file_path.parent):
-                                continue
-                        image_files.append(file_path)
-
-        return sorted(image_files)
+        video_entries = []
+        for entry in walk_files(directory):
+            name = entry.name.lower()
+            if name.endswith(video_suffixes):
+                video_entries.append(entry)
+            if not name.endswith(image_suffixes):
+                continue
+            if skip_organized and _ORGANIZED_DIR_RE.match(os.path.basename(os.path.dirname(entry.path))):
+                continue
+
+            file_path = Path(entry.path)
+            if _LISTING_HAS_STAT:
+                # Free here, and spares the fallback date a stat call
+                self._listing_mtimes[file_path] = entry.stat().st_mtime
+            image_files.append(file_path)
+
+        return sorted(image_files), video_entries
 
     def _is_organized_directory(self, directory: Path) -> bool:
         """
@@ -300,69 +571,54 @@ class FileOrganizer:
         Returns:
             bool: True if directory appears organized
         """
-        # Check if directory name matches date patterns
-        dir_name = directory.name
-
-        # Common organized patterns
-        patterns = [
-            r'^\d{4}$',           # 2024
-            r'^\d{4}-\d{2}$',     # 2024-01
-            r'^\d{4}-\d{2}-\d{2}$',  # 2024-01-15
-            r'^\d{2}$'            # 01 (month)
-        ]
-
-        import re
-        for pattern in patterns:
-            if re.match(pattern, dir_name):
-                return True
-
-        return False
+        return _ORGANIZED_DIR_RE.match(directory.name) is not None
 
-    def _group_files_by_date(self, files: List[Path]) -> Dict[Tuple, List[Path]]:
+    def _iter_file_dates(self, files: List[Path]) -> Iterator[Tuple[Path, Tuple]]:
         """
-        Group files by their extracted dates.
+        Yield each file with its date key as soon as the date has been extracted.
 
         Args:
             files (List[Path]): List of image files
 
-        Returns:
-            Dict[Tuple, List[Path]]: Files grouped by (year, month, day) tuple
+        Yields:
+            Tuple[Path, Tuple]: File path and its (year, month, day) or ('no_date',) key
         """
-        date_groups = defaultdict(list)
+        extracted_dates = self.exif_extractor.iter_dates(
+            [str(file_path) for file_path in files], max_workers=self.jobs
+        )
 
-        for file_path in files:
+        for file_path, extracted_date in zip(files, extracted_dates):
             self.stats_collector.increment('processed')
 
             try:
-                # Extract date from file
-                extracted_date = self.exif_extractor.extract_date_from_file(str(file_path))
-
                 if extracted_date:
                     date_key = (extracted_date.year, extracted_date.month, extracted_date.day)
-                    date_groups[date_key].append(file_path)
                 else:
                     # Handle files without date
                     self.stats_collector.increment('no_date')
                     fallback_date = self._get_fallback_date(file_path)
                     if fallback_date:
                         date_key = (fallback_date.year, fallback_date.month, fallback_date.day)
-                        date_groups[date_key].append(file_path)
                     else:
                         # Group files without any date
-                        date_groups[('no_date',)].append(file_path)
+                        date_key = ('no_date',)
 
             except Exception as e:
                 self.logger.error(f"Error processing {file_path}: {e}")
                 self.stats_collector.increment('errors')
+                continue
 
-        return dict(date_groups)
+            yield file_path, date_key
 
-    def _find_video_groups(self, directory: Path) -> List[Tuple[Path, List[Path], str]]:
+    def _find_video_groups(self, directory: Path,
+                           entries: Optional[List[os.DirEntry]] = None) -> List[Tuple[Path, List[Path], str]]:
         """
         Find video files and their associated thumbnails.
 
         Args:
             directory (Path): Directory to search
+            entries (Optional[List[os.DirEntry]]): Video and thumbnail entries from an
+                earlier walk of the directory; it is walked again when not given
 
         Returns:
             List[Tuple[Path, List[Path], str]]: List of (video_file, [thumbnail_files], processing_type)
@@ -370,10 +626,13 @@ class FileOrganizer:
         if not self.video_processor.enabled:
             return []
 
-        video_groups = self.video_processor.find_video_thumbnail_pairs(directory)
+        if entries is None:
+            video_groups = self.video_processor.find_video_thumbnail_pairs(directory)
+        else:
+            video_groups = self.video_processor.pair_video_entries(entries)
 
         # Filter out videos from organized directories if skip_organized is enabled
-        if self.config.get('processing', {}).get('skip_organized', True):
+        if self.skip_organized:
             filtered_groups = []
             for video_file, thumbnail_files, processing_type in video_groups:
                 if not self._is_organized_directory(video_file.parent):
@@ -394,37 +653,48 @@ class FileOrganizer:
         Returns:
             Dict[Tuple, List[Tuple[Path, List[Path]]]]: Video groups grouped by date
         """
-        date_groups = defaultdict(list)
+        date_groups: Dict[Tuple, List[Tuple[Path, List[Path], str]]] = {}
+        group_key = None
+        group: List[Tuple[Path, List[Path], str]] = []
+
+        # Dates are extracted concurrently; statistics stay on this thread
+        extracted_dates = self.video_processor.iter_video_group_dates(video_groups, max_workers=self.jobs)
 
-        for video_file, thumbnail_files, processing_type in video_groups:
+        for (video_file, thumbnail_files, processing_type), extracted_date in zip(video_groups, extracted_dates):
             self.stats_collector.increment('processed')
 
             try:
-                # Extract date from video or thumbnails
-                extracted_date = self.video_processor.extract_date_from_video_group(video_file, thumbnail_files)
-
                 if extracted_date:
                     date_key = (extracted_date.year, extracted_date.month, extracted_date.day)
-                    date_groups[date_key].append((video_file, thumbnail_files, processing_type))
-                    if self.video_processor.is_video_file(video_file):
-                        self.stats_collector.increment('videos_processed')
-                    self.stats_collector.increment('thumbnails_processed', len(thumbnail_files))
                 else:
                     # Handle files without date
                     self.stats_collector.increment('no_date')
                     fallback_date = self._get_fallback_date(video_file)
                     if fallback_date:
                         date_key = (fallback_date.year, fallback_date.month, fallback_date.day)
-                        date_groups[date_key].append((video_file, thumbnail_files, processing_type))
                     else:
                         # Group files without any date
-                        date_groups[('no_date',)].append((video_file, thumbnail_files, processing_type))
+                        date_key = ('no_date',)
+
+                # Videos from one folder usually arrive in runs of the same date,
+                # so the current group is reused until the date changes
+                if date_key != group_key:
+                    group = date_groups.get(date_key)
+                    if group is None:
+                        group = date_groups[date_key] = []
+                    group_key = date_key
+                group.append((video_file, thumbnail_files, processing_type))
+
+                if extracted_date:
+                    if self.video_processor.is_video_file(video_file):
+                        self.stats_collector.increment('videos_processed')
+                    self.stats_collector.increment('thumbnails_processed', len(thumbnail_files))
 
             except Exception as e:
                 self.logger.error(f"Error processing video group {video_file}: {e}")
                 self.stats_collector.increment('errors')
 
-        return dict(date_groups)
+        return date_groups
 
     def _get_fallback_date(self, file_path: Path) -> Optional[datetime]:
         """
@@ -436,53 +706,17 @@ class FileOrganizer:
         Returns:
             Optional[datetime]: Fallback date or None
         """
-        if self.config.get('fallback', {}).get('use_file_date', True):
+        if self.use_file_date:
             try:
-                mtime = file_path.stat().st_mtime
+                mtime = self._listing_mtimes.get(file_path)
+                if mtime is None:
+                    mtime = file_path.stat().st_mtime
                 return datetime.fromtimestamp(mtime)
             except Exception as e:
                 self.logger.debug(f"Could not get file date for {file_path}: {e}")
 
         return None
 
-    def _process_date_group(self, files: List[Path], date_info: Tuple, target_base: Path):
-        """
-        Process a group of files with the same date.
-
-        Args:
-            files (List[Path]): Files to process
-            date_info (Tuple): Date information tuple
-            target_base (Path): Base target directory
-        """
-        if date_info == ('no_date',):
-            # Handle files without date
-            target_dir = target_base / self.config.get('fallback', {}).get('no_date_folder', 'Unknown_Date')
-        else:
-            # Create date-based directory structure
-            year, month, day = date_info
-            target_dir = self._create_date_directory(target_base, year, month, day)
-
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Process each file in the group
-        for item in files:
-            try:
-                if isinstance(item, tuple):
-                    # This is a video group (video_file, thumbnail_files, processing_type)
-                    if len(item) == 3:
-                        video_file, thumbnail_files, processing_type = item
-                        self._move_or_copy_video_group(video_file, thumbnail_files, target_dir, processing_type)
-                    else:
-                        # Legacy format for backward compatibility
-                        video_file, thumbnail_files = item
-                        self._move_or_copy_video_group(video_file, thumbnail_files, target_dir, "standard")
-                else:
-                    # This is a regular image file
-                    self._move_or_copy_file(item, target_dir)
-            except Exception as e:
-                self.logger.error(f"Error moving/copying {item}: {e}")
-                self.stats_collector.increment('errors')
-
     def _create_date_directory(self, base_dir: Path, year: int, month: int, day: int) -> Path:
         """
         Create directory path based on date format configuration.
@@ -496,78 +730,162 @@ class FileOrganizer:
         Returns:
             Path: Target directory path
         """
-        date_format = self.config.get('date_format', 'YYYY/MM')
+        key = (base_dir, year, month, day)
+        cached = self._date_dir_cache.get(key)
+        if cached is not None:
+            return cached
 
-        if date_format == 'YYYY/MM/DD':
-            return base_dir / f"{year:04d}" / f"{month:02d}" / f"{day:02d}"
-        elif date_format == 'YYYY/MM':
-            return base_dir / f"{year:04d}" / f"{month:02d}"
-        elif date_format == 'YYYY-MM-DD':
-            return base_dir / f"{year:04d}-{month:02d}-{day:02d}"
-        elif date_format == 'YYYY-MM':
-            return base_dir / f"{year:04d}-{month:02d}"
-        else:
-            # Default to YYYY/MM
-            return base_dir / f"{year:04d}" / f"{month:02d}"
+        date_dir = self._date_formatter(base_dir, year, month, day)
+        self._date_dir_cache[key] = date_dir
+        return date_dir
 
-    def _move_or_copy_file(self, source_file: Path, target_dir: Path):
+    def _move_or_copy_file(self, source_file: Path, target_dir: Path, batch: bool = False):
         """
         Move or copy file to target directory.
 
+        The target name is claimed before returning, so a queued file already
+        reserves its name against the files that follow it.
+
         Args:
             source_file (Path): Source file path
             target_dir (Path): Target directory
+            batch (bool): Queue the move or copy for the next batch instead of running it now
         """
         target_file = target_dir / source_file.name
-
-        # Check if source and target are the same file (already in correct location)
-        try:
-            if source_file.resolve() == target_file.resolve():
-                self.logger.debug(f"File already in correct location: {source_file}")
-                self.stats_collector.increment('skipped')
-                return
-        except (OSError, ValueError):
-            # Handle cases where file doesn't exist or path resolution fails
-            pass
-
-        # Handle duplicate filenames
-        if target_file.exists():
-            target_file = self._handle_duplicate(source_file, target_file)
-            if not target_file:  # Skip if duplicate handling says so
-                self.stats_collector.increment('skipped')
-                return
-
-        # Check if we're in dry run mode
-        if self.config.get('safety', {}).get('dry_run', False):
-            action = "move" if self.config.get('processing', {}).get('move_files', False) else "copy"
+        move_files = self.move_files
+
+        # Check if we're in dry run mode (nothing is claimed, so probe for duplicates)
+        if self.dry_run:
+            if target_file.exists():
+                if self._is_same_file(source_file, target_file):
+                    self.logger.debug(f"File already in correct location: {source_file}")
+                    self.stats_collector.increment('skipped')
+                    return
+                target_file = self._handle_duplicate(source_file, target_file)
+                if not target_file:  # Skip if duplicate handling says so
+                    self.stats_collector.increment('skipped')
+                    return
+
+            action = "move" if move_files else "copy"
             self.logger.info(f"[DRY RUN] Would {action} {source_file} -> {target_file}")
             # Update statistics for dry run
-            if self.config.get('processing', {}).get('move_files', False):
+            if move_files:
                 self.stats_collector.increment('moved')
             else:
                 self.stats_collector.increment('copied')
             return
 
+        # Claim the target name; an existing file surfaces as FileExistsError.
+        # Renamed targets are claimed as well, since another move may pick the
+        # same free name concurrently
+        linked = False
+        placeholder = False
+        while True:
+            try:
+                linked = self._claim_target(source_file, target_file, move_files)
+                placeholder = not linked
+                break
+            except FileExistsError:
+                # The existing target may be the source itself (already in place)
+                if self._is_same_file(source_file, target_file):
+                    self.logger.debug(f"File already in correct location: {source_file}")
+                    self.stats_collector.increment('skipped')
+                    return
+
+                # Handle duplicate filenames
+                new_target = self._handle_duplicate(source_file, target_file)
+                if not new_target:  # Skip if duplicate handling says so
+                    self.stats_collector.increment('skipped')
+                    return
+                if new_target == target_file:  # Overwriting the existing file
+                    break
+                target_file = new_target
+
         # Create backup if configured
-        if self.config.get('processing', {}).get('create_backup', False):
+        if self.create_backup:
             self._create_backup(source_file)
 
+        if move_files:
+            operation_type = 'unlink' if linked else 'move'
+        else:
+            operation_type = 'copy'
+
+        if batch:
+            self._add_to_batch(operation_type, source_file, target_file, placeholder)
+            return
+
         # Move or copy the file
         try:
-            if self.config.get('processing', {}).get('move_files', False):
-                shutil.move(str(source_file), str(target_file))
+            self._execute_operation(operation_type, source_file, target_file)
+            if move_files:
                 self.stats_collector.increment('moved')
-                self.logger.debug(f"Moved {source_file} -> {target_file}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Moved {source_file} -> {target_file}")
             else:
-                shutil.copy2(str(source_file), str(target_file))
                 self.stats_collector.increment('copied')
-                self.logger.debug(f"Copied {source_file} -> {target_file}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Copied {source_file} -> {target_file}")
 
         except Exception as e:
+            if placeholder:
+                target_file.unlink(missing_ok=True)
             self.logger.error(f"Failed to move/copy {source_file}: {e}")
             self.stats_collector.increment('errors')
             raise
 
+    def _is_same_file(self, source_file: Path, target_file: Path) -> bool:
+        """
+        Check whether an existing target is the source file itself.
+
+        Only needed once a target is known to exist; compares device and
+        inode from one stat per path instead of resolving both paths.
+
+        Args:
+            source_file (Path): Source file path
+            target_file (Path): Existing target file path
+
+        Returns:
+            bool: True if both paths refer to the same file
+        """
+        try:
+            return os.path.samefile(source_file, target_file)
+        except OSError:
+            return False
+
+    def _claim_target(self, source_file: Path, target_file: Path, move_files: bool) -> bool:
+        """
+        Atomically claim a target path that must not exist yet.
+
+        For moves the source is hard-linked to the target, so only the source
+        still has to be unlinked. Otherwise (copies, or moves where hard links
+        are unavailable: other device, FAT file systems) an empty placeholder
+        is created exclusively and overwritten by the move or copy.
+
+        Args:
+            source_file (Path): Source file path
+            target_file (Path): Target file path
+            move_files (bool): Whether the file is being moved rather than copied
+
+        Returns:
+            bool: True if the target was hard-linked to the source
+
+        Raises:
+            FileExistsError: If the target already exists
+        """
+        if move_files:
+            # Hard links cannot cross devices, so skip the attempt when known
+            if self._same_fs is not False:
+                try:
+                    os.link(source_file, target_file)
+                    return True
+                except FileExistsError:
+                    raise
+                except OSError:
+                    pass
+
+        os.close(os.open(target_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        return False
+
     def _move_or_copy_video_group(self, video_file: Path, thumbnail_files: List[Path], target_dir: Path, processing_type: str = "standard"):
         """
         Move or copy video file and its thumbnails to target directory.
@@ -591,7 +909,7 @@ class FileOrganizer:
             if thm_files and self.mpg_merger.can_merge_files(video_file, thm_files[0]):
                 try:
                     # Check if we're in dry run mode
-                    if self.config.get('safety', {}).get('dry_run', False):
+                    if self.dry_run:
                         self.logger.info(f"[DRY RUN] Would merge {video_file} with {thm_files[0]} -> {target_dir / video_file.name}")
                         self.stats_collector.increment('mpg_merged')
                         return
@@ -647,7 +965,7 @@ class FileOrganizer:
         Returns:
             Optional[Path]: New target path or None to skip
         """
-        duplicate_handling = self.config.get('processing', {}).get('duplicate_handling', 'rename')
+        duplicate_handling = self.duplicate_handling
 
         if duplicate_handling == 'skip':
             self.logger.info(f"Skipping duplicate: {source_file}")
@@ -664,9 +982,7 @@ class FileOrganizer:
             parent = target_file.parent
 
             # Check if filename already has a numeric suffix like _001, _002, etc.
-            import re
-            suffix_pattern = r'_(\d{3})$'
-            match = re.search(suffix_pattern, full_name)
+            match = _DUPLICATE_SUFFIX_RE.search(full_name)
 
             if match:
                 # Remove existing suffix to get clean base name
@@ -675,19 +991,31 @@ class FileOrganizer:
                 # No existing suffix, use full name as base
                 base_name = full_name
 
-            # Find a unique filename
-            counter = 1
-            while True:
+            # Find the first free suffix from a directory listing taken once per
+            # run instead of probing every candidate. The listing goes stale as
+            # files arrive, so the pick is confirmed with a single exists()
+            # (which also covers case-insensitive file systems); callers claim
+            # the name atomically on top of that
+            taken = self._dir_names.get(parent)
+            if taken is None:
+                try:
+                    taken = set(os.listdir(parent))
+                except OSError:
+                    taken = set()
+                self._dir_names[parent] = taken
+
+            for counter in range(1, 1000):  # Safety limit of 999 duplicates
                 new_name = f"{base_name}_{counter:03d}{extension}"
+                if new_name in taken:
+                    continue
+                taken.add(new_name)
                 new_target = parent / new_name
                 if not new_target.exists():
                     self.logger.info(f"Renaming duplicate: {target_file} -> {new_target}")
                     return new_target
-                counter += 1
 
-                if counter > 999:  # Safety limit
-                    self.logger.error(f"Too many duplicates for {source_file}")
-                    return None
+            self.logger.error(f"Too many duplicates for {source_file}")
+            return None
 
         return target_file
 
@@ -699,7 +1027,7 @@ class FileOrganizer:
             file_path (Path): File to backup
         """
         backup_dir = file_path.parent / "backup"
-        backup_dir.mkdir(exist_ok=True)
+        self._ensure_directory(backup_dir)
 
         backup_file = backup_dir / file_path.name
         counter = 1
@@ -713,7 +1041,8 @@ class FileOrganizer:
         try:
             shutil.copy2(str(file_path), str(backup_file))
             self.stats_collector.increment('backups_created')
-            self.logger.debug(f"Created backup: {backup_file}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Created backup: {backup_file}")
         except Exception as e:
             self.logger.warning(f"Failed to create backup for {file_path}: {e}")
 
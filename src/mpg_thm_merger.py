@@ -46,6 +46,14 @@ class MpgThmMerger:
         self.thumbnail_method = self.mpg_config.get('thumbnail_method', 'embedded')
         self.require_ffmpeg = self.mpg_config.get('require_ffmpeg', True)
 
+        # General processing settings, resolved once rather than per pair.
+        # Separately organized pairs are copied unless move mode is set, while
+        # the original MPG behind a merged file is removed unless copy mode is set
+        processing = config.get('processing', {})
+        self.move_files = processing.get('move_files', False)
+        self.delete_merged_mpg = processing.get('move_files', True)
+        self.dry_run = config.get('safety', {}).get('dry_run', False)
+
         # Statistics tracking
         self.stats = {
             'mpg_processed': 0,
@@ -165,7 +173,7 @@ class MpgThmMerger:
             output_dir = mpg_path.parent
 
         # Check if this is a dry run
-        if self.config.get('safety', {}).get('dry_run', False):
+        if self.dry_run:
             self.logger.info(f"[DRY RUN] Would merge {mpg_path} with {thm_path}")
             return True, mpg_path  # Return original path for dry run
 
@@ -201,8 +209,7 @@ class MpgThmMerger:
 
                 # Delete original MPG file if we created the merged file in a different directory
                 # and we're in move mode (not copy mode)
-                move_files = self.config.get('processing', {}).get('move_files', True)
-                if move_files and output_dir != mpg_path.parent:
+                if self.delete_merged_mpg and output_dir != mpg_path.parent:
                     try:
                         mpg_path.unlink()
                         self.stats['mpg_deleted'] = self.stats.get('mpg_deleted', 0) + 1
@@ -451,17 +458,17 @@ class MpgThmMerger:
         try:
             # Copy/move MPG file
             target_mpg = target_dir / mpg_path.name
-            if self.config.get('processing', {}).get('move_files', False):
-                shutil.move(str(mpg_path), str(target_mpg))
+            if self.move_files:
+                shutil.move(mpg_path, target_mpg)
             else:
-                shutil.copy2(str(mpg_path), str(target_mpg))
+                shutil.copy2(mpg_path, target_mpg)
 
             # Copy/move THM file (keep it separate)
             target_thm = target_dir / thm_path.name
-            if self.config.get('processing', {}).get('move_files', False):
-                shutil.move(str(thm_path), str(target_thm))
+            if self.move_files:
+                shutil.move(thm_path, target_thm)
             else:
-                shutil.copy2(str(thm_path), str(target_thm))
+                shutil.copy2(thm_path, target_thm)
 
             return True, target_mpg
 
@@ -27,11 +27,13 @@ try:
     from .utils.interfaces import ConfigurableMixin, LoggerMixin
     from .utils.exceptions import ConfigurationError, PhotoSorterError
     from .utils.config_validator import ConfigValidator
+    from .utils.file_scanner import walk_files
 except ImportError:
     from utils.dependency_injection import DIContainer, get_container, DefaultServiceProvider
     from utils.interfaces import ConfigurableMixin, LoggerMixin
     from utils.exceptions import ConfigurationError, PhotoSorterError
     from utils.config_validator import ConfigValidator
+    from utils.file_scanner import walk_files
 
 TQDM_AVAILABLE = importlib.util.find_spec("tqdm") is not None
 
@@ -308,37 +310,37 @@ class PhotosSorter(ConfigurableMixin, LoggerMixin):
             video_groups = []
             mpg_mergeable = 0
             
-            for file_path in directory_path.rglob('*'):
-                if file_path.is_file():
-                    ext = file_path.suffix.lower()
-                    if ext in extensions:
-                        total_files += 1
-                        size = file_path.stat().st_size
-                        total_size += size
-                        
-                        # Update by extension stats
-                        if ext not in by_extension:
-                            by_extension[ext] = {'count': 0, 'size': 0}
-                        by_extension[ext]['count'] += 1
-                        by_extension[ext]['size'] += size
-                        
-                        # Categorize files
-                        if ext in image_extensions:
-                            total_images += 1
-                        elif ext in video_extensions:
-                            total_videos += 1
-                            # Check for MPG files that could be merged
-                            if ext in {'.mpg', '.mpeg'}:
-                                thm_path = file_path.with_suffix('.THM')
-                                if thm_path.exists():
-                                    mpg_mergeable += 1
-                                    video_groups.append({
-                                        'video': str(file_path),
-                                        'thumbnail_count': 1,
-                                        'processing_type': 'mpg_merge'
-                                    })
-                        elif ext == '.thm':
-                            total_thumbnails += 1
+            for entry in walk_files(directory_path):
+                file_path = Path(entry.path)
+                ext = file_path.suffix.lower()
+                if ext in extensions:
+                    total_files += 1
+                    size = entry.stat().st_size
+                    total_size += size
+                    
+                    # Update by extension stats
+                    if ext not in by_extension:
+                        by_extension[ext] = {'count': 0, 'size': 0}
+                    by_extension[ext]['count'] += 1
+                    by_extension[ext]['size'] += size
+                    
+                    # Categorize files
+                    if ext in image_extensions:
+                        total_images += 1
+                    elif ext in video_extensions:
+                        total_videos += 1
+                        # Check for MPG files that could be merged
+                        if ext in {'.mpg', '.mpeg'}:
+                            thm_path = file_path.with_suffix('.THM')
+                            if thm_path.exists():
+                                mpg_mergeable += 1
+                                video_groups.append({
+                                    'video': str(file_path),
+                                    'thumbnail_count': 1,
+                                    'processing_type': 'mpg_merge'
+                                })
+                    elif ext == '.thm':
+                        total_thumbnails += 1
             
             return {
                 'total_files': total_files,
@@ -395,6 +397,7 @@ Examples:
   %(prog)s                                    # Use default config
   %(prog)s --source /path/to/photos           # Override source directory
   %(prog)s --dry-run                          # Preview what would be done
+  %(prog)s --jobs 4                           # Extract EXIF with 4 processes
   %(prog)s --scan /path/to/photos             # Just scan directory
   %(prog)s --test-exif photo.jpg              # Test EXIF extraction
   %(prog)s --test-exif video.mpg              # Test video metadata extraction
@@ -428,6 +431,12 @@ Examples:
         help='Skip confirmation prompt'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Number of processes for EXIF extraction (default: CPU count, at most 8)'
+    )
+
     parser.add_argument(
         '--scan',
         help='Scan directory and show statistics'
@@ -456,6 +465,9 @@ def main():
         # Initialize the sorter
         sorter = PhotosSorter(args.config)
 
+        if args.jobs:
+            sorter.config.setdefault('performance', {})['jobs'] = max(1, args.jobs)
+
         # Handle different modes
         if args.scan:
             # Scan mode
@@ -13,6 +13,8 @@ from .exceptions import (
     FFmpegError, CacheError, StatisticsError, handle_exception, format_error_report
 )
 from .config_validator import ConfigValidator
+from .file_copy import copy_file_fast
+from .file_scanner import SKIP_DIRS, walk_files
 from .interfaces import (
     DateExtractor, FileProcessor, StatisticsProvider, FileGrouper, BatchProcessor,
     MediaFileDiscoverer, CacheProvider, ProgressReporter, ErrorHandler,
@@ -29,6 +31,8 @@ __all__ = [
     'StatisticsCollector', 'ProcessingStats',
     # Configuration
     'ConfigValidator',
+    # File discovery and copying
+    'SKIP_DIRS', 'walk_files', 'copy_file_fast',
     # Exceptions
     'PhotoSorterError', 'ConfigurationError', 'PhotoSorterFileNotFoundError', 'DirectoryNotFoundError',
     'PhotoSorterPermissionError', 'ExifError', 'VideoProcessingError', 'MergeError', 'DependencyError',
@@ -87,7 +87,11 @@ class ConfigValidator:
         self.performance_schema = {
             'batch_size': {'type': int, 'min': 1, 'max': 10000, 'default': 100},
             'show_progress': {'type': bool, 'default': True},
-            'worker_threads': {'type': int, 'min': 1, 'max': 32, 'default': 4}
+            'worker_threads': {'type': int, 'min': 1, 'max': 32, 'default': 4},
+            'jobs': {'type': int, 'min': 1, 'max': 64},
+            'exif_cache': {'type': bool, 'default': True},
+            'exif_cache_file': {'type': str, 'default': 'exif_cache.db'},
+            'async_io': {'type': bool, 'default': False}
         }
         
         # Safety section schema
@@ -226,8 +230,8 @@ class ConfigValidator:
         mpg_config = video_config.get('mpg_processing', {})
         
         if video_config.get('extract_video_metadata', False):
-            if not self._check_system_command('ffprobe'):
-                self.errors.append("ffprobe not found. Install ffmpeg to enable video metadata extraction.")
+            if importlib.util.find_spec('hachoir') is None and not self._check_system_command('ffprobe'):
+                self.errors.append("Neither hachoir nor ffprobe found. Install hachoir or ffmpeg to enable video metadata extraction.")
         
         if mpg_config.get('enable_merging', False) and mpg_config.get('require_ffmpeg', True):
             if not self._check_system_command('ffmpeg'):
@@ -332,12 +336,14 @@ class ConfigValidator:
     
     def _cross_validate(self, config: Dict[str, Any]):
         """Perform cross-validation between different configuration sections."""
+        import importlib.util
+
         # Check video processing dependencies
         video_config = config.get('video', {})
         if video_config.get('enabled', True):
             if video_config.get('extract_video_metadata', False):
-                if not self._check_system_command('ffprobe'):
-                    self.warnings.append("Video metadata extraction enabled but ffprobe not available")
+                if importlib.util.find_spec('hachoir') is None and not self._check_system_command('ffprobe'):
+                    self.warnings.append("Video metadata extraction enabled but neither hachoir nor ffprobe available")
             
             mpg_config = video_config.get('mpg_processing', {})
             if mpg_config.get('enable_merging', True):
@@ -463,6 +463,26 @@ class DefaultServiceProvider(ServiceProvider):
         from .statistics import StatisticsCollector
         stats_collector = StatisticsCollector()
         
+        # Wrap with the persistent cache so unchanged files are not re-parsed
+        performance_config = (config or {}).get('performance', {})
+        if performance_config.get('exif_cache', True):
+            try:
+                from ..exif_cache import CachedExifExtractor, resolve_cache_path
+            except ImportError:
+                from exif_cache import CachedExifExtractor, resolve_cache_path
+            from .exceptions import CacheError
+            
+            cache_file = resolve_cache_path(performance_config.get('exif_cache_file', 'exif_cache.db'))
+            dry_run = (config or {}).get('safety', {}).get('dry_run', False)
+            try:
+                # Dry runs use existing entries but leave the cache untouched
+                exif_extractor = CachedExifExtractor(
+                    cache_file, extractor=exif_extractor, stats_collector=stats_collector,
+                    read_only=dry_run
+                )
+            except CacheError as e:
+                logging.getLogger(__name__).warning(f"EXIF cache disabled: {e}")
+        
         organizer = FileOrganizer(
             config=config,
             exif_extractor=exif_extractor,
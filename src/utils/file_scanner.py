@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+File Scanner Module
+
+This module provides a fast recursive directory walk based on os.scandir,
+shared by the components that discover media files.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# NAS and OS metadata directories that never contain user media
+SKIP_DIRS = frozenset({'@eaDir', 'System Volume Information', '$RECYCLE.BIN'})
+
+
+def walk_files(directory: Union[str, Path],
+               skip_dir: Optional[Callable[[os.DirEntry], bool]] = None) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries for all regular files under a directory.
+
+    File type information comes from the directory listing itself, so no extra
+    stat call is made per entry on most platforms. Symlinked directories are
+    not followed, which also protects against symlink loops. Hidden
+    directories and those listed in SKIP_DIRS are not descended into.
+
+    Args:
+        directory (Union[str, Path]): Directory to walk
+        skip_dir (Optional[Callable[[os.DirEntry], bool]]): Predicate for further
+            directories that should not be descended into
+
+    Yields:
+        os.DirEntry: Entry for each file found
+    """
+    stack = [os.fspath(directory)]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.startswith('.') or entry.name in SKIP_DIRS:
+                                continue
+                            if skip_dir is None or not skip_dir(entry):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError as e:
+                        logger.debug(f"Could not inspect {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not scan directory {current}: {e}")
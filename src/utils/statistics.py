@@ -7,6 +7,7 @@ for the PhotosSorter application.
 """
 
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -49,6 +50,8 @@ class StatisticsCollector:
         self.logger = logging.getLogger(__name__)
         self.stats = ProcessingStats()
         self._operation_log = []
+        # Counters may be updated from file operation worker threads
+        self._lock = threading.Lock()
     
     def reset(self):
         """Reset all statistics."""
@@ -75,9 +78,11 @@ class StatisticsCollector:
             amount (int): Amount to increment by (default: 1)
         """
         if hasattr(self.stats, counter):
-            current_value = getattr(self.stats, counter)
-            setattr(self.stats, counter, current_value + amount)
-            self.logger.debug(f"Incremented {counter} by {amount} (now: {current_value + amount})")
+            with self._lock:
+                current_value = getattr(self.stats, counter)
+                setattr(self.stats, counter, current_value + amount)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Incremented {counter} by {amount} (now: {current_value + amount})")
         else:
             self.logger.warning(f"Unknown counter: {counter}")
     
@@ -91,7 +96,8 @@ class StatisticsCollector:
         """
         if hasattr(self.stats, counter):
             setattr(self.stats, counter, value)
-            self.logger.debug(f"Set {counter} to {value}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Set {counter} to {value}")
         else:
             self.logger.warning(f"Unknown counter: {counter}")
     
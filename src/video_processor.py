@@ -7,20 +7,48 @@ It can extract dates from video metadata and process video files together
 with their thumbnail files (.thm, .jpg, etc.).
 """
 
+import importlib.util
 import json
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from .exif_extractor import ExifExtractor
     from .mpg_thm_merger import MpgThmMerger
+    from .utils.file_scanner import walk_files
 except ImportError:
     from exif_extractor import ExifExtractor
     from mpg_thm_merger import MpgThmMerger
+    from utils.file_scanner import walk_files
+
+# hachoir reads container headers in-process, avoiding an ffprobe spawn per video
+HACHOIR_AVAILABLE = importlib.util.find_spec("hachoir") is not None
+
+
+@lru_cache(maxsize=None)
+def _hachoir():
+    """
+    Import the hachoir parser and metadata functions on first use.
+
+    Returns:
+        Tuple of (createParser, extractMetadata), or None if hachoir cannot be imported
+    """
+    if not HACHOIR_AVAILABLE:
+        return None
+    try:
+        import hachoir.core.config as hachoir_config
+        from hachoir.metadata import extractMetadata
+        from hachoir.parser import createParser
+    except ImportError:
+        return None
+    hachoir_config.quiet = True
+    return createParser, extractMetadata
 
 
 class VideoProcessor:
@@ -54,10 +82,11 @@ class VideoProcessor:
         # Video extensions
         self.video_extensions = {'.mpg', '.mpeg', '.mp4', '.avi', '.mov', '.mkv', '.wmv'}
 
-        # Check for ffprobe availability
+        # Check for metadata backends (hachoir in-process, ffprobe as subprocess)
+        self.hachoir_available = HACHOIR_AVAILABLE
         self.ffprobe_available = self._check_ffprobe_available()
-        if self.extract_video_metadata and not self.ffprobe_available:
-            self.logger.warning("ffprobe not available. Video metadata extraction disabled.")
+        if self.extract_video_metadata and not (self.hachoir_available or self.ffprobe_available):
+            self.logger.warning("Neither hachoir nor ffprobe available. Video metadata extraction disabled.")
             self.extract_video_metadata = False
 
     def _check_ffprobe_available(self) -> bool:
@@ -111,36 +140,39 @@ class VideoProcessor:
         if not self.enabled:
             return []
 
+        return self.pair_video_entries(walk_files(directory))
+
+    def pair_video_entries(self, entries: Iterable[os.DirEntry]) -> List[Tuple[Path, List[Path], str]]:
+        """
+        Pair video files with their thumbnails from already listed directory entries.
+
+        Lets a caller that walks the tree for other media as well hand over
+        its entries instead of walking again. Entries that are neither videos
+        nor thumbnails are ignored.
+
+        Args:
+            entries (Iterable[os.DirEntry]): File entries to pair
+
+        Returns:
+            List[Tuple[Path, List[Path], str]]: List of (video_file, [thumbnail_files], processing_type)
+        """
         video_files = {}
         thumbnail_files = {}
-        found_video_files = set()  # Track unique video files to avoid duplicates
-
-        # Scan directory for video files
-        for ext in self.video_extensions:
-            # Search for both lowercase and uppercase versions
-            patterns = [f"**/*{ext}", f"**/*{ext.upper()}"]
-            for pattern in patterns:
-                for file_path in directory.rglob(pattern):
-                    if file_path.is_file() and file_path not in found_video_files:
-                        found_video_files.add(file_path)
-                        file_stem = file_path.stem.lower()
-                        if file_stem not in video_files:
-                            video_files[file_stem] = []
-                        video_files[file_stem].append(file_path)
-        
-        # Scan directory for thumbnail files
-        found_thumbnail_files = set()  # Track unique thumbnail files to avoid duplicates
-        for ext in self.thumbnail_extensions:
-            # Search for both lowercase and uppercase versions
-            patterns = [f"**/*{ext}", f"**/*{ext.upper()}"]
-            for pattern in patterns:
-                for file_path in directory.rglob(pattern):
-                    if file_path.is_file() and file_path not in found_thumbnail_files:
-                        found_thumbnail_files.add(file_path)
-                        file_stem = file_path.stem.lower()
-                        if file_stem not in thumbnail_files:
-                            thumbnail_files[file_stem] = []
-                        thumbnail_files[file_stem].append(file_path)
+
+        for entry in entries:
+            file_stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            is_video = ext in self.video_extensions
+            is_thumbnail = ext in self.thumbnail_extensions
+            if not (is_video or is_thumbnail):
+                continue
+
+            file_path = Path(entry.path)
+            file_stem = file_stem.lower()
+            if is_video:
+                video_files.setdefault(file_stem, []).append(file_path)
+            if is_thumbnail:
+                thumbnail_files.setdefault(file_stem, []).append(file_path)
 
         # Match videos with their thumbnails
         pairs = []
@@ -186,8 +218,8 @@ class VideoProcessor:
             Optional[datetime]: Extracted date or None
         """
         # Try video metadata extraction first
-        if self.extract_video_metadata and self.ffprobe_available:
-            date = self._extract_date_with_ffprobe(video_path)
+        if self.extract_video_metadata:
+            date = self._extract_date_from_metadata(video_path)
             if date:
                 self.logger.debug(f"Extracted date from video metadata: {video_path}")
                 return date
@@ -200,6 +232,60 @@ class VideoProcessor:
             self.logger.debug(f"Could not get file date for {video_path}: {e}")
             return None
 
+    def _extract_date_from_metadata(self, video_path: Path) -> Optional[datetime]:
+        """
+        Extract date from video metadata with the fastest available backend.
+
+        Args:
+            video_path (Path): Path to video file
+
+        Returns:
+            Optional[datetime]: Extracted date or None
+        """
+        if self.hachoir_available:
+            date = self._extract_date_with_hachoir(video_path)
+            if date:
+                return date
+
+        if self.ffprobe_available:
+            return self._extract_date_with_ffprobe(video_path)
+
+        return None
+
+    def _extract_date_with_hachoir(self, video_path: Path) -> Optional[datetime]:
+        """
+        Extract date from video container headers using hachoir.
+
+        Args:
+            video_path (Path): Path to video file
+
+        Returns:
+            Optional[datetime]: Extracted date or None
+        """
+        hachoir = _hachoir()
+        if hachoir is None:
+            return None
+        createParser, extractMetadata = hachoir
+
+        try:
+            parser = createParser(str(video_path))
+            if not parser:
+                return None
+
+            with parser:
+                metadata = extractMetadata(parser)
+
+            if metadata and metadata.has('creation_date'):
+                date = metadata.get('creation_date')
+                # Containers store 0 (1904/1970 epoch) when the date was never set
+                if isinstance(date, datetime) and date.year > 1970:
+                    return date.replace(tzinfo=None)
+
+        except Exception as e:
+            self.logger.debug(f"hachoir failed to read metadata from {video_path}: {e}")
+
+        return None
+
     def _extract_date_with_ffprobe(self, video_path: Path) -> Optional[datetime]:
         """
         Extract date from video metadata using ffprobe.
@@ -211,12 +297,13 @@ class VideoProcessor:
             Optional[datetime]: Extracted date or None
         """
         try:
+            # Only the container and stream tags are needed for the date, so
+            # skip serializing codec parameters and the other format fields
             cmd = [
                 'ffprobe',
                 '-v', 'quiet',
                 '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
+                '-show_entries', 'format_tags:stream_tags',
                 str(video_path)
             ]
 
@@ -347,6 +434,46 @@ class VideoProcessor:
             self.logger.debug(f"Could not get file date for {video_path}: {e}")
             return None
 
+    def iter_video_group_dates(self, video_groups: List[Tuple[Path, List[Path], str]],
+                               max_workers: int = 1) -> Iterator[Optional[datetime]]:
+        """
+        Yield the date of each video group, in order, extracting several at once.
+
+        Without hachoir every video costs an ffprobe process. Spawning and
+        waiting for it releases the GIL, so threads keep up to max_workers
+        probes running at the same time instead of paying for each in turn.
+
+        Args:
+            video_groups (List[Tuple[Path, List[Path], str]]): (video_file, [thumbnail_files], processing_type)
+            max_workers (int): Number of groups processed concurrently (1 = serial)
+
+        Yields:
+            Optional[datetime]: Best available date for each group
+        """
+        if max_workers <= 1 or len(video_groups) <= 1:
+            yield from map(self._extract_group_date_safe, video_groups)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(self._extract_group_date_safe, video_groups)
+
+    def _extract_group_date_safe(self, video_group: Tuple[Path, List[Path], str]) -> Optional[datetime]:
+        """
+        Extract the date of one video group, logging instead of raising on failure.
+
+        Args:
+            video_group (Tuple[Path, List[Path], str]): (video_file, [thumbnail_files], processing_type)
+
+        Returns:
+            Optional[datetime]: Best available date or None
+        """
+        video_file, thumbnail_files, _ = video_group
+        try:
+            return self.extract_date_from_video_group(video_file, thumbnail_files)
+        except Exception as e:
+            self.logger.error(f"Error extracting date for video group {video_file}: {e}")
+            return None
+
     def get_video_file_info(self, video_path: Path, thumbnail_paths: List[Path] = None) -> Dict:
         """
         Get information about a video file and its thumbnails.
@@ -372,6 +499,7 @@ class VideoProcessor:
             'total_size': 0,
             'extracted_date': None,
             'ffprobe_available': self.ffprobe_available,
+            'hachoir_available': self.hachoir_available,
             'video_metadata_available': False,
             'can_merge_mpg_thm': False,
             'mpg_merger_available': False
@@ -401,14 +529,18 @@ class VideoProcessor:
             except Exception as e:
                 self.logger.debug(f"Error getting thumbnail file size: {e}")
 
-        # Extract date
-        info['extracted_date'] = self.extract_date_from_video_group(video_path, thumbnail_paths)
-
-        # Check if video metadata is available
-        if self.is_video_file(video_path) and self.ffprobe_available:
-            video_metadata_date = self._extract_date_with_ffprobe(video_path)
+        # Probe video metadata once and reuse it for the extracted date
+        video_metadata_date = None
+        if self.is_video_file(video_path) and (self.hachoir_available or self.ffprobe_available):
+            video_metadata_date = self._extract_date_from_metadata(video_path)
             info['video_metadata_available'] = video_metadata_date is not None
 
+        # Extract date
+        if self.extract_video_metadata and video_metadata_date:
+            info['extracted_date'] = video_metadata_date
+        else:
+            info['extracted_date'] = self.extract_date_from_video_group(video_path, thumbnail_paths)
+
         return info
 
 
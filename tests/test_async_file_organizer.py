@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Async File Organizer
+
+This module contains tests for the asynchronous photo organizer.
+"""
+
+import asyncio
+import errno
+import unittest
+import tempfile
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image
+
+import async_file_organizer
+from async_file_organizer import AsyncFileOrganizer
+
+
+def create_jpeg(path: Path, date_time: str):
+    """Create a small JPEG file with the given EXIF DateTime tag."""
+    exif = Image.Exif()
+    exif[0x0132] = date_time
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new('RGB', (16, 16)).save(path, exif=exif)
+
+
+class TestAsyncFileOrganizer(unittest.TestCase):
+    """Test cases for AsyncFileOrganizer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "source"
+        self.target_dir = self.temp_dir / "target"
+        self.source_dir.mkdir()
+        self.config = {
+            'date_format': 'YYYY/MM/DD',
+            'supported_extensions': ['.jpg'],
+            'processing': {'move_files': False, 'duplicate_handling': 'rename'},
+            'safety': {'dry_run': False},
+            'performance': {'jobs': 1, 'exif_cache': False},
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def organize(self) -> dict:
+        """Run the organizer over the source directory."""
+        organizer = AsyncFileOrganizer(self.config, max_workers=2)
+        return asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+    def test_discovery_skips_organized_directories(self):
+        """Test that nested files are found and date-named directories are skipped."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "trip" / "b.JPG", "2021:03:05 10:00:00")
+        create_jpeg(self.source_dir / "2020" / "c.jpg", "2020:01:01 10:00:00")
+
+        organizer = AsyncFileOrganizer(self.config)
+        files = asyncio.run(organizer._discover_files_async(self.source_dir))
+
+        self.assertEqual([f.name for f in files], ["a.jpg", "b.JPG"])
+
+    def test_copies_into_date_directories(self):
+        """Test that photos are copied into YYYY/MM/DD directories."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "trip" / "b.jpg", "2022:11:05 10:00:00")
+
+        stats = self.organize()
+
+        self.assertEqual(stats['copied'], 2)
+        self.assertEqual(stats['errors'], 0)
+        self.assertTrue((self.target_dir / "2021" / "03" / "04" / "a.jpg").exists())
+        self.assertTrue((self.target_dir / "2022" / "11" / "05" / "b.jpg").exists())
+        self.assertTrue((self.source_dir / "a.jpg").exists())
+        self.assertEqual((self.target_dir / "2021" / "03" / "04" / "a.jpg").stat().st_mtime_ns,
+                         (self.source_dir / "a.jpg").stat().st_mtime_ns)
+
+    def test_dates_extracted_in_worker_processes(self):
+        """Test that dates extracted by the EXIF process pool keep input order."""
+        for day in range(1, 6):
+            create_jpeg(self.source_dir / f"{day}.jpg", f"2021:03:0{day} 10:00:00")
+        self.config['performance'].update(jobs=2)
+
+        organizer = AsyncFileOrganizer(self.config)
+        files = asyncio.run(organizer._discover_files_async(self.source_dir))
+        try:
+            dates = asyncio.run(organizer._extract_dates_async(files))
+        finally:
+            asyncio.run(organizer._cleanup())
+
+        self.assertEqual([date.day for date in dates], [1, 2, 3, 4, 5])
+
+    def test_dates_served_from_persistent_cache(self):
+        """Test that a second run parses only files that are new or changed."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "b.jpg", "2021:03:05 10:00:00")
+        self.config['performance'].update(exif_cache=True,
+                                          exif_cache_file=str(self.temp_dir / "exif_cache.db"))
+        self.organize()
+        create_jpeg(self.source_dir / "c.jpg", "2021:03:06 10:00:00")
+
+        organizer = AsyncFileOrganizer(self.config)
+        files = asyncio.run(organizer._discover_files_async(self.source_dir))
+        with patch.object(organizer, '_parse_dates_async', wraps=organizer._parse_dates_async) as parse:
+            dates = asyncio.run(organizer._extract_dates_async(files))
+        asyncio.run(organizer._cleanup())
+
+        self.assertEqual([date.day for date in dates], [4, 5, 6])
+        self.assertEqual([path.name for path in parse.call_args.args[0]], ["c.jpg"])
+
+    def test_dry_run_leaves_cache_untouched(self):
+        """Test that a dry run neither creates nor writes the persistent cache."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        cache_file = self.temp_dir / "cache" / "exif_cache.db"
+        self.config['performance'].update(exif_cache=True, exif_cache_file=str(cache_file))
+        self.config['safety']['dry_run'] = True
+
+        stats = self.organize()
+
+        self.assertEqual(stats['copied'], 1)
+        self.assertFalse(cache_file.parent.exists())
+
+    def test_move_across_file_systems(self):
+        """Test that a cross-device move falls back to copy and delete."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        self.config['processing']['move_files'] = True
+
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch.object(async_file_organizer.os, 'replace', side_effect=cross_device) as replace:
+            stats = self.organize()
+
+        self.assertEqual(replace.call_count, 1)
+        self.assertEqual(stats['moved'], 1)
+        self.assertEqual(stats['errors'], 0)
+        self.assertFalse((self.source_dir / "a.jpg").exists())
+        self.assertTrue((self.target_dir / "2021" / "03" / "04" / "a.jpg").exists())
+
+    def test_dates_extracted_in_batches(self):
+        """Test that dates are extracted with one call per batch of files."""
+        for day in range(1, 6):
+            create_jpeg(self.source_dir / f"{day}.jpg", f"2021:03:0{day} 10:00:00")
+        self.config['performance'].update(batch_size=2)
+
+        organizer = AsyncFileOrganizer(self.config)
+        files = asyncio.run(organizer._discover_files_async(self.source_dir))
+        with patch.object(organizer.exif_extractor, 'extract_dates',
+                          wraps=organizer.exif_extractor.extract_dates) as extract_dates:
+            async def collect():
+                return [task async for task in organizer._generate_tasks_async(files, self.target_dir)]
+            tasks = asyncio.run(collect())
+
+        self.assertEqual(extract_dates.call_count, 3)
+        self.assertEqual([task.target_path.parent.name for task in tasks], ["01", "02", "03", "04", "05"])
+
+    def test_processes_more_files_than_pending_limit(self):
+        """Test that every file is processed when tasks outnumber the pending limit."""
+        for day in range(1, 10):
+            create_jpeg(self.source_dir / f"{day}.jpg", f"2021:03:0{day} 10:00:00")
+
+        organizer = AsyncFileOrganizer(self.config, max_workers=1)
+        stats = asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+        self.assertEqual(stats['copied'], 9)
+        self.assertEqual(stats['errors'], 0)
+        self.assertFalse(organizer._pending_tasks)
+
+    def test_dry_run_touches_nothing(self):
+        """Test that a dry run counts files without starting workers or writing."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        self.config['safety'] = {'dry_run': True}
+
+        organizer = AsyncFileOrganizer(self.config)
+        with patch.object(organizer, '_run_task_async') as run_task:
+            stats = asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+        run_task.assert_not_called()
+        self.assertEqual(stats['processed'], 1)
+        self.assertEqual(stats['copied'], 1)
+        self.assertFalse((self.target_dir / "2021").exists())
+
+    def test_date_formats(self):
+        """Test target directories for each supported date format."""
+        date = datetime(2021, 3, 4, 10, 0, 0)
+        expected = {
+            'YYYY/MM/DD': self.target_dir / "2021" / "03" / "04",
+            'YYYY/MM': self.target_dir / "2021" / "03",
+            'YYYY-MM-DD': self.target_dir / "2021-03-04",
+            'YYYY-MM': self.target_dir / "2021-03",
+            'unknown': self.target_dir / "2021" / "03" / "04",
+        }
+        for date_format, target in expected.items():
+            self.config['date_format'] = date_format
+            organizer = AsyncFileOrganizer(self.config)
+            self.assertEqual(organizer._get_target_directory_for_date(date, self.target_dir), target)
+
+    def test_target_directory_created_once(self):
+        """Test that a date directory shared by several files is created only once."""
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            create_jpeg(self.source_dir / name, "2021:03:04 10:00:00")
+
+        makedirs = async_file_organizer.aiofiles.os.makedirs
+        with patch.object(async_file_organizer.aiofiles.os, 'makedirs', wraps=makedirs) as mock_makedirs:
+            stats = self.organize()
+
+        self.assertEqual(stats['copied'], 3)
+        created = [call.args[0] for call in mock_makedirs.call_args_list]
+        self.assertEqual(created.count(self.target_dir / "2021" / "03" / "04"), 1)
+
+    def test_only_failures_are_recorded(self):
+        """Test that results are kept for failed tasks only."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "b.jpg", "2021:03:05 10:00:00")
+        self.config['performance'].update(retry_attempts=1)
+
+        organizer = AsyncFileOrganizer(self.config)
+        copy_file = organizer._copy_file_async
+
+        async def flaky_copy(source, target, size=None):
+            if source.name == "b.jpg":
+                raise OSError("disk full")
+            await copy_file(source, target, size)
+
+        with patch.object(organizer, '_copy_file_async', side_effect=flaky_copy):
+            stats = asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+        self.assertEqual(stats['copied'], 1)
+        self.assertEqual(stats['errors'], 1)
+        failed = organizer.get_failed_results()
+        self.assertEqual([result.task.source_path.name for result in failed], ["b.jpg"])
+        self.assertIn("disk full", failed[0].error)
+
+    def test_permanent_errors_are_not_retried(self):
+        """Test that a permission error fails the task on the first attempt."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+
+        organizer = AsyncFileOrganizer(self.config)
+        denied = PermissionError(errno.EACCES, "Permission denied")
+        with patch.object(organizer, '_copy_file_async', side_effect=denied) as copy_file:
+            stats = asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+        self.assertEqual(copy_file.call_count, 1)
+        self.assertEqual(stats['errors'], 1)
+
+    def test_transient_errors_are_retried(self):
+        """Test that a busy resource is retried until the copy succeeds."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+
+        organizer = AsyncFileOrganizer(self.config)
+        busy = OSError(errno.EBUSY, "Device or resource busy")
+        with patch.object(async_file_organizer, '_RETRY_BACKOFFS', (0,)), \
+                patch.object(organizer, '_copy_file_async', side_effect=[busy, busy, None]) as mock_copy:
+            stats = asyncio.run(organizer.organize_photos_async(str(self.source_dir), str(self.target_dir)))
+
+        self.assertEqual(mock_copy.call_count, 3)
+        self.assertEqual(stats['copied'], 1)
+        self.assertEqual(stats['errors'], 0)
+
+    def test_cancel_stops_in_flight_tasks(self):
+        """Test that cancelling does not wait for the running batch to finish."""
+        for name in ("a.jpg", "b.jpg"):
+            create_jpeg(self.source_dir / name, "2021:03:04 10:00:00")
+
+        async def hanging_copy(source, target, size=None):
+            await asyncio.sleep(60)
+
+        async def run_and_cancel():
+            organizer = AsyncFileOrganizer(self.config)
+            with patch.object(organizer, '_copy_file_async', side_effect=hanging_copy):
+                run = asyncio.ensure_future(
+                    organizer.organize_photos_async(str(self.source_dir), str(self.target_dir))
+                )
+                while organizer._active_tasks == 0:
+                    await asyncio.sleep(0.01)
+                await organizer.cancel_processing()
+                return await asyncio.wait_for(run, timeout=5)
+
+        stats = asyncio.run(run_and_cancel())
+
+        self.assertEqual(stats['copied'], 0)
+
+    def test_cancel_during_date_prefetch_with_cache(self):
+        """Test that cancelling waits for the next batch's date lookup before closing the cache."""
+        for day in range(1, 5):
+            create_jpeg(self.source_dir / f"{day}.jpg", f"2021:03:0{day} 10:00:00")
+        self.config['performance'].update(batch_size=2, exif_cache=True,
+                                          exif_cache_file=str(self.temp_dir / "exif_cache.db"))
+
+        async def hanging_copy(source, target, size=None):
+            await asyncio.sleep(60)
+
+        async def run_and_cancel():
+            organizer = AsyncFileOrganizer(self.config)
+            parse_dates = organizer._parse_dates_async
+
+            async def slow_parse(file_paths):
+                await asyncio.sleep(0.1)
+                return await parse_dates(file_paths)
+
+            with patch.object(organizer, '_copy_file_async', side_effect=hanging_copy), \
+                    patch.object(organizer, '_parse_dates_async', side_effect=slow_parse):
+                run = asyncio.ensure_future(
+                    organizer.organize_photos_async(str(self.source_dir), str(self.target_dir))
+                )
+                while organizer._active_tasks == 0:
+                    await asyncio.sleep(0.01)
+                await organizer.cancel_processing()
+                stats = await asyncio.wait_for(run, timeout=5)
+            return organizer, stats
+
+        organizer, stats = asyncio.run(run_and_cancel())
+
+        self.assertIsNone(organizer.exif_cache)
+        self.assertEqual(stats['copied'], 0)
+        self.assertEqual(stats['errors'], 0)
+
+        # The first batch's dates were written before the cache was closed
+        organizer = AsyncFileOrganizer(self.config)
+        files = asyncio.run(organizer._discover_files_async(self.source_dir))
+        hits, _ = organizer.exif_cache.lookup_dates([str(path) for path in files])
+        asyncio.run(organizer._cleanup())
+        self.assertGreaterEqual(len(hits), 2)
+
+    def test_cleanup_without_cancel_futures(self):
+        """Test that cleanup only passes cancel_futures where the executor accepts it."""
+        for version, expected in (((3, 8, 18), {'wait': True}),
+                                  ((3, 9, 0), {'wait': True, 'cancel_futures': True})):
+            with self.subTest(version=version):
+                organizer = AsyncFileOrganizer(self.config)
+                thread_pool = organizer._thread_pool
+                with patch.object(async_file_organizer.sys, 'version_info', version), \
+                        patch.object(thread_pool, 'shutdown', wraps=thread_pool.shutdown) as shutdown:
+                    asyncio.run(organizer._cleanup())
+
+                shutdown.assert_called_once_with(**expected)
+                self.assertIsNone(organizer._thread_pool)
+
+    def test_same_name_from_one_run_is_renamed(self):
+        """Test that two sources with the same name and date do not overwrite each other."""
+        create_jpeg(self.source_dir / "one" / "photo.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "two" / "photo.jpg", "2021:03:04 11:00:00")
+
+        stats = self.organize()
+
+        self.assertEqual(stats['copied'], 2)
+        day_dir = self.target_dir / "2021" / "03" / "04"
+        self.assertEqual(sorted(p.name for p in day_dir.iterdir()), ["photo.jpg", "photo_001.jpg"])
+
+    def test_duplicate_rename_picks_first_free_name(self):
+        """Test that renaming skips names already present in the target directory."""
+        target = self.target_dir / "photo.jpg"
+        self.target_dir.mkdir()
+        for name in ("photo.jpg", "photo_001.jpg", "photo_002.jpg", "photo_004.jpg"):
+            (self.target_dir / name).touch()
+
+        organizer = AsyncFileOrganizer(self.config)
+        renamed = asyncio.run(organizer._handle_duplicate_async(target))
+
+        self.assertEqual(renamed, self.target_dir / "photo_003.jpg")
+
+
+class TestRunAsync(unittest.TestCase):
+    """Test cases for the event loop runner."""
+
+    def test_runs_without_uvloop(self):
+        """Test that the standard event loop is used when uvloop is missing."""
+        async def answer():
+            return 42
+
+        with patch.object(async_file_organizer, 'uvloop', None):
+            self.assertEqual(async_file_organizer.run_async(answer()), 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+Test Suite for EXIF Extractor
+
+This module contains tests for date extraction from image metadata.
+"""
+
+import io
+import os
+import subprocess
+import unittest
+import tempfile
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image
+
+import exif_extractor
+from exif_extractor import ExifExtractor
+from exif_cache import CachedExifExtractor, resolve_cache_path
+from utils.statistics import StatisticsCollector
+
+
+def create_jpeg(path: Path, date_time: str = None, date_time_original: str = None, padding: int = 0,
+                date_time_digitized: str = None):
+    """
+    Create a small JPEG file with the given EXIF date tags.
+
+    If padding is given, APP2 segments of that total size are placed
+    between SOI and the EXIF segment.
+    """
+    exif = Image.Exif()
+    if date_time:
+        exif[0x0132] = date_time
+    if date_time_original:
+        exif.get_ifd(exif_extractor.EXIF_IFD_POINTER)[0x9003] = date_time_original
+    if date_time_digitized:
+        exif.get_ifd(exif_extractor.EXIF_IFD_POINTER)[0x9004] = date_time_digitized
+    Image.new('RGB', (16, 16)).save(path, exif=exif)
+
+    if padding:
+        data = path.read_bytes()
+        filler = b''
+        while padding > 0:
+            chunk = min(padding, 65533)
+            filler += b'\xff\xe2' + (chunk + 2).to_bytes(2, 'big') + bytes(chunk)
+            padding -= chunk
+        path.write_bytes(data[:2] + filler + data[2:])
+
+
+class TestPartialRead(unittest.TestCase):
+    """Test cases for reading EXIF from the JPEG header only."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.extractor = ExifExtractor()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_extract_date_time_original(self):
+        """Test that DateTimeOriginal is found in the EXIF sub-IFD."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time_original='2019:03:04 05:06:07')
+
+        date = self.extractor.extract_date_from_file(str(photo))
+        self.assertEqual(date, datetime(2019, 3, 4, 5, 6, 7))
+
+    def test_segment_beyond_partial_window(self):
+        """Test fallback to a full read when APP1 is outside the first window."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2020:02:02 10:00:00', padding=exif_extractor.PARTIAL_READ_BYTES)
+
+        date = self.extractor.extract_date_from_file(str(photo))
+        self.assertEqual(date, datetime(2020, 2, 2, 10, 0, 0))
+
+    def test_summary_reuses_parsed_exif(self):
+        """Test that get_exif_summary decodes EXIF once per file, shared across extractors."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time_original='2019:03:04 05:06:07')
+        self.extractor.clear_cache()
+
+        summary = self.extractor.get_exif_summary(str(photo))
+        ExifExtractor().get_exif_summary(str(photo))
+        cache_info = exif_extractor._read_pillow_exif_cached.cache_info()
+
+        self.assertEqual(summary['datetime_tags_found'], ['DateTimeOriginal'])
+        self.assertEqual((cache_info.misses, cache_info.hits), (1, 1))
+
+    def test_pillow_reads_date_tags_by_id(self):
+        """Test that Pillow extraction finds dates in IFD0 and the EXIF sub-IFD."""
+        png = self.temp_dir / "photo.png"
+        create_jpeg(png, date_time='2017:01:02 03:04:05')
+        jpeg = self.temp_dir / "photo.jpg"
+        create_jpeg(jpeg, date_time_original='2018:07:08 09:10:11')
+
+        self.assertEqual(self.extractor._extract_with_pillow(png), datetime(2017, 1, 2, 3, 4, 5))
+        self.assertEqual(self.extractor._extract_with_pillow(jpeg), datetime(2018, 7, 8, 9, 10, 11))
+
+    def test_exifread_finds_date_original(self):
+        """Test that exifread extraction, which stops early, still reaches DateTimeOriginal."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time_original='2016:05:06 07:08:09')
+
+        self.assertEqual(self.extractor._extract_with_exifread(photo), datetime(2016, 5, 6, 7, 8, 9))
+
+    def test_exifread_finds_date_digitized(self):
+        """Test that exifread reaches DateTimeDigitized, which follows the early stop tag."""
+        cases = {
+            'digitized only': None,
+            'unusable original': '0000:00:00 00:00:00',
+        }
+        for name, date_time_original in cases.items():
+            with self.subTest(name):
+                photo = self.temp_dir / "photo.jpg"
+                create_jpeg(photo, date_time_original=date_time_original,
+                            date_time_digitized='2016:05:06 07:08:09')
+
+                self.assertEqual(self.extractor._extract_with_exifread(photo), datetime(2016, 5, 6, 7, 8, 9))
+
+    def test_exifread_parses_header_from_memory(self):
+        """Test that exifread reads only the header window when it holds the date."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2015:04:05 06:07:08')
+        with open(photo, 'ab') as f:
+            f.write(bytes(exif_extractor.PARTIAL_READ_BYTES))
+
+        process = self.extractor._process_exifread
+        with patch.object(self.extractor, '_process_exifread', wraps=process) as mock_process:
+            date = self.extractor._extract_with_exifread(photo)
+
+        self.assertEqual(date, datetime(2015, 4, 5, 6, 7, 8))
+        self.assertEqual(mock_process.call_count, 1)
+        self.assertIsInstance(mock_process.call_args.args[0], io.BytesIO)
+
+    def test_exifread_falls_back_to_whole_file(self):
+        """Test that the whole file is parsed when the header window has no date."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2015:04:05 06:07:08')
+        with open(photo, 'ab') as f:
+            f.write(bytes(exif_extractor.PARTIAL_READ_BYTES))
+
+        process = self.extractor._process_exifread
+        header_without_tags = lambda f: {} if isinstance(f, io.BytesIO) else process(f)
+        with patch.object(self.extractor, '_process_exifread', side_effect=header_without_tags) as mock_process:
+            date = self.extractor._extract_with_exifread(photo)
+
+        self.assertEqual(date, datetime(2015, 4, 5, 6, 7, 8))
+        self.assertEqual(mock_process.call_count, 2)
+
+    def test_non_jpeg_opened_once_for_all_parsers(self):
+        """Test that Pillow and exifread share one read of a non-JPEG file."""
+        png = self.temp_dir / "photo.png"
+        create_jpeg(png)
+        stat = png.stat()
+
+        with patch('builtins.open', wraps=open) as mock_open, \
+                patch.object(Image, 'open', wraps=Image.open) as mock_image_open:
+            date = self.extractor._extract_date_uncached(str(png), stat.st_size, stat.st_mtime_ns)
+
+        self.assertEqual(date, datetime.fromtimestamp(stat.st_mtime))
+        self.assertEqual(mock_open.call_count, 1)
+        self.assertIsInstance(mock_image_open.call_args.args[0], io.BytesIO)
+
+    def test_date_cache_shared_between_extractors(self):
+        """Test that a date extracted by one instance is served from cache to another."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2019:03:04 05:06:07')
+        self.extractor.clear_cache()
+
+        self.extractor.extract_date_from_file(str(photo))
+        date = ExifExtractor().extract_date_from_file(str(photo))
+
+        self.assertEqual(date, datetime(2019, 3, 4, 5, 6, 7))
+        self.assertEqual(self.extractor.cache_info().misses, 1)
+        self.assertEqual(self.extractor.cache_info().hits, 1)
+
+    def test_extract_date_from_entry_reuses_entry_stat(self):
+        """Test that a scandir entry is extracted without another os.stat call."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2019:03:04 05:06:07')
+        (self.temp_dir / "notes.txt").write_text("not an image")
+
+        with os.scandir(self.temp_dir) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        for entry in entries:
+            entry.stat()
+
+        with patch.object(exif_extractor.os, 'stat', wraps=os.stat) as mock_stat:
+            dates = [self.extractor.extract_date_from_entry(entry) for entry in entries]
+
+        self.assertEqual(dates, [None, datetime(2019, 3, 4, 5, 6, 7)])
+        mock_stat.assert_not_called()
+
+    def test_summary_opens_image_once(self):
+        """Test that get_exif_summary takes the date from the tags it already parsed."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2019:03:04 05:06:07')
+        self.extractor.clear_cache()
+
+        with patch.object(self.extractor, 'extract_date_from_file') as mock_extract, \
+                patch('builtins.open', wraps=open) as mock_open:
+            summary = self.extractor.get_exif_summary(str(photo))
+
+        self.assertEqual(summary['exif_date'], datetime(2019, 3, 4, 5, 6, 7))
+        self.assertEqual(summary['datetime_tags_found'], ['DateTime'])
+        self.assertEqual(mock_open.call_count, 1)
+        mock_extract.assert_not_called()
+
+    def test_summary_stats_file_once(self):
+        """Test that get_exif_summary reports file info from a single stat."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2019:03:04 05:06:07')
+        missing = self.temp_dir / "missing.jpg"
+
+        summary = self.extractor.get_exif_summary(str(photo))
+
+        self.assertEqual(summary['file_size'], photo.stat().st_size)
+        self.assertEqual(summary['modification_date'], datetime.fromtimestamp(photo.stat().st_mtime))
+        self.assertFalse(self.extractor.get_exif_summary(str(missing))['file_exists'])
+
+    def test_fast_date_only_skips_pillow(self):
+        """Test that JPEG dates are read without decoding EXIF through Pillow."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time_original='2019:03:04 05:06:07')
+        self.extractor.clear_cache()
+
+        date = self.extractor.extract_date_from_file(str(photo))
+
+        self.assertEqual(date, datetime(2019, 3, 4, 5, 6, 7))
+        self.assertEqual(exif_extractor._read_pillow_exif_cached.cache_info().misses, 0)
+
+    def test_fast_date_only_prefers_datetime(self):
+        """Test that the fast parser honours the datetime_tags preference order."""
+        photo = self.temp_dir / "photo.jpg"
+        create_jpeg(photo, date_time='2021:01:01 00:00:00', date_time_original='2019:03:04 05:06:07')
+
+        self.assertEqual(self.extractor._fast_date_only(photo), datetime(2021, 1, 1, 0, 0, 0))
+
+    def test_fast_date_only_malformed(self):
+        """Test that a truncated EXIF segment yields None instead of raising."""
+        photo = self.temp_dir / "broken.jpg"
+        photo.write_bytes(b'\xff\xd8\xff\xe1\x00\x10Exif\x00\x00II*\x00\xff\xff')
+
+        self.assertIsNone(self.extractor._fast_date_only(photo))
+
+    def test_empty_jpeg(self):
+        """Test that an empty JPEG file yields no segment instead of failing to map."""
+        photo = self.temp_dir / "empty.jpg"
+        photo.touch()
+
+        self.assertIsNone(self.extractor._read_jpeg_exif_segment(photo))
+
+    def test_scan_without_exif(self):
+        """Test that a JPEG without APP1 yields no segment."""
+        photo = self.temp_dir / "plain.jpg"
+        Image.new('RGB', (16, 16)).save(photo)
+
+        self.assertIsNone(self.extractor._read_jpeg_exif_segment(photo))
+
+    def test_scan_non_jpeg_data(self):
+        """Test that non-JPEG data is rejected immediately."""
+        segment, complete = self.extractor._scan_exif_segment(b'\x89PNG\r\n\x1a\n')
+        self.assertIsNone(segment)
+        self.assertTrue(complete)
+
+
+class TestParseExifDatetime(unittest.TestCase):
+    """Test cases for EXIF date string parsing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.extractor = ExifExtractor()
+
+    def test_fixed_width_formats(self):
+        """Test the common colon and dash separated forms."""
+        expected = datetime(2024, 1, 15, 14, 30, 25)
+        self.assertEqual(self.extractor._parse_exif_datetime('2024:01:15 14:30:25'), expected)
+        self.assertEqual(self.extractor._parse_exif_datetime('2024-01-15 14:30:25'), expected)
+        self.assertEqual(self.extractor._parse_exif_datetime(' 2024:01:15 14:30:25 '), expected)
+
+    def test_other_formats(self):
+        """Test that shorter forms still parse."""
+        self.assertEqual(self.extractor._parse_exif_datetime('2024:01:15'), datetime(2024, 1, 15))
+        self.assertEqual(self.extractor._parse_exif_datetime('2024-01-15 14:30'), datetime(2024, 1, 15, 14, 30))
+        self.assertEqual(self.extractor._parse_exif_datetime('2024:1:5 14:30:25'), datetime(2024, 1, 5, 14, 30, 25))
+
+    def test_invalid_dates(self):
+        """Test that placeholder and malformed dates are rejected."""
+        self.assertIsNone(self.extractor._parse_exif_datetime('0000:00:00 00:00:00'))
+        self.assertIsNone(self.extractor._parse_exif_datetime('2024:13:15 14:30:25'))
+        self.assertIsNone(self.extractor._parse_exif_datetime('    :  :     :  :  '))
+        self.assertIsNone(self.extractor._parse_exif_datetime(''))
+
+    def test_uses_c_parser_when_available(self):
+        """Test that the fixed-width form goes through ciso8601 when it is installed."""
+        fake = MagicMock()
+        fake.parse_datetime_as_naive.side_effect = datetime.fromisoformat
+        with patch.object(exif_extractor, '_ciso8601', return_value=fake):
+            parsed = self.extractor._parse_exif_datetime('2024:01:15 14:30:25')
+            invalid = self.extractor._parse_exif_datetime('2024:13:15 14:30:25')
+
+        self.assertEqual(parsed, datetime(2024, 1, 15, 14, 30, 25))
+        self.assertIsNone(invalid)
+        fake.parse_datetime_as_naive.assert_any_call('2024-01-15 14:30:25')
+
+
+class TestExtractDates(unittest.TestCase):
+    """Test cases for batch date extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.extractor = ExifExtractor()
+        self.photos = []
+        for day in range(1, 6):
+            photo = self.temp_dir / f"photo_{day}.jpg"
+            create_jpeg(photo, date_time=f'2020:01:{day:02d} 12:00:00')
+            self.photos.append(str(photo))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes return dates in input order."""
+        serial = self.extractor.extract_dates(self.photos)
+        parallel = self.extractor.extract_dates(self.photos, max_workers=2, chunksize=2)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([d.day for d in parallel], [1, 2, 3, 4, 5])
+
+    def test_extract_dates_batch_threads(self):
+        """Test that threaded batch extraction maps every path to its date."""
+        dates = self.extractor.extract_dates_batch(iter(self.photos), max_workers=3)
+
+        self.assertEqual(list(dates), self.photos)
+        self.assertEqual([d.day for d in dates.values()], [1, 2, 3, 4, 5])
+
+    def test_iter_dates_mixes_cache_hits_and_misses(self):
+        """Test that streamed dates stay in input order when only some are cached."""
+        cached = CachedExifExtractor(self.temp_dir / "exif.db")
+        cached.extract_dates(self.photos[1::2])
+        dates = list(cached.iter_dates(self.photos))
+        cached.close()
+
+        self.assertEqual([d.day for d in dates], [1, 2, 3, 4, 5])
+
+    def test_cached_extract_dates(self):
+        """Test that batch extraction through the cache stores every result."""
+        stats = StatisticsCollector()
+        cached = CachedExifExtractor(self.temp_dir / "exif.db", stats_collector=stats)
+        first = cached.extract_dates(self.photos)
+        second = cached.extract_dates(self.photos)
+        cached.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(stats.stats.cache_misses, 5)
+        self.assertEqual(stats.stats.cache_hits, 5)
+
+
+class TestExtractAll(unittest.TestCase):
+    """Test cases for single-pass metadata extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.extractor = ExifExtractor()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_extract_all_fields(self):
+        """Test that date, orientation, size and camera model come from one pass."""
+        photo = self.temp_dir / "photo.jpg"
+        exif = Image.Exif()
+        exif[exif_extractor.ORIENTATION_TAG] = 6
+        exif[exif_extractor.MODEL_TAG] = 'Test Camera'
+        exif.get_ifd(exif_extractor.EXIF_IFD_POINTER)[0x9003] = '2019:03:04 05:06:07'
+        Image.new('RGB', (32, 16)).save(photo, exif=exif)
+
+        metadata = self.extractor.extract_all(str(photo))
+
+        self.assertEqual(metadata.date_taken, datetime(2019, 3, 4, 5, 6, 7))
+        self.assertEqual(metadata.orientation, 6)
+        self.assertEqual((metadata.width, metadata.height), (32, 16))
+        self.assertEqual(metadata.camera_model, 'Test Camera')
+        self.assertIsNone(metadata.gps)
+
+    def test_extract_all_non_image(self):
+        """Test that non-image files yield empty metadata."""
+        text_file = self.temp_dir / "notes.txt"
+        text_file.write_text("not an image")
+
+        metadata = self.extractor.extract_all(str(text_file))
+        self.assertIsNone(metadata.date_taken)
+        self.assertIsNone(metadata.width)
+
+
+class TestCostAwareCache(unittest.TestCase):
+    """Test cases for the cost-aware date cache."""
+
+    def make_cache(self, costs, maxsize):
+        """Create a cache whose computation of key k appears to take costs[k] ns."""
+        clock = iter([])
+
+        def compute(key):
+            return key * 10
+
+        cache = exif_extractor._CostAwareCache(compute, maxsize)
+
+        def call(key):
+            nonlocal clock
+            clock = iter([0, costs[key]])
+            return cache(key)
+
+        patcher = patch.object(exif_extractor.time, 'perf_counter_ns', side_effect=lambda: next(clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return cache, call
+
+    def test_expensive_entry_outlives_cheap_ones(self):
+        """Test that cheap entries are evicted before an expensive one."""
+        cache, call = self.make_cache({'raw': 1000, 'a': 1, 'b': 1, 'c': 1}, maxsize=2)
+
+        call('raw')
+        call('a')
+        call('b')
+        call('c')
+
+        self.assertEqual(call('raw'), 'raw' * 10)
+        self.assertEqual(cache.cache_info().hits, 1)
+        self.assertEqual(cache.cache_info().currsize, 2)
+
+    def test_unused_expensive_entry_ages_out(self):
+        """Test that an expensive entry is eventually evicted once it stops being used."""
+        costs = {'raw': 5, **{i: 2 for i in range(10)}}
+        cache, call = self.make_cache(costs, maxsize=2)
+
+        call('raw')
+        for i in range(10):
+            call(i)
+        call('raw')
+
+        self.assertEqual(cache.cache_info().hits, 0)
+        self.assertEqual(cache.cache_info().misses, 12)
+
+    def test_cache_clear(self):
+        """Test that clearing drops entries and statistics."""
+        cache, call = self.make_cache({'a': 1}, maxsize=2)
+        call('a')
+        call('a')
+
+        cache.cache_clear()
+
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+
+
+class TestLazyDependencies(unittest.TestCase):
+    """Test cases for the deferred import of optional dependencies."""
+
+    def test_import_does_not_load_optional_dependencies(self):
+        """Test that importing the module imports neither Pillow, exifread nor ciso8601."""
+        code = ("import sys, exif_extractor; "
+                "print('PIL' in sys.modules, 'exifread' in sys.modules, 'ciso8601' in sys.modules)")
+        src_dir = str(Path(__file__).parent.parent / "src")
+        result = subprocess.run([sys.executable, '-c', code], cwd=src_dir,
+                                capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.split(), ['False', 'False', 'False'])
+
+    def test_availability_flags(self):
+        """Test that the availability flags resolve on access."""
+        self.assertTrue(exif_extractor.PILLOW_AVAILABLE)
+        self.assertIsInstance(exif_extractor.EXIFREAD_AVAILABLE, bool)
+
+
+class TestCachedExifExtractor(unittest.TestCase):
+    """Test cases for the persistent EXIF cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_file = self.temp_dir / "cache" / "exif.db"
+        self.photo = self.temp_dir / "photo.jpg"
+        create_jpeg(self.photo, date_time_original='2019:03:04 05:06:07')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_second_run_hits_cache(self):
+        """Test that a new extractor instance reuses dates stored on disk."""
+        cached = CachedExifExtractor(self.cache_file)
+        self.assertEqual(cached.extract_date_from_file(str(self.photo)), datetime(2019, 3, 4, 5, 6, 7))
+        cached.close()
+
+        stats = StatisticsCollector()
+        cached = CachedExifExtractor(self.cache_file, stats_collector=stats)
+        self.assertEqual(cached.extract_date_from_file(str(self.photo)), datetime(2019, 3, 4, 5, 6, 7))
+        cached.close()
+
+        self.assertEqual(stats.stats.cache_hits, 1)
+        self.assertEqual(stats.stats.cache_misses, 0)
+
+    def test_read_only_cache_serves_entries_without_writing(self):
+        """Test that a read-only cache reuses stored dates but records nothing new."""
+        other = self.temp_dir / "other.jpg"
+        create_jpeg(other, date_time_original='2020:01:02 03:04:05')
+        cached = CachedExifExtractor(self.cache_file)
+        cached.extract_date_from_file(str(self.photo))
+        cached.close()
+
+        stats = StatisticsCollector()
+        cached = CachedExifExtractor(self.cache_file, stats_collector=stats, read_only=True)
+        self.assertEqual(cached.extract_date_from_file(str(self.photo)), datetime(2019, 3, 4, 5, 6, 7))
+        self.assertEqual(cached.extract_date_from_file(str(other)), datetime(2020, 1, 2, 3, 4, 5))
+        self.assertEqual(cached.extract_date_from_file(str(other)), datetime(2020, 1, 2, 3, 4, 5))
+        cached.close()
+
+        self.assertEqual((stats.stats.cache_hits, stats.stats.cache_misses), (1, 2))
+
+    def test_read_only_cache_does_not_create_database(self):
+        """Test that a read-only cache without a database file leaves the disk untouched."""
+        cached = CachedExifExtractor(self.cache_file, read_only=True)
+        self.assertEqual(cached.extract_date_from_file(str(self.photo)), datetime(2019, 3, 4, 5, 6, 7))
+        cached.close()
+
+        self.assertFalse(self.cache_file.parent.exists())
+
+    def test_relative_cache_path_uses_user_cache_directory(self):
+        """Test that relative cache paths resolve under the user cache directory."""
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': str(self.temp_dir)}):
+            self.assertEqual(resolve_cache_path("exif_cache.db"),
+                             self.temp_dir / "photos_sorter" / "exif_cache.db")
+        self.assertEqual(resolve_cache_path(self.cache_file), self.cache_file)
+
+    def test_modified_file_is_reparsed(self):
+        """Test that a changed file invalidates its cache entry."""
+        stats = StatisticsCollector()
+        cached = CachedExifExtractor(self.cache_file, stats_collector=stats)
+        cached.extract_date_from_file(str(self.photo))
+
+        create_jpeg(self.photo, date_time_original='2021:05:06 07:08:09', padding=16)
+        self.assertEqual(cached.extract_date_from_file(str(self.photo)), datetime(2021, 5, 6, 7, 8, 9))
+        cached.close()
+
+        self.assertEqual(stats.stats.cache_misses, 2)
+
+    def test_delegates_to_wrapped_extractor(self):
+        """Test that other extractor methods remain available."""
+        cached = CachedExifExtractor(self.cache_file)
+        summary = cached.get_exif_summary(str(self.photo))
+        cached.close()
+
+        self.assertTrue(summary['is_image'])
+
+
+if __name__ == '__main__':
+    unittest.main()
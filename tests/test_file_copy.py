@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test Suite for File Copy
+
+This module contains tests for the kernel-assisted file copy.
+"""
+
+import errno
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import file_copy
+from utils.file_copy import copy_file_fast
+
+
+class TestCopyFileFast(unittest.TestCase):
+    """Test cases for the kernel-assisted copy helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = self.temp_dir / "source.bin"
+        self.target = self.temp_dir / "target.bin"
+        self.data = os.urandom(300 * 1024 + 17)
+        self.source.write_bytes(self.data)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_copies_contents(self):
+        """Test that the fast path produces an identical file."""
+        copied = copy_file_fast(self.source, self.target)
+
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(self.target.read_bytes(), self.data)
+
+    def test_known_size_skips_fstat(self):
+        """Test that a size passed in by the caller is used instead of an fstat."""
+        with patch.object(file_copy.os, 'fstat', wraps=os.fstat) as mock_fstat:
+            copied = copy_file_fast(self.source, self.target, len(self.data))
+
+        mock_fstat.assert_not_called()
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(self.target.read_bytes(), self.data)
+
+    def test_falls_back_to_userspace_copy(self):
+        """Test that the copy completes when kernel copies are unsupported."""
+        unsupported = OSError(errno.ENOSYS, "not supported")
+        with patch.object(os, 'copy_file_range', side_effect=unsupported, create=True), \
+                patch.object(os, 'sendfile', side_effect=unsupported, create=True):
+            copied = copy_file_fast(self.source, self.target)
+
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(self.target.read_bytes(), self.data)
+        self.assertTrue(file_copy._buffer_pool)
+
+    def test_reflink_clones_without_copying(self):
+        """Test that a successful clone skips the kernel and userspace copies."""
+        with patch.object(file_copy, 'FICLONE', 0x40049409), \
+                patch.object(file_copy, 'fcntl', create=True) as mock_fcntl, \
+                patch.object(file_copy, '_copy_with_pooled_buffer') as mock_copy:
+            copied = copy_file_fast(self.source, self.target)
+
+        mock_fcntl.ioctl.assert_called_once()
+        mock_copy.assert_not_called()
+        self.assertEqual(copied, len(self.data))
+
+    def test_reflink_unsupported_falls_back(self):
+        """Test that the copy proceeds when the file system cannot clone."""
+        with patch.object(file_copy, 'FICLONE', 0x40049409), \
+                patch.object(file_copy, 'fcntl', create=True) as mock_fcntl:
+            mock_fcntl.ioctl.side_effect = OSError(errno.EOPNOTSUPP, "not supported")
+            copied = copy_file_fast(self.source, self.target)
+
+        self.assertEqual(copied, len(self.data))
+        self.assertEqual(self.target.read_bytes(), self.data)
+
+    def test_empty_file(self):
+        """Test that empty files are copied."""
+        self.source.write_bytes(b"")
+
+        self.assertEqual(copy_file_fast(self.source, self.target), 0)
+        self.assertEqual(self.target.read_bytes(), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
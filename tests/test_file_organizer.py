@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Test Suite for File Organizer
+
+This module contains tests for organizing photos into date directories.
+"""
+
+import errno
+import os
+import unittest
+import tempfile
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image
+
+import file_organizer
+from file_organizer import FileOrganizer
+
+
+def create_jpeg(path: Path, date_time: str):
+    """Create a small JPEG file with the given EXIF DateTime tag."""
+    exif = Image.Exif()
+    exif[0x0132] = date_time
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new('RGB', (16, 16)).save(path, exif=exif)
+
+
+class TestFileOrganizer(unittest.TestCase):
+    """Test cases for FileOrganizer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "source"
+        self.target_dir = self.temp_dir / "target"
+        self.source_dir.mkdir()
+        self.config = {
+            'date_format': 'YYYY/MM',
+            'supported_extensions': ['.jpg'],
+            'processing': {'move_files': False, 'duplicate_handling': 'rename'},
+            'performance': {'jobs': 1},
+            'safety': {'dry_run': False},
+            'video': {'enabled': False},
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_organize_copies_into_date_directories(self):
+        """Test that photos are copied into YYYY/MM directories."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        create_jpeg(self.source_dir / "b.jpg", "2022:11:05 10:00:00")
+
+        stats = FileOrganizer(self.config).organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertEqual(stats['copied'], 2)
+        self.assertTrue((self.target_dir / "2021" / "03" / "a.jpg").exists())
+        self.assertTrue((self.target_dir / "2022" / "11" / "b.jpg").exists())
+
+    def test_target_directory_created_once(self):
+        """Test that each target directory is only created once per run."""
+        for index in range(5):
+            create_jpeg(self.source_dir / f"img_{index}.jpg", "2021:03:04 10:00:00")
+
+        organizer = FileOrganizer(self.config)
+        created = []
+        original_mkdir = Path.mkdir
+
+        def tracking_mkdir(path, *args, **kwargs):
+            # Path.mkdir retries itself with parents=False; only count outer calls
+            if kwargs.get('parents'):
+                created.append(path)
+            return original_mkdir(path, *args, **kwargs)
+
+        with patch.object(Path, 'mkdir', tracking_mkdir):
+            organizer.organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertEqual(created.count(self.target_dir / "2021" / "03"), 1)
+        self.assertEqual(len(list((self.target_dir / "2021" / "03").iterdir())), 5)
+
+    def test_move_renames_within_file_system(self):
+        """Test that move mode relocates files into date directories."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        self.config['processing']['move_files'] = True
+
+        stats = FileOrganizer(self.config).organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertEqual(stats['moved'], 1)
+        self.assertFalse((self.source_dir / "a.jpg").exists())
+        self.assertTrue((self.target_dir / "2021" / "03" / "a.jpg").exists())
+
+    def test_move_falls_back_across_devices(self):
+        """Test that a cross-device rename falls back to copy and delete."""
+        source = self.source_dir / "a.jpg"
+        target = self.target_dir / "a.jpg"
+        create_jpeg(source, "2021:03:04 10:00:00")
+        self.target_dir.mkdir()
+
+        with patch('file_organizer.os.replace', side_effect=OSError(errno.EXDEV, "cross-device link")):
+            FileOrganizer(self.config)._move_file(source, target)
+
+        self.assertFalse(source.exists())
+        self.assertTrue(target.exists())
+
+    def test_move_across_known_devices_skips_rename(self):
+        """Test that moves between different file systems go straight to copy and delete."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        self.config['processing']['move_files'] = True
+        organizer = FileOrganizer(self.config)
+        real_stat = os.stat
+
+        def other_device(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if Path(path) == self.target_dir:
+                return os.stat_result((result.st_mode, result.st_ino, result.st_dev + 1) + tuple(result)[3:])
+            return result
+
+        with patch('file_organizer.os.stat', side_effect=other_device), \
+                patch('file_organizer.os.replace') as mock_replace, \
+                patch('file_organizer.os.link') as mock_link:
+            stats = organizer.organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertFalse(organizer._same_fs)
+        mock_replace.assert_not_called()
+        mock_link.assert_not_called()
+        self.assertEqual(stats['moved'], 1)
+        self.assertFalse((self.source_dir / "a.jpg").exists())
+        self.assertTrue((self.target_dir / "2021" / "03" / "a.jpg").exists())
+
+    def test_duplicate_names_are_renamed(self):
+        """Test that an existing target file is detected and the new file renamed."""
+        for move_files in (False, True):
+            with self.subTest(move_files=move_files):
+                create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+                existing = self.target_dir / "2021" / "03" / "a.jpg"
+                existing.parent.mkdir(parents=True, exist_ok=True)
+                existing.write_bytes(b"existing")
+                self.config['processing']['move_files'] = move_files
+
+                FileOrganizer(self.config).organize_photos(str(self.source_dir), str(self.target_dir))
+
+                self.assertEqual(existing.read_bytes(), b"existing")
+                self.assertTrue((existing.parent / "a_001.jpg").exists())
+                shutil.rmtree(self.target_dir)
+
+    def test_duplicate_rename_lists_directory_once(self):
+        """Test that the first free suffix is found without probing each taken name."""
+        self.target_dir.mkdir()
+        for name in ("a.jpg", "a_001.jpg", "a_002.jpg", "a_004.jpg"):
+            (self.target_dir / name).touch()
+        organizer = FileOrganizer(self.config)
+
+        with patch.object(Path, 'exists', autospec=True, side_effect=Path.exists) as mock_exists:
+            new_target = organizer._handle_duplicate(self.source_dir / "a.jpg", self.target_dir / "a.jpg")
+
+        self.assertEqual(new_target, self.target_dir / "a_003.jpg")
+        self.assertEqual(mock_exists.call_count, 1)
+
+    def test_async_io_organizes_all_files(self):
+        """Test that overlapped moves keep every file, giving same-named ones distinct names."""
+        for index in range(6):
+            create_jpeg(self.source_dir / f"card_{index}" / "a.jpg", "2021:03:04 10:00:00")
+        self.config['performance'].update(async_io=True, worker_threads=3)
+
+        stats = FileOrganizer(self.config).organize_photos(str(self.source_dir), str(self.target_dir))
+
+        names = sorted(path.name for path in (self.target_dir / "2021" / "03").iterdir())
+        self.assertEqual(stats['copied'], 6)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(names, ["a.jpg"] + [f"a_{n:03d}.jpg" for n in range(1, 6)])
+
+    def test_batched_files_keep_claimed_names(self):
+        """Test that same-named files queued in one batch each keep the name they claimed."""
+        for move_files in (False, True):
+            with self.subTest(move_files=move_files):
+                for index in range(5):
+                    create_jpeg(self.source_dir / f"card_{index}" / "a.jpg", "2021:03:04 10:00:00")
+                self.config['processing']['move_files'] = move_files
+                self.config['performance']['batch_size'] = 3
+                organizer = FileOrganizer(self.config)
+
+                with patch.object(organizer, '_flush_batch', wraps=organizer._flush_batch) as flush:
+                    stats = organizer.organize_photos(str(self.source_dir), str(self.target_dir))
+
+                names = sorted(path.name for path in (self.target_dir / "2021" / "03").iterdir())
+                self.assertGreaterEqual(flush.call_count, 2)
+                self.assertEqual(stats['moved' if move_files else 'copied'], 5)
+                self.assertEqual(names, ["a.jpg"] + [f"a_{n:03d}.jpg" for n in range(1, 5)])
+                shutil.rmtree(self.target_dir)
+                shutil.rmtree(self.source_dir)
+                self.source_dir.mkdir()
+
+    def test_file_already_in_place_is_skipped(self):
+        """Test that a file whose target is itself is skipped without resolving paths."""
+        photo = self.source_dir / "a.jpg"
+        photo.write_bytes(b"photo")
+        for move_files in (False, True):
+            with self.subTest(move_files=move_files):
+                self.config['processing']['move_files'] = move_files
+                organizer = FileOrganizer(self.config)
+
+                with patch.object(Path, 'resolve', side_effect=AssertionError("resolve called")):
+                    organizer._move_or_copy_file(photo, self.source_dir)
+
+                self.assertEqual(organizer.get_statistics()['skipped'], 1)
+                self.assertEqual(sorted(p.name for p in self.source_dir.iterdir()), ["a.jpg"])
+
+    def test_duplicate_listing_reused_within_run(self):
+        """Test that later duplicates in a directory reuse its listing and get fresh names."""
+        self.target_dir.mkdir()
+        (self.target_dir / "a.jpg").touch()
+        organizer = FileOrganizer(self.config)
+
+        with patch.object(file_organizer.os, 'listdir', wraps=os.listdir) as mock_listdir:
+            first = organizer._handle_duplicate(self.source_dir / "a.jpg", self.target_dir / "a.jpg")
+            second = organizer._handle_duplicate(self.source_dir / "a.jpg", self.target_dir / "a.jpg")
+
+        self.assertEqual((first.name, second.name), ("a_001.jpg", "a_002.jpg"))
+        mock_listdir.assert_called_once()
+
+    def test_stale_duplicate_listing_is_not_trusted(self):
+        """Test that a name created after the listing was taken is not reused."""
+        self.target_dir.mkdir()
+        (self.target_dir / "a.jpg").touch()
+        organizer = FileOrganizer(self.config)
+        organizer._dir_names[self.target_dir] = {"a.jpg"}
+        (self.target_dir / "a_001.jpg").touch()
+
+        new_target = organizer._handle_duplicate(self.source_dir / "a.jpg", self.target_dir / "a.jpg")
+
+        self.assertEqual(new_target.name, "a_002.jpg")
+
+    def test_duplicate_skip_leaves_target_untouched(self):
+        """Test that the skip policy neither overwrites nor removes anything."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        existing = self.target_dir / "2021" / "03" / "a.jpg"
+        existing.parent.mkdir(parents=True)
+        existing.write_bytes(b"existing")
+        self.config['processing'].update(move_files=True, duplicate_handling='skip')
+
+        stats = FileOrganizer(self.config).organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertEqual(stats['skipped'], 1)
+        self.assertEqual(existing.read_bytes(), b"existing")
+        self.assertTrue((self.source_dir / "a.jpg").exists())
+
+    def test_date_directory_memoized(self):
+        """Test that date directory paths are formatted once per date."""
+        organizer = FileOrganizer(dict(self.config, date_format='YYYY-MM-DD'))
+
+        first = organizer._create_date_directory(self.target_dir, 2021, 3, 4)
+        second = organizer._create_date_directory(self.target_dir, 2021, 3, 4)
+
+        self.assertEqual(first, self.target_dir / "2021-03-04")
+        self.assertIs(first, second)
+
+    def test_date_directory_formats(self):
+        """Test each supported date format and the fallback for unknown ones."""
+        expected = {
+            'YYYY/MM/DD': Path("2021") / "03" / "04",
+            'YYYY/MM': Path("2021") / "03",
+            'YYYY-MM-DD': Path("2021-03-04"),
+            'YYYY-MM': Path("2021-03"),
+            'DD.MM.YYYY': Path("2021") / "03",
+        }
+        for date_format, relative in expected.items():
+            with self.subTest(date_format=date_format):
+                organizer = FileOrganizer(dict(self.config, date_format=date_format))
+                self.assertEqual(organizer._create_date_directory(self.target_dir, 2021, 3, 4),
+                                 self.target_dir / relative)
+
+    def test_find_image_files_skips_organized_parents(self):
+        """Test that discovery matches extensions case-insensitively and skips files directly in organized directories."""
+        for name in ("a.jpg", "trip/b.JPG", "2020/03/c.jpg", "2020/03/trip/d.jpg",
+                     "2019/Birthday/x.jpg", "notes.txt"):
+            (self.source_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.source_dir / name).touch()
+
+        found = FileOrganizer(self.config)._find_image_files(self.source_dir)
+
+        self.assertEqual([path.relative_to(self.source_dir).as_posix() for path in found],
+                         ["2019/Birthday/x.jpg", "2020/03/trip/d.jpg", "a.jpg", "trip/b.JPG"])
+
+    def test_media_discovered_in_one_walk(self):
+        """Test that images, videos and thumbnails are all collected by a single walk."""
+        for name in ("a.jpg", "clip.MPG", "clip.THM", "2020/old.mov", "2019/Birthday/party.mov"):
+            (self.source_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.source_dir / name).touch()
+        self.config['video'] = {'enabled': True, 'thumbnail_extensions': ['.thm']}
+        organizer = FileOrganizer(self.config)
+
+        with patch.object(file_organizer, 'walk_files', wraps=file_organizer.walk_files) as mock_walk:
+            image_files, video_groups = organizer._discover_media_files(self.source_dir)
+
+        mock_walk.assert_called_once()
+        self.assertEqual(image_files, [self.source_dir / "a.jpg"])
+        self.assertEqual(sorted(video_groups), [
+            (self.source_dir / "2019" / "Birthday" / "party.mov", [], "standard"),
+            (self.source_dir / "clip.MPG", [self.source_dir / "clip.THM"], "mpg_merge"),
+        ])
+
+    def test_ensure_directory_records_parents(self):
+        """Test that creating a directory also marks its parents as created."""
+        organizer = FileOrganizer(self.config)
+        organizer._ensure_directory(self.target_dir / "2021" / "03")
+
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            organizer._ensure_directory(self.target_dir / "2021")
+            organizer._ensure_directory(self.target_dir)
+
+        mock_mkdir.assert_not_called()
+        self.assertTrue((self.target_dir / "2021" / "03").is_dir())
+
+    def test_settings_reloaded_for_each_run(self):
+        """Test that config changes made after construction apply to the next run."""
+        create_jpeg(self.source_dir / "a.jpg", "2021:03:04 10:00:00")
+        organizer = FileOrganizer(self.config)
+        self.assertFalse(organizer.dry_run)
+
+        self.config['safety']['dry_run'] = True
+        stats = organizer.organize_photos(str(self.source_dir), str(self.target_dir))
+
+        self.assertTrue(organizer.dry_run)
+        self.assertEqual(stats['copied'], 1)
+        self.assertFalse((self.target_dir / "2021" / "03" / "a.jpg").exists())
+
+    def test_video_dates_extracted_concurrently_in_order(self):
+        """Test that video group dates are grouped correctly when extracted by several threads."""
+        self.config['performance'].update(jobs=4)
+        organizer = FileOrganizer(self.config)
+        groups = [(self.source_dir / f"clip{day}.mp4", [], "standard") for day in range(1, 6)]
+        dates = {group[0]: datetime(2021, 3, day) for day, group in enumerate(groups, 1)}
+        dates[groups[2][0]] = None
+
+        with patch.object(organizer.video_processor, 'extract_date_from_video_group',
+                          side_effect=lambda video, thumbnails: dates[video]), \
+                patch.object(organizer, '_get_fallback_date', return_value=None):
+            grouped = organizer._group_video_files_by_date(groups)
+
+        self.assertEqual(grouped[(2021, 3, 1)], [groups[0]])
+        self.assertEqual(grouped[(2021, 3, 5)], [groups[4]])
+        self.assertEqual(grouped[('no_date',)], [groups[2]])
+        self.assertEqual(organizer.stats_collector.get_dict()['processed'], 5)
+
+    def test_video_groups_grouped_by_date(self):
+        """Test that video groups are grouped by date in order, including dates that recur later."""
+        organizer = FileOrganizer(self.config)
+        groups = [(self.source_dir / f"{index}.mov", [], "standard") for index in range(4)]
+        dates = [datetime(2021, 3, 4), datetime(2021, 3, 4), datetime(2022, 1, 1), datetime(2021, 3, 4, 18)]
+
+        with patch.object(organizer.video_processor, 'iter_video_group_dates', return_value=iter(dates)):
+            grouped = organizer._group_video_files_by_date(groups)
+
+        self.assertEqual(grouped, {
+            (2021, 3, 4): [groups[0], groups[1], groups[3]],
+            (2022, 1, 1): [groups[2]],
+        })
+
+    def test_fallback_date_uses_listing_mtime(self):
+        """Test that a modification time from the directory listing spares the fallback a stat."""
+        photo = self.source_dir / "a.jpg"
+        photo.touch()
+        organizer = FileOrganizer(self.config)
+
+        with patch.object(file_organizer, '_LISTING_HAS_STAT', True):
+            found = organizer._find_image_files(self.source_dir)
+        with patch.object(Path, 'stat', side_effect=AssertionError("unexpected stat")):
+            fallback = organizer._get_fallback_date(found[0])
+
+        self.assertEqual(fallback, datetime.fromtimestamp(os.stat(photo).st_mtime))
+
+    def test_is_organized_directory(self):
+        """Test that only date-shaped directory names count as organized."""
+        organizer = FileOrganizer(self.config)
+
+        for name in ("2024", "2024-01", "2024-01-15", "01"):
+            self.assertTrue(organizer._is_organized_directory(self.target_dir / name), name)
+        for name in ("trip", "1", "20241", "2024-1", "2024-01-15-a"):
+            self.assertFalse(organizer._is_organized_directory(self.target_dir / name), name)
+
+    def test_flush_batch_copies_pending_operations(self):
+        """Test that batched copies keep contents and timestamps and count failures."""
+        organizer = FileOrganizer(self.config)
+        for name in ("a.jpg", "b.jpg"):
+            create_jpeg(self.source_dir / name, "2021:03:04 10:00:00")
+            organizer._add_to_batch('copy', self.source_dir / name, self.target_dir / "2021" / "03" / name)
+        placeholder = self.target_dir / "2021" / "03" / "missing.jpg"
+        placeholder.parent.mkdir(parents=True)
+        placeholder.touch()
+        organizer._add_to_batch('copy', self.source_dir / "missing.jpg", placeholder, placeholder=True)
+
+        organizer._flush_batch()
+
+        stats = organizer.stats_collector.get_dict()
+        self.assertEqual((stats['copied'], stats['errors']), (2, 1))
+        self.assertEqual((organizer._pending_types, organizer._pending_sources,
+                          organizer._pending_targets, organizer._pending_placeholders),
+                         ([], [], [], []))
+        for name in ("a.jpg", "b.jpg"):
+            source, target = self.source_dir / name, self.target_dir / "2021" / "03" / name
+            self.assertEqual(target.read_bytes(), source.read_bytes())
+            self.assertEqual(target.stat().st_mtime_ns, source.stat().st_mtime_ns)
+        self.assertFalse(placeholder.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test Suite for File Scanner
+
+This module contains tests for the scandir-based directory walk.
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.file_scanner import walk_files
+
+
+class TestWalkFiles(unittest.TestCase):
+    """Test cases for walk_files."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_walks_nested_directories(self):
+        """Test that files in nested directories are found and directories are not yielded."""
+        (self.temp_dir / "a" / "b").mkdir(parents=True)
+        (self.temp_dir / "top.jpg").touch()
+        (self.temp_dir / "a" / "middle.JPG").touch()
+        (self.temp_dir / "a" / "b" / "deep.png").touch()
+
+        found = sorted(Path(entry.path).relative_to(self.temp_dir).as_posix()
+                       for entry in walk_files(self.temp_dir))
+
+        self.assertEqual(found, ["a/b/deep.png", "a/middle.JPG", "top.jpg"])
+
+    def test_skips_hidden_and_system_directories(self):
+        """Test that hidden and NAS/OS metadata directories are pruned."""
+        for name in (".thumbnails", "@eaDir", "$RECYCLE.BIN"):
+            (self.temp_dir / name).mkdir()
+            (self.temp_dir / name / "cached.jpg").touch()
+        (self.temp_dir / "photo.jpg").touch()
+
+        found = [entry.name for entry in walk_files(self.temp_dir)]
+
+        self.assertEqual(found, ["photo.jpg"])
+
+    def test_skip_dir_predicate(self):
+        """Test that directories rejected by skip_dir are not descended into."""
+        (self.temp_dir / "2020").mkdir()
+        (self.temp_dir / "2020" / "old.jpg").touch()
+        (self.temp_dir / "new.jpg").touch()
+
+        found = [entry.name for entry in walk_files(self.temp_dir, skip_dir=lambda d: d.name.isdigit())]
+
+        self.assertEqual(found, ["new.jpg"])
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks not supported")
+    def test_does_not_follow_directory_symlinks(self):
+        """Test that a symlink loop does not cause infinite recursion."""
+        (self.temp_dir / "photo.jpg").touch()
+        try:
+            os.symlink(self.temp_dir, self.temp_dir / "loop", target_is_directory=True)
+        except OSError:
+            self.skipTest("cannot create symlinks")
+
+        found = [entry.name for entry in walk_files(self.temp_dir)]
+
+        self.assertEqual(found, ["photo.jpg"])
+
+    def test_missing_directory(self):
+        """Test that a missing directory yields nothing."""
+        self.assertEqual(list(walk_files(self.temp_dir / "missing")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
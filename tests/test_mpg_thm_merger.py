@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test Suite for MPG/THM Merger
+
+This module contains tests for organizing MPG/THM pairs.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mpg_thm_merger import MpgThmMerger
+
+
+class TestMpgThmMerger(unittest.TestCase):
+    """Test cases for MpgThmMerger."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "source"
+        self.target_dir = self.temp_dir / "target"
+        self.source_dir.mkdir()
+        self.target_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_missing_move_files_keeps_baseline_defaults(self):
+        """Test that a config without processing.move_files copies separate pairs but deletes merged MPGs."""
+        merger = MpgThmMerger({'video': {'mpg_processing': {'enable_merging': False}}})
+
+        self.assertFalse(merger.move_files)
+        self.assertTrue(merger.delete_merged_mpg)
+
+    def test_separate_pair_copied_without_move_files(self):
+        """Test that the unmerged fallback leaves the originals in place when move_files is not set."""
+        mpg = self.source_dir / "clip.mpg"
+        thm = self.source_dir / "clip.thm"
+        mpg.write_bytes(b"video")
+        thm.write_bytes(b"thumb")
+        merger = MpgThmMerger({'video': {'mpg_processing': {'enable_merging': False}}})
+
+        success, target = merger.process_mpg_thm_pair(mpg, thm, self.target_dir)
+
+        self.assertTrue(success)
+        self.assertEqual(target, self.target_dir / "clip.mpg")
+        self.assertTrue(mpg.exists())
+        self.assertTrue(thm.exists())
+        self.assertEqual((self.target_dir / "clip.thm").read_bytes(), b"thumb")
+
+
+if __name__ == '__main__':
+    unittest.main()